@@ -0,0 +1,16 @@
+"""
+AlgoEase Python tooling.
+
+Shared building blocks for the CLI and ops scripts:
+- client:     endpoints, .env loading and algod/indexer clients
+- boxes:      bounty box names and the box codec
+- operations: transaction builders for contract calls
+- packer:     atomic-group packing and submission
+- signing:    bulk signing on a process pool
+"""
+
+from algoease.boxes import V2, V5, Bounty, box_name, decode_bounty, encode_bounty
+from algoease.client import get_algod_client, get_app_id, get_indexer_client, load_config
+from algoease.operations import Operation
+from algoease.packer import GroupLimits, GroupPacker, OperationResult
+from algoease.signing import BulkSigner
@@ -0,0 +1,281 @@
+"""
+Escrow analytics over an app's full call history.
+
+Reads the local history log (algoease.history) as a stream and keeps
+three compact integer tables instead of per-event objects:
+
+    lifecycle   bounty_id, time, method      one row per bounty per call
+    escrow      time, signed microAlgos      +create amount, -inner payment
+    creates     bounty_id, time, amount, creator
+
+The tables are then reduced with vectorized group-bys into:
+- bounties created, value escrowed, value paid out and locked value per day
+- create-to-approve time: median, p90 and a histogram
+- rejection and refund rates among finished bounties
+- the peak locked value and when it happened
+- the top creators by value escrowed
+
+The report is written as JSON and as a standalone HTML page with inline
+SVG charts. A year of history reduces in seconds; reading the log
+dominates.
+
+    python -m algoease.analytics [--app-id 749707697] [--history history-749707697.jsonl] \\
+        [--sync] [--out analytics-report]
+"""
+
+import argparse
+import html
+import json
+import sys
+from array import array
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Sequence, TextIO
+
+import numpy as np
+
+from algoease.client import get_app_id, get_indexer_client
+from algoease.history import CREATE, Event, HistoryLog
+from algoease.store import Interner
+
+DAY = 86400
+HOUR = 3600
+TOP_CREATORS = 10
+# Upper bounds (hours) of the create-to-approve histogram buckets; the last bucket is open
+APPROVE_BUCKETS = [1, 6, 24, 72, 168, 720]
+
+APPROVED = "approve_bounty"
+REJECTED = "reject_bounty"
+REFUNDED = ("refund", "auto_refund", "sweep_expired")
+METHODS = [CREATE, "accept_bounty", "submit_bounty", APPROVED, REJECTED, "claim", *REFUNDED]
+METHOD_CODES = {name: code for code, name in enumerate(METHODS)}
+
+
+class HistoryTables:
+    """Integer columns accumulated from an event stream"""
+
+    def __init__(self):
+        self.creators = Interner()
+        self.events = 0
+        self.first_round = 0
+        self.last_round = 0
+        self.lifecycle = {"bounty_id": array('q'), "time": array('q'), "method": array('b')}
+        self.escrow = {"time": array('q'), "delta": array('q')}
+        self.creates = {"bounty_id": array('q'), "time": array('q'), "amount": array('q'), "creator": array('q')}
+
+    def add(self, event: Event) -> None:
+        self.events += 1
+        self.first_round = self.first_round or event.round
+        self.last_round = event.round
+        method = METHOD_CODES.get(event.method, -1)
+        for bounty_id in event.bounties:
+            self.lifecycle["bounty_id"].append(bounty_id)
+            self.lifecycle["time"].append(event.time)
+            self.lifecycle["method"].append(method)
+        if event.method == CREATE and event.bounties:
+            self.creates["bounty_id"].append(event.bounties[0])
+            self.creates["time"].append(event.time)
+            self.creates["amount"].append(event.amount)
+            self.creates["creator"].append(self.creators.intern(event.sender))
+            self.escrow["time"].append(event.time)
+            self.escrow["delta"].append(event.amount)
+        for _, _, amount in event.payouts():
+            self.escrow["time"].append(event.time)
+            self.escrow["delta"].append(-amount)
+
+    def extend(self, events: Iterable[Event]) -> "HistoryTables":
+        for event in events:
+            self.add(event)
+        return self
+
+    def columns(self, table: str) -> Dict[str, np.ndarray]:
+        return {name: np.frombuffer(column, np.int64 if column.typecode == 'q' else np.int8)
+                for name, column in getattr(self, table).items()}
+
+# ============================================================================
+# Reductions
+# ============================================================================
+
+def _date(timestamp: int) -> str:
+    return datetime.fromtimestamp(int(timestamp), timezone.utc).strftime("%Y-%m-%d")
+
+
+def _sum_by(index: np.ndarray, values: np.ndarray, size: int) -> np.ndarray:
+    sums = np.zeros(size, np.int64)
+    np.add.at(sums, index, values)
+    return sums
+
+
+def _outcome_ids(lifecycle: Dict[str, np.ndarray], *methods: str) -> np.ndarray:
+    codes = [METHOD_CODES[m] for m in methods]
+    return np.unique(lifecycle["bounty_id"][np.isin(lifecycle["method"], codes)])
+
+
+def _time_to_approve(lifecycle: Dict[str, np.ndarray], creates: Dict[str, np.ndarray]) -> dict:
+    approved = lifecycle["method"] == METHOD_CODES[APPROVED]
+    ids, times = lifecycle["bounty_id"][approved], lifecycle["time"][approved]
+    # First approval per bounty; created_at is a dense lookup by bounty ID (-1 when unknown)
+    ids, first = np.unique(ids, return_index=True)
+    times = times[first]
+    created_at = np.full(int(max(ids.max(initial=-1), creates["bounty_id"].max(initial=-1))) + 1, -1, np.int64)
+    created_at[creates["bounty_id"]] = creates["time"]
+    known = created_at[ids] >= 0
+    hours = (times[known] - created_at[ids][known]) / HOUR
+    counts = np.histogram(hours, bins=[0, *APPROVE_BUCKETS, np.inf])[0]
+    labels = [f"<= {b}h" for b in APPROVE_BUCKETS] + [f"> {APPROVE_BUCKETS[-1]}h"]
+    return {
+        "count": int(len(hours)),
+        "median_hours": round(float(np.median(hours)), 2) if len(hours) else None,
+        "p90_hours": round(float(np.percentile(hours, 90)), 2) if len(hours) else None,
+        "histogram": [{"bucket": label, "count": int(count)} for label, count in zip(labels, counts)],
+    }
+
+
+def build_report(tables: HistoryTables, app_id: int) -> dict:
+    """Reduce the history tables to the report dictionary"""
+    lifecycle, escrow, creates = tables.columns("lifecycle"), tables.columns("escrow"), tables.columns("creates")
+    report = {"app_id": app_id, "rounds": [tables.first_round, tables.last_round], "events": tables.events}
+
+    approved = _outcome_ids(lifecycle, APPROVED)
+    rejected = _outcome_ids(lifecycle, REJECTED)
+    refunded = np.setdiff1d(_outcome_ids(lifecycle, *REFUNDED), np.union1d(approved, rejected))
+    finished = len(approved) + len(rejected) + len(refunded)
+    report["bounties"] = {
+        "created": int(len(creates["bounty_id"])),
+        "value_created": int(creates["amount"].sum()),
+        "approved": int(len(approved)),
+        "rejected": int(len(rejected)),
+        "refunded": int(len(refunded)),
+        "unfinished": int(len(np.setdiff1d(creates["bounty_id"], np.concatenate([approved, rejected, refunded])))),
+    }
+    report["rejection_rate"] = round(len(rejected) / finished, 4) if finished else None
+    report["refund_rate"] = round(len(refunded) / finished, 4) if finished else None
+    report["time_to_approve"] = _time_to_approve(lifecycle, creates)
+
+    # Locked value after every escrow movement, in time order
+    order = np.argsort(escrow["time"], kind="stable")
+    times, locked = escrow["time"][order], np.cumsum(escrow["delta"][order])
+    if len(locked):
+        peak = int(np.argmax(locked))
+        report["peak_locked"] = {"microalgos": int(locked[peak]), "date": _date(times[peak])}
+    else:
+        report["peak_locked"] = {"microalgos": 0, "date": None}
+
+    report["daily"] = []
+    if len(times):
+        # Every create is also an escrow movement, so the sorted movement times span all days
+        first_day, last_day = int(times[0] // DAY), int(times[-1] // DAY)
+        size = last_day - first_day + 1
+        created = np.bincount(creates["time"] // DAY - first_day, minlength=size)
+        value = _sum_by(creates["time"] // DAY - first_day, creates["amount"], size)
+        paid_rows = escrow["delta"] < 0
+        paid = _sum_by(escrow["time"][paid_rows] // DAY - first_day, -escrow["delta"][paid_rows], size)
+        # Locked value at the end of each day
+        day_ends = (np.arange(first_day, last_day + 1) + 1) * DAY
+        last_movement = np.searchsorted(times, day_ends, side="left") - 1
+        end_locked = np.where(last_movement >= 0, locked[np.maximum(last_movement, 0)], 0)
+        report["daily"] = [
+            {"date": _date((first_day + i) * DAY), "created": int(created[i]), "value_created": int(value[i]),
+             "paid_out": int(paid[i]), "locked": int(end_locked[i])}
+            for i in range(size)
+        ]
+
+    creators, inverse = np.unique(creates["creator"], return_inverse=True)
+    totals = _sum_by(inverse, creates["amount"], len(creators))
+    counts = np.bincount(inverse, minlength=len(creators))
+    top = np.argsort(-totals, kind="stable")[:TOP_CREATORS]
+    report["top_creators"] = [{"address": tables.creators[int(creators[i])], "bounties": int(counts[i]),
+                               "value": int(totals[i])} for i in top]
+    return report
+
+# ============================================================================
+# Rendering
+# ============================================================================
+
+def _algo(microalgos: int) -> str:
+    return f"{microalgos / 1_000_000:,.2f}"
+
+
+def _svg_line(values: Sequence[float], width: int = 720, height: int = 160) -> str:
+    if not values:
+        return "<p>(no data)</p>"
+    top = max(max(values), 1)
+    step = width / max(len(values) - 1, 1)
+    points = " ".join(f"{i * step:.1f},{height - v / top * height:.1f}" for i, v in enumerate(values))
+    return (f'<svg viewBox="0 0 {width} {height}" width="{width}" height="{height}">'
+            f'<polyline fill="none" stroke="#2563eb" stroke-width="1.5" points="{points}"/></svg>')
+
+
+def _table(headers: Sequence[str], rows: Iterable[Sequence[object]]) -> str:
+    head = "".join(f"<th>{html.escape(h)}</th>" for h in headers)
+    body = "".join("<tr>" + "".join(f"<td>{html.escape(str(c))}</td>" for c in row) + "</tr>" for row in rows)
+    return f"<table><tr>{head}</tr>{body}</table>"
+
+
+def render_html(report: dict) -> str:
+    b, tta, daily = report["bounties"], report["time_to_approve"], report["daily"]
+
+    def rate(value: Optional[float]) -> str:
+        return "n/a" if value is None else f"{value:.1%}"
+
+    summary = _table(["Metric", "Value"], [
+        ("Rounds", f"{report['rounds'][0]} - {report['rounds'][1]}"),
+        ("App calls", report["events"]),
+        ("Bounties created", b["created"]),
+        ("Value escrowed (ALGO)", _algo(b["value_created"])),
+        ("Approved / rejected / refunded / unfinished",
+         f"{b['approved']} / {b['rejected']} / {b['refunded']} / {b['unfinished']}"),
+        ("Rejection rate", rate(report["rejection_rate"])),
+        ("Refund rate", rate(report["refund_rate"])),
+        ("Create to approve, median / p90 (h)", f"{tta['median_hours']} / {tta['p90_hours']}"),
+        ("Peak locked (ALGO)", f"{_algo(report['peak_locked']['microalgos'])} on {report['peak_locked']['date']}"),
+    ])
+    return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>AlgoEase escrow analytics - app {report['app_id']}</title>
+<style>body{{font-family:sans-serif;margin:2em}}table{{border-collapse:collapse;margin-bottom:1.5em}}
+td,th{{border:1px solid #ccc;padding:4px 8px;text-align:right}}th{{background:#f3f4f6}}</style></head>
+<body><h1>AlgoEase escrow analytics - app {report['app_id']}</h1>
+{summary}
+<h2>Bounties created per day</h2>{_svg_line([d['created'] for d in daily])}
+<h2>Locked value per day (end of day)</h2>{_svg_line([d['locked'] for d in daily])}
+<h2>Create to approve</h2>{_table(["Bucket", "Bounties"], [(h['bucket'], h['count']) for h in tta['histogram']])}
+<h2>Top creators</h2>{_table(["Creator", "Bounties", "ALGO"],
+                            [(c['address'], c['bounties'], _algo(c['value'])) for c in report['top_creators']])}
+<h2>Daily</h2>{_table(["Date", "Created", "Escrowed", "Paid out", "Locked"],
+                      [(d['date'], d['created'], _algo(d['value_created']), _algo(d['paid_out']), _algo(d['locked']))
+                       for d in daily])}
+</body></html>
+"""
+
+
+def write_report(report: dict, out_prefix: str) -> List[str]:
+    """Write <prefix>.json and <prefix>.html; returns the paths"""
+    paths = [f"{out_prefix}.json", f"{out_prefix}.html"]
+    with open(paths[0], 'w') as f:
+        json.dump(report, f, indent=2)
+    with open(paths[1], 'w', encoding='utf-8') as f:
+        f.write(render_html(report))
+    return paths
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main(argv: Optional[Sequence[str]] = None, out: TextIO = sys.stdout) -> int:
+    parser = argparse.ArgumentParser(description="Escrow analytics report from an app's call history")
+    parser.add_argument("--app-id", type=int, help="app to report on (default: configured app)")
+    parser.add_argument("--history", help="history log (default: history-<app_id>.jsonl)")
+    parser.add_argument("--sync", action="store_true", help="sync the history log from the indexer first")
+    parser.add_argument("--out", default="analytics-report", help="output prefix (default: analytics-report)")
+    args = parser.parse_args(argv)
+
+    log = HistoryLog(args.app_id or get_app_id(), args.history)
+    if args.sync:
+        log.sync(get_indexer_client())
+    report = build_report(HistoryTables().extend(log.events()), log.app_id)
+    for path in write_report(report, args.out):
+        print(f"Wrote {path}", file=out)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
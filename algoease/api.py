@@ -0,0 +1,432 @@
+"""
+Read API over a locally synced bounty mirror.
+
+The stream's Follower (algoease.stream) keeps the mirror current: it
+long-polls algod and re-reads only the boxes each round touched. Every read
+is then answered from memory, with no Supabase, indexer or algod hop:
+
+    GET /bounties?status=OPEN&creator=ADDR&freelancer=ADDR&after=ID&limit=50
+    GET /bounties?ids=3,7,12
+    GET /bounties/<id>
+    GET /health
+
+Lists use keyset pagination over bounty IDs. Pass the response's "next"
+as ?after= to get the following page. Each filter has its own sorted ID
+index, so a page costs one bisect plus the rows it returns, however large
+the mirror.
+
+Responses carry an ETag built from the round the data last changed: the
+bounty's own round for a single lookup, the mirror's last change for lists.
+A client that sends the ETag back in If-None-Match gets 304 Not Modified.
+
+Every GET accepts ?min_round=R for read-your-writes. Writers get R back as
+the confirmed round of their transaction. If the mirror has not synced
+round R yet, the request waits up to MIN_ROUND_WAIT seconds for the
+follower to catch up. It then answers, or returns 503 with the mirror's
+round.
+"Accept: application/msgpack" returns msgpack instead of JSON. Encoded
+bodies are cached until the next round, so repeated reads cost a dict
+lookup. The server is a bare asyncio.Protocol with keep-alive, so one
+core handles thousands of requests per second.
+
+    python -m algoease.api [--app-id 749707697] [--layout v2] [--host 127.0.0.1] [--port 8780]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+from typing import Awaitable, Deque, Dict, Iterable, List, Optional, Sequence, TextIO, Tuple, Union
+from urllib.parse import parse_qs, urlsplit
+
+import msgpack
+
+from algoease.boxes import LAYOUTS, V2, Bounty, BoxLayout
+from algoease.client import get_algod_client, get_app_id
+from algoease.stream import Follower
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 1_000
+MAX_IDS = 1_000
+CACHED_RESPONSES = 10_000
+MIN_ROUND_WAIT = 10.0      # seconds; about three rounds
+MSGPACK = "application/msgpack"
+
+
+def bounty_dict(bounty: Bounty, updated_round: int) -> dict:
+    return {"bounty_id": bounty.bounty_id, "creator": bounty.creator, "freelancer": bounty.freelancer,
+            "verifier": bounty.verifier, "amount": bounty.amount, "deadline": bounty.deadline,
+            "status": bounty.status_name, "task_desc": bounty.task_desc, "updated_round": updated_round}
+
+
+class Mirror:
+    """Every bounty in memory, with sorted ID indexes per creator, freelancer and status"""
+
+    def __init__(self, layout: BoxLayout = V2):
+        self.layout = layout
+        self.bounties: Dict[int, Bounty] = {}
+        self.updated: Dict[int, int] = {}
+        self.ids: List[int] = []
+        self.by_creator: Dict[str, List[int]] = {}
+        self.by_freelancer: Dict[str, List[int]] = {}
+        self.by_status: Dict[int, List[int]] = {}
+        self.round = 0         # round the mirror is current as of
+        self.modified = 0      # round of the last change to any bounty
+        self._waiters: List[Tuple[int, asyncio.Future]] = []
+
+    def __len__(self) -> int:
+        return len(self.bounties)
+
+    # ------------------------------------------------------------------ sync
+
+    def _index(self, bounty: Bounty, add: bool) -> None:
+        indexes = [(self.by_creator, bounty.creator), (self.by_status, bounty.status)]
+        if bounty.freelancer:
+            indexes.append((self.by_freelancer, bounty.freelancer))
+        for index, key in indexes:
+            ids = index.setdefault(key, [])
+            if add:
+                insort(ids, bounty.bounty_id)
+            else:
+                del ids[bisect_left(ids, bounty.bounty_id)]
+                if not ids:
+                    del index[key]
+
+    def load(self, bounties: Iterable[Bounty], round_number: int) -> None:
+        for bounty in bounties:
+            self.apply(round_number, bounty.bounty_id, bounty)
+        self.advance(round_number)
+
+    def advance(self, round_number: int) -> None:
+        """The mirror is current as of round_number; wakes reads waiting for it"""
+        self.round = max(self.round, round_number)
+        waiting = []
+        for min_round, future in self._waiters:
+            if min_round > self.round:
+                waiting.append((min_round, future))
+            elif not future.done():
+                future.set_result(None)
+        self._waiters = waiting
+
+    async def wait_for(self, min_round: int, timeout: float) -> bool:
+        """Wait until the mirror has synced min_round; False if it has not within timeout seconds"""
+        if self.round >= min_round:
+            return True
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append((min_round, future))
+        try:
+            await asyncio.wait_for(future, timeout)
+            return True
+        except asyncio.TimeoutError:
+            self._waiters = [w for w in self._waiters if w[1] is not future]
+            return False
+
+    def apply(self, round_number: int, bounty_id: int, bounty: Optional[Bounty]) -> None:
+        """Store the state of one bounty after round_number; None removes it"""
+        old = self.bounties.get(bounty_id)
+        if old is not None:
+            self._index(old, add=False)
+        if bounty is None:
+            if old is not None:
+                del self.ids[bisect_left(self.ids, bounty_id)]
+                del self.bounties[bounty_id], self.updated[bounty_id]
+        else:
+            if old is None:
+                insort(self.ids, bounty_id)
+            self._index(bounty, add=True)
+            self.bounties[bounty_id] = bounty
+            self.updated[bounty_id] = round_number
+        self.modified = max(self.modified, round_number)
+
+    # ------------------------------------------------------------------ queries
+
+    def get(self, bounty_id: int) -> Optional[dict]:
+        bounty = self.bounties.get(bounty_id)
+        return None if bounty is None else bounty_dict(bounty, self.updated[bounty_id])
+
+    def many(self, bounty_ids: Sequence[int]) -> Tuple[List[dict], List[int]]:
+        """(found bounties, missing IDs) in request order"""
+        found, missing = [], []
+        for bounty_id in bounty_ids:
+            bounty = self.get(bounty_id)
+            if bounty is None:
+                missing.append(bounty_id)
+            else:
+                found.append(bounty)
+        return found, missing
+
+    def page(self, after: int = -1, limit: int = DEFAULT_LIMIT, status: Optional[str] = None,
+             creator: Optional[str] = None, freelancer: Optional[str] = None) -> Tuple[List[dict], Optional[int]]:
+        """Bounties with IDs above `after` that match every filter; returns (page, next cursor or None)"""
+        candidates = [self.ids]
+        if status is not None:
+            candidates.append(self.by_status.get(self.layout.status_code(status), []))
+        if creator is not None:
+            candidates.append(self.by_creator.get(creator, []))
+        if freelancer is not None:
+            candidates.append(self.by_freelancer.get(freelancer, []))
+        ids = min(candidates, key=len)
+        code = None if status is None else self.layout.status_code(status)
+
+        page: List[dict] = []
+        for position in range(bisect_right(ids, after), len(ids)):
+            bounty = self.bounties[ids[position]]
+            if ((code is None or bounty.status == code) and (creator is None or bounty.creator == creator)
+                    and (freelancer is None or bounty.freelancer == freelancer)):
+                page.append(bounty_dict(bounty, self.updated[bounty.bounty_id]))
+                if len(page) == limit:
+                    more = position + 1 < len(ids)
+                    return page, bounty.bounty_id if more else None
+        return page, None
+
+# ============================================================================
+# HTTP
+# ============================================================================
+
+class BadRequest(Exception):
+    pass
+
+
+def _status_line(code: int) -> bytes:
+    reasons = {200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+               503: "Service Unavailable"}
+    return f"HTTP/1.1 {code} {reasons[code]}\r\n".encode()
+
+
+def _int(query: Dict[str, List[str]], key: str, default: int) -> int:
+    try:
+        return int(query[key][0]) if key in query else default
+    except ValueError:
+        raise BadRequest(f"{key} must be an integer")
+
+
+class ReadApi:
+    """Routes, ETags and the encoded-response cache over one Mirror"""
+
+    def __init__(self, mirror: Mirror, app_id: int, min_round_wait: float = MIN_ROUND_WAIT):
+        self.mirror = mirror
+        self.app_id = app_id
+        self.min_round_wait = min_round_wait
+        self.requests = 0
+        self._cache: Dict[Tuple[str, bool], Tuple[int, str, bytes]] = {}
+        self._cache_round = 0
+
+    def _route(self, target: str) -> Tuple[int, int, object]:
+        """(status code, last-modified round, body) for one GET"""
+        url = urlsplit(target)
+        query = parse_qs(url.query)
+        mirror = self.mirror
+        if url.path == "/health":
+            return 200, mirror.round, {"round": mirror.round, "modified": mirror.modified, "bounties": len(mirror)}
+        if url.path.startswith("/bounties/"):
+            try:
+                bounty_id = int(url.path[len("/bounties/"):])
+            except ValueError:
+                raise BadRequest("bounty ID must be an integer")
+            bounty = mirror.get(bounty_id)
+            if bounty is None:
+                return 404, mirror.modified, {"error": f"bounty {bounty_id} not found", "round": mirror.round}
+            return 200, bounty["updated_round"], {"round": mirror.round, "bounty": bounty}
+        if url.path == "/bounties":
+            if "ids" in query:
+                try:
+                    ids = [int(i) for raw in query["ids"] for i in raw.split(",") if i]
+                except ValueError:
+                    raise BadRequest("ids must be integers")
+                if len(ids) > MAX_IDS:
+                    raise BadRequest(f"at most {MAX_IDS} ids per request")
+                found, missing = mirror.many(ids)
+                return 200, mirror.modified, {"round": mirror.round, "bounties": found, "missing": missing}
+            limit = _int(query, "limit", DEFAULT_LIMIT)
+            if not 0 < limit <= MAX_LIMIT:
+                raise BadRequest(f"limit must be 1-{MAX_LIMIT}")
+            status = query.get("status", [None])[0]
+            if status is not None and status not in mirror.layout.statuses.values():
+                raise BadRequest(f"unknown status {status}")
+            page, next_id = mirror.page(_int(query, "after", -1), limit, status,
+                                        query.get("creator", [None])[0], query.get("freelancer", [None])[0])
+            return 200, mirror.modified, {"round": mirror.round, "bounties": page, "next": next_id}
+        return 404, mirror.modified, {"error": "not found"}
+
+    def handle(self, method: str, target: str, headers: Dict[str, str]) -> Union[bytes, Awaitable[bytes]]:
+        """The response now, or once the mirror reaches the request's min_round"""
+        if "min_round=" not in target:
+            return self.respond(method, target, headers)
+        binary = MSGPACK in headers.get("accept", "")
+        try:
+            min_round = _int(parse_qs(urlsplit(target).query), "min_round", 0)
+        except BadRequest as e:
+            return self._encode(400, {"error": str(e)}, "", binary)
+        if min_round <= self.mirror.round:
+            return self.respond(method, target, headers)
+        return self._respond_at(min_round, method, target, headers, binary)
+
+    async def _respond_at(self, min_round: int, method: str, target: str, headers: Dict[str, str],
+                          binary: bool) -> bytes:
+        if await self.mirror.wait_for(min_round, self.min_round_wait):
+            return self.respond(method, target, headers)
+        self.requests += 1
+        body = {"error": f"not synced to round {min_round} yet", "round": self.mirror.round}
+        return self._encode(503, body, "", binary, "Retry-After: 1\r\n")
+
+    def respond(self, method: str, target: str, headers: Dict[str, str]) -> bytes:
+        """The full HTTP response for one request"""
+        self.requests += 1
+        if method != "GET":
+            return self._encode(405, {"error": "GET only"}, "", False)
+        binary = MSGPACK in headers.get("accept", "")
+        if self._cache_round != self.mirror.round:
+            self._cache.clear()
+            self._cache_round = self.mirror.round
+        cached = self._cache.get((target, binary))
+        if cached is None:
+            try:
+                code, modified, body = self._route(target)
+            except BadRequest as e:
+                return self._encode(400, {"error": str(e)}, "", binary)
+            etag = f'W/"{self.app_id}-{modified}{"-m" if binary else ""}"'
+            cached = (code, etag, self._encode(code, body, etag, binary))
+            if len(self._cache) < CACHED_RESPONSES:
+                self._cache[(target, binary)] = cached
+        code, etag, response = cached
+        if code == 200 and etag in headers.get("if-none-match", ""):
+            return _status_line(304) + f"ETag: {etag}\r\n{self._common()}Content-Length: 0\r\n\r\n".encode()
+        return response
+
+    def _common(self) -> str:
+        return f"X-Algoease-Round: {self.mirror.round}\r\nCache-Control: no-cache\r\nVary: Accept\r\n" \
+               f"Access-Control-Allow-Origin: *\r\n"
+
+    def _encode(self, code: int, body, etag: str, binary: bool, extra_headers: str = "") -> bytes:
+        if binary:
+            payload, content_type = msgpack.packb(body), MSGPACK
+        else:
+            payload, content_type = json.dumps(body, separators=(",", ":")).encode(), "application/json"
+        head = f"Content-Type: {content_type}\r\n{self._common()}{extra_headers}"
+        if etag:
+            head += f"ETag: {etag}\r\n"
+        return _status_line(code) + f"{head}Content-Length: {len(payload)}\r\n\r\n".encode() + payload
+
+
+class HttpProtocol(asyncio.Protocol):
+    """Minimal HTTP/1.1 for bodiless GETs: keep-alive and pipelining, responses in request order"""
+
+    MAX_HEADER = 16 * 1024
+
+    def __init__(self, api: ReadApi):
+        self.api = api
+        self.buffer = b""
+        self.transport: Optional[asyncio.Transport] = None
+        # Responses behind one that is still waiting for its min_round are held back in order
+        self.queued: Deque[Union[bytes, asyncio.Task]] = deque()
+        self.closing = False
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        for item in self.queued:
+            if isinstance(item, asyncio.Task):
+                item.cancel()
+        self.queued.clear()
+
+    def data_received(self, data: bytes) -> None:
+        if self.closing:
+            return
+        self.buffer += data
+        while True:
+            end = self.buffer.find(b"\r\n\r\n")
+            if end < 0:
+                if len(self.buffer) > self.MAX_HEADER:
+                    self.closing = True
+                break
+            request, self.buffer = self.buffer[:end].decode("latin-1"), self.buffer[end + 4:]
+            request_line, *header_lines = request.split("\r\n")
+            parts = request_line.split(" ")
+            if len(parts) != 3:
+                self.closing = True
+                break
+            headers = {k.strip().lower(): v.strip() for k, _, v in (h.partition(":") for h in header_lines)}
+            response = self.api.handle(parts[0], parts[1], headers)
+            if isinstance(response, bytes):
+                self.queued.append(response)
+            else:
+                task = asyncio.ensure_future(response)
+                task.add_done_callback(lambda _: self._flush())
+                self.queued.append(task)
+            if headers.get("connection", "").lower() == "close" or parts[2] == "HTTP/1.0":
+                self.closing = True
+                break
+        self._flush()
+
+    def _flush(self) -> None:
+        ready = []
+        while self.queued:
+            item = self.queued[0]
+            if isinstance(item, asyncio.Task):
+                if not item.done():
+                    break
+                item = b"" if item.cancelled() else item.result()
+            ready.append(item)
+            self.queued.popleft()
+        if ready and not self.transport.is_closing():
+            self.transport.write(b"".join(ready))
+        if self.closing and not self.queued:
+            self.transport.close()
+
+# ============================================================================
+# Service
+# ============================================================================
+
+async def sync(follower: Follower, mirror: Mirror, out: TextIO = sys.stdout) -> None:
+    """Keep the mirror current. The follower reads algod in a worker thread;
+    its results are applied on the event loop so requests never see a half-applied round."""
+    def step() -> List[Tuple[int, List[Tuple[int, Optional[Bounty]]]]]:
+        return [(round_number, [(c.bounty_id, follower.bounties.get(c.bounty_id)) for c in changes])
+                for round_number, changes in follower.next_rounds()]
+
+    await asyncio.to_thread(follower.load)
+    mirror.load(list(follower.bounties.values()), follower.round)
+    while True:
+        try:
+            rounds = await asyncio.to_thread(step)
+        except Exception as e:
+            out.write(f"[WARN] {e}; retrying\n")
+            await asyncio.sleep(2)
+            continue
+        for round_number, changes in rounds:
+            for bounty_id, bounty in changes:
+                mirror.apply(round_number, bounty_id, bounty)
+            mirror.advance(round_number)
+
+
+async def serve(follower: Follower, host: str, port: int, out: TextIO = sys.stdout) -> None:
+    mirror = Mirror(follower.layout)
+    api = ReadApi(mirror, follower.app_id)
+    loop = asyncio.get_running_loop()
+    server = await loop.create_server(lambda: HttpProtocol(api), host, port)
+    print(f"Serving app {follower.app_id} bounties on http://{host}:{port}/bounties", file=out)
+    async with server:
+        await asyncio.gather(server.serve_forever(), sync(follower, mirror, out))
+
+
+def main(argv: Optional[Sequence[str]] = None, out: TextIO = sys.stdout) -> int:
+    parser = argparse.ArgumentParser(description="Read API over a locally synced bounty mirror")
+    parser.add_argument("--app-id", type=int, help="app to mirror (default: configured app)")
+    parser.add_argument("--layout", choices=sorted(LAYOUTS), default=V2.name, help="box layout (default: v2)")
+    parser.add_argument("--host", default="127.0.0.1", help="listen address (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8780, help="listen port (default: 8780)")
+    args = parser.parse_args(argv)
+
+    follower = Follower(get_algod_client(), args.app_id or get_app_id(), LAYOUTS[args.layout])
+    try:
+        asyncio.run(serve(follower, args.host, args.port, out))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
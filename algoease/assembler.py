@@ -0,0 +1,608 @@
+"""
+Offline TEAL assembler.
+
+Turns TEAL source into program bytes without a round trip to algod's
+compile endpoint, so builds, tests and program-hash checks work with no
+node at all. The output matches go-algorand's assembler byte for byte,
+including its constant-block packing for TEAL v4+:
+- int / byte constants used more than once go into intcblock / bytecblock,
+  most-used first (ties keep first-use order)
+- constants used once become pushint / pushbytes
+- `txn F i` / `gtxn g F i` / `itxn F i` are rewritten to their *a forms
+
+Stack type checking is left to algod: a program the node would reject
+for a stack error still assembles here.
+
+Usage:
+    from algoease.assembler import assemble, program_address
+    program = assemble(open("contracts/algoease_bounty_escrow_v2_approval.teal").read())
+
+    python -m algoease.assembler contracts/algoease_bounty_escrow_v2_approval.teal
+"""
+
+import base64
+import re
+import sys
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple, Union
+
+from algosdk import encoding
+
+DEFAULT_VERSION = 1
+MAX_VERSION = 10
+# go-algorand only packs constant blocks from this version on
+OPTIMIZE_CONSTANTS_VERSION = 4
+# Backward branches became legal in v4
+BACKWARD_BRANCH_VERSION = 4
+
+
+class TealAssemblyError(ValueError):
+    def __init__(self, line: int, message: str):
+        super().__init__(f"line {line}: {message}")
+        self.line = line
+
+# ============================================================================
+# Opcode and field tables
+# ============================================================================
+
+TXN_FIELDS = {name: i for i, name in enumerate((
+    "Sender", "Fee", "FirstValid", "FirstValidTime", "LastValid", "Note", "Lease", "Receiver",
+    "Amount", "CloseRemainderTo", "VotePK", "SelectionPK", "VoteFirst", "VoteLast", "VoteKeyDilution",
+    "Type", "TypeEnum", "XferAsset", "AssetAmount", "AssetSender", "AssetReceiver", "AssetCloseTo",
+    "GroupIndex", "TxID", "ApplicationID", "OnCompletion", "ApplicationArgs", "NumAppArgs",
+    "Accounts", "NumAccounts", "ApprovalProgram", "ClearStateProgram", "RekeyTo", "ConfigAsset",
+    "ConfigAssetTotal", "ConfigAssetDecimals", "ConfigAssetDefaultFrozen", "ConfigAssetUnitName",
+    "ConfigAssetName", "ConfigAssetURL", "ConfigAssetMetadataHash", "ConfigAssetManager",
+    "ConfigAssetReserve", "ConfigAssetFreeze", "ConfigAssetClawback", "FreezeAsset",
+    "FreezeAssetAccount", "FreezeAssetFrozen", "Assets", "NumAssets", "Applications",
+    "NumApplications", "GlobalNumUint", "GlobalNumByteSlice", "LocalNumUint", "LocalNumByteSlice",
+    "ExtraProgramPages", "Nonparticipation", "Logs", "NumLogs", "CreatedAssetID",
+    "CreatedApplicationID", "LastLog", "StateProofPK", "ApprovalProgramPages",
+    "NumApprovalProgramPages", "ClearStateProgramPages", "NumClearStateProgramPages",
+))}
+TXN_ARRAY_FIELDS = {"ApplicationArgs", "Accounts", "Assets", "Applications", "Logs",
+                    "ApprovalProgramPages", "ClearStateProgramPages"}
+
+GLOBAL_FIELDS = {name: i for i, name in enumerate((
+    "MinTxnFee", "MinBalance", "MaxTxnLife", "ZeroAddress", "GroupSize", "LogicSigVersion", "Round",
+    "LatestTimestamp", "CurrentApplicationID", "CreatorAddress", "CurrentApplicationAddress",
+    "GroupID", "OpcodeBudget", "CallerApplicationID", "CallerApplicationAddress",
+))}
+
+ASSET_HOLDING_FIELDS = {"AssetBalance": 0, "AssetFrozen": 1}
+ASSET_PARAMS_FIELDS = {name: i for i, name in enumerate((
+    "AssetTotal", "AssetDecimals", "AssetDefaultFrozen", "AssetUnitName", "AssetName", "AssetURL",
+    "AssetMetadataHash", "AssetManager", "AssetReserve", "AssetFreeze", "AssetClawback", "AssetCreator",
+))}
+APP_PARAMS_FIELDS = {name: i for i, name in enumerate((
+    "AppApprovalProgram", "AppClearStateProgram", "AppGlobalNumUint", "AppGlobalNumByteSlice",
+    "AppLocalNumUint", "AppLocalNumByteSlice", "AppExtraProgramPages", "AppCreator", "AppAddress",
+))}
+ACCT_PARAMS_FIELDS = {name: i for i, name in enumerate((
+    "AcctBalance", "AcctMinBalance", "AcctAuthAddr", "AcctTotalNumUint", "AcctTotalNumByteSlice",
+    "AcctTotalExtraAppPages", "AcctTotalAppsCreated", "AcctTotalAppsOptedIn", "AcctTotalAssetsCreated",
+    "AcctTotalAssets", "AcctTotalBoxes", "AcctTotalBoxBytes",
+))}
+
+# Named integer constants accepted by `int`
+NAMED_INTS = {
+    "unknown": 0, "pay": 1, "keyreg": 2, "acfg": 3, "axfer": 4, "afrz": 5, "appl": 6,
+    "NoOp": 0, "OptIn": 1, "CloseOut": 2, "ClearState": 3, "UpdateApplication": 4, "DeleteApplication": 5,
+}
+
+# Immediate kinds
+U8, I8, LABEL, LABELS, TXN, GLOBAL = "u8", "i8", "label", "labels", "txn", "global"
+HOLDING, ASSET_PARAMS, APP_PARAMS, ACCT_PARAMS = "holding", "asset_params", "app_params", "acct_params"
+VARUINTS, BYTESS, PUSHINT, PUSHBYTES = "varuints", "bytess", "pushint", "pushbytes"
+
+FIELD_TABLES = {TXN: TXN_FIELDS, GLOBAL: GLOBAL_FIELDS, HOLDING: ASSET_HOLDING_FIELDS,
+                ASSET_PARAMS: ASSET_PARAMS_FIELDS, APP_PARAMS: APP_PARAMS_FIELDS,
+                ACCT_PARAMS: ACCT_PARAMS_FIELDS}
+
+
+@dataclass(frozen=True)
+class OpSpec:
+    opcode: int
+    version: int
+    immediates: Tuple[str, ...] = ()
+
+
+def _ops(version: int, first: int, names: str, immediates: Tuple[str, ...] = ()) -> Dict[str, OpSpec]:
+    """Consecutive opcodes sharing a version and immediate layout"""
+    return {name: OpSpec(first + i, version, immediates) for i, name in enumerate(names.split())}
+
+
+OPS: Dict[str, OpSpec] = {
+    **_ops(1, 0x00, "err sha256 keccak256 sha512_256 ed25519verify"),
+    **_ops(1, 0x08, "+ - / * < > <= >= && || == != ! len itob btoi % | & ^ ~ mulw"),
+    "addw": OpSpec(0x1e, 2),
+    "divmodw": OpSpec(0x1f, 4),
+    "intcblock": OpSpec(0x20, 1, (VARUINTS,)),
+    "intc": OpSpec(0x21, 1, (U8,)),
+    **_ops(1, 0x22, "intc_0 intc_1 intc_2 intc_3"),
+    "bytecblock": OpSpec(0x26, 1, (BYTESS,)),
+    "bytec": OpSpec(0x27, 1, (U8,)),
+    **_ops(1, 0x28, "bytec_0 bytec_1 bytec_2 bytec_3"),
+    "arg": OpSpec(0x2c, 1, (U8,)),
+    **_ops(1, 0x2d, "arg_0 arg_1 arg_2 arg_3"),
+    "txn": OpSpec(0x31, 1, (TXN,)),
+    "global": OpSpec(0x32, 1, (GLOBAL,)),
+    "gtxn": OpSpec(0x33, 1, (U8, TXN)),
+    "load": OpSpec(0x34, 1, (U8,)),
+    "store": OpSpec(0x35, 1, (U8,)),
+    "txna": OpSpec(0x36, 2, (TXN, U8)),
+    "gtxna": OpSpec(0x37, 2, (U8, TXN, U8)),
+    "gtxns": OpSpec(0x38, 3, (TXN,)),
+    "gtxnsa": OpSpec(0x39, 3, (TXN, U8)),
+    "gload": OpSpec(0x3a, 4, (U8, U8)),
+    "gloads": OpSpec(0x3b, 4, (U8,)),
+    "gaid": OpSpec(0x3c, 4, (U8,)),
+    "gaids": OpSpec(0x3d, 4),
+    **_ops(5, 0x3e, "loads stores"),
+    "bnz": OpSpec(0x40, 1, (LABEL,)),
+    "bz": OpSpec(0x41, 2, (LABEL,)),
+    "b": OpSpec(0x42, 2, (LABEL,)),
+    "return": OpSpec(0x43, 2),
+    "assert": OpSpec(0x44, 3),
+    **_ops(8, 0x45, "bury popn dupn", (U8,)),
+    **_ops(1, 0x48, "pop dup"),
+    "dup2": OpSpec(0x4a, 2),
+    "dig": OpSpec(0x4b, 3, (U8,)),
+    **_ops(3, 0x4c, "swap select"),
+    **_ops(5, 0x4e, "cover uncover", (U8,)),
+    "concat": OpSpec(0x50, 2),
+    "substring": OpSpec(0x51, 2, (U8, U8)),
+    "substring3": OpSpec(0x52, 2),
+    **_ops(3, 0x53, "getbit setbit getbyte setbyte"),
+    "extract": OpSpec(0x57, 5, (U8, U8)),
+    **_ops(5, 0x58, "extract3 extract_uint16 extract_uint32 extract_uint64"),
+    "replace2": OpSpec(0x5c, 7, (U8,)),
+    "replace3": OpSpec(0x5d, 7),
+    **_ops(2, 0x60, "balance app_opted_in app_local_get app_local_get_ex app_global_get "
+                    "app_global_get_ex app_local_put app_global_put app_local_del app_global_del"),
+    "asset_holding_get": OpSpec(0x70, 2, (HOLDING,)),
+    "asset_params_get": OpSpec(0x71, 2, (ASSET_PARAMS,)),
+    "app_params_get": OpSpec(0x72, 5, (APP_PARAMS,)),
+    "acct_params_get": OpSpec(0x73, 6, (ACCT_PARAMS,)),
+    "min_balance": OpSpec(0x78, 3),
+    "pushbytes": OpSpec(0x80, 3, (PUSHBYTES,)),
+    "pushint": OpSpec(0x81, 3, (PUSHINT,)),
+    "pushbytess": OpSpec(0x82, 8, (BYTESS,)),
+    "pushints": OpSpec(0x83, 8, (VARUINTS,)),
+    "ed25519verify_bare": OpSpec(0x84, 7),
+    "callsub": OpSpec(0x88, 4, (LABEL,)),
+    "retsub": OpSpec(0x89, 4),
+    "proto": OpSpec(0x8a, 8, (U8, U8)),
+    **_ops(8, 0x8b, "frame_dig frame_bury", (I8,)),
+    **_ops(8, 0x8d, "switch match", (LABELS,)),
+    **_ops(4, 0x90, "shl shr sqrt bitlen exp expw"),
+    **_ops(6, 0x96, "bsqrt divw"),
+    "sha3_256": OpSpec(0x98, 7),
+    **_ops(4, 0xa0, "b+ b- b/ b* b< b> b<= b>= b== b!= b% b| b& b^ b~ bzero"),
+    **_ops(5, 0xb0, "log itxn_begin"),
+    "itxn_field": OpSpec(0xb2, 5, (TXN,)),
+    "itxn_submit": OpSpec(0xb3, 5),
+    "itxn": OpSpec(0xb4, 5, (TXN,)),
+    "itxna": OpSpec(0xb5, 5, (TXN, U8)),
+    "itxn_next": OpSpec(0xb6, 6),
+    "gitxn": OpSpec(0xb7, 6, (U8, TXN)),
+    "gitxna": OpSpec(0xb8, 6, (U8, TXN, U8)),
+    **_ops(8, 0xb9, "box_create box_extract box_replace box_del box_len box_get box_put"),
+    "txnas": OpSpec(0xc0, 5, (TXN,)),
+    "gtxnas": OpSpec(0xc1, 5, (U8, TXN)),
+    "gtxnsas": OpSpec(0xc2, 5, (TXN,)),
+    "args": OpSpec(0xc3, 5),
+    "gloadss": OpSpec(0xc4, 6),
+    "itxnas": OpSpec(0xc5, 6, (TXN,)),
+    "gitxnas": OpSpec(0xc6, 6, (U8, TXN)),
+}
+
+# Array-field forms the assembler rewrites to: op with one more immediate -> *a op
+ARRAY_FORMS = {"txn": "txna", "gtxn": "gtxna", "itxn": "itxna", "gitxn": "gitxna",
+               "gtxns": "gtxnsa"}
+
+# ============================================================================
+# Tokens and literals
+# ============================================================================
+
+_ESCAPES = {"n": b"\n", "r": b"\r", "t": b"\t", "\\": b"\\", '"': b'"'}
+
+
+def tokenize(line: str) -> List[str]:
+    """Split a line on whitespace, keeping quoted strings whole and dropping // comments"""
+    tokens, current, i = [], "", 0
+    while i < len(line):
+        ch = line[i]
+        if ch == '"':
+            # Like go-algorand, any quote not directly after a backslash ends the string
+            end = i + 1
+            while end < len(line) and not (line[end] == '"' and line[end - 1] != "\\"):
+                end += 1
+            current += line[i:end + 1]
+            i = end + 1
+            continue
+        if line.startswith("//", i):
+            break
+        if ch.isspace() or ch == ";":
+            if current:
+                tokens.append(current)
+                current = ""
+            if ch == ";":
+                tokens.append(";")
+        else:
+            current += ch
+        i += 1
+    if current:
+        tokens.append(current)
+    return tokens
+
+
+def parse_uint(text: str) -> int:
+    if text in NAMED_INTS:
+        return NAMED_INTS[text]
+    # Go's strconv.ParseUint(s, 0, 64): a leading 0 means octal
+    base = 8 if re.fullmatch(r"0[0-7_]+", text) else 0
+    try:
+        value = int(text, base)
+    except ValueError:
+        raise ValueError(f"unable to parse {text!r} as integer") from None
+    if not 0 <= value < 2 ** 64:
+        raise ValueError(f"{text} is out of range for uint64")
+    return value
+
+
+def parse_string(text: str) -> bytes:
+    if len(text) < 2 or not (text.startswith('"') and text.endswith('"')):
+        raise ValueError(f"malformed string literal {text}")
+    body, out, i = text[1:-1], bytearray(), 0
+    while i < len(body):
+        if body[i] != "\\":
+            out += body[i].encode("utf-8")
+            i += 1
+            continue
+        code = body[i + 1:i + 2]
+        if code == "x":
+            out.append(int(body[i + 2:i + 4], 16))
+            i += 4
+        elif code in _ESCAPES:
+            out += _ESCAPES[code]
+            i += 2
+        else:
+            raise ValueError(f"invalid escape \\{code} in {text}")
+    return bytes(out)
+
+
+def _b32decode(text: str) -> bytes:
+    return base64.b32decode(text + "=" * (-len(text) % 8))
+
+
+def parse_bytes(args: Sequence[str]) -> Tuple[bytes, int]:
+    """Byte literal at the start of args -> (value, tokens consumed)"""
+    if not args:
+        raise ValueError("byte literal expected")
+    first = args[0]
+    decoders = {"base64": base64.b64decode, "b64": base64.b64decode,
+                "base32": _b32decode, "b32": _b32decode}
+    if first in decoders:
+        if len(args) < 2:
+            raise ValueError(f"{first} needs an argument")
+        return decoders[first](args[1]), 2
+    match = re.fullmatch(r"(base64|b64|base32|b32)\((.*)\)", first)
+    if match:
+        return decoders[match.group(1)](match.group(2)), 1
+    if first.startswith("0x"):
+        return bytes.fromhex(first[2:]), 1
+    if first.startswith('"'):
+        return parse_string(first), 1
+    raise ValueError(f"byte arg did not parse: {first}")
+
+
+def method_selector(signature: str) -> bytes:
+    """ARC-4 method selector: first 4 bytes of SHA-512/256(signature)"""
+    return encoding.checksum(signature.encode("utf-8"))[:4]
+
+
+def uvarint(value: int) -> bytes:
+    out = bytearray()
+    while value >= 0x80:
+        out.append((value & 0x7f) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+# ============================================================================
+# Assembler
+# ============================================================================
+
+@dataclass
+class _Const:
+    """`int` / `byte` reference whose encoding depends on the final constant blocks"""
+    kind: str          # "int" or "byte"
+    value: Union[int, bytes]
+    line: int
+
+
+@dataclass
+class _Branch:
+    opcode: int
+    labels: Tuple[str, ...]
+    line: int
+    table: bool = False  # switch / match carry a label count and several offsets
+
+    @property
+    def size(self) -> int:
+        return 2 + 2 * len(self.labels) if self.table else 3
+
+
+Instruction = Union[bytes, _Const, _Branch]
+
+
+class Assembler:
+    """Single-use: Assembler(source).assemble() -> program bytes"""
+
+    def __init__(self, source: str):
+        self.source = source
+        self.version = DEFAULT_VERSION
+        self.instructions: List[Instruction] = []
+        self.labels: Dict[str, int] = {}  # label -> instruction index
+        self.intc: List[int] = []
+        self.bytec: List[bytes] = []
+        self.manual_intc = False
+        self.manual_bytec = False
+        self._line = 0
+
+    # ------------------------------------------------------------------ parse
+
+    def assemble(self) -> bytes:
+        for number, line in enumerate(self.source.splitlines(), 1):
+            self._line = number
+            tokens = tokenize(line)
+            if tokens[:1] == ["#pragma"]:
+                self._pragma(tokens)
+                continue
+            statement: List[str] = []
+            for token in tokens + [";"]:
+                if token != ";":
+                    statement.append(token)
+                    continue
+                if statement:
+                    self._statement(statement)
+                statement = []
+        return self._emit()
+
+    def _error(self, message: str) -> TealAssemblyError:
+        return TealAssemblyError(self._line, message)
+
+    def _pragma(self, tokens: List[str]) -> None:
+        if tokens[1:2] != ["version"]:
+            raise self._error(f"unsupported pragma directive: {' '.join(tokens[1:2])}")
+        if self.instructions or self.labels:
+            raise self._error("#pragma version is only allowed before instructions")
+        if len(tokens) != 3:
+            raise self._error("#pragma version needs exactly one value")
+        version = parse_uint(tokens[2])
+        if not 1 <= version <= MAX_VERSION:
+            raise self._error(f"unsupported version {version}")
+        self.version = version
+
+    def _statement(self, tokens: List[str]) -> None:
+        while tokens and tokens[0].endswith(":"):
+            label = tokens[0][:-1]
+            if label in self.labels:
+                raise self._error(f"duplicate label {label}")
+            self.labels[label] = len(self.instructions)
+            tokens = tokens[1:]
+        if not tokens:
+            return
+        name, args = tokens[0], tokens[1:]
+        try:
+            self._instruction(name, args)
+        except TealAssemblyError:
+            raise
+        except ValueError as e:
+            raise self._error(f"{name}: {e}") from None
+
+    def _instruction(self, name: str, args: List[str]) -> None:
+        # Pseudo-ops that go through the constant blocks
+        if name == "int":
+            self._expect_args(name, args, 1)
+            self._const("int", parse_uint(args[0]))
+            return
+        if name == "byte":
+            value, used = parse_bytes(args)
+            self._expect_args(name, args, used)
+            self._const("byte", value)
+            return
+        if name == "addr":
+            self._expect_args(name, args, 1)
+            self._const("byte", encoding.decode_address(args[0]))
+            return
+        if name == "method":
+            self._expect_args(name, args, 1)
+            self._const("byte", method_selector(parse_string(args[0]).decode("utf-8")))
+            return
+
+        if name in ARRAY_FORMS and len(args) == len(OPS[name].immediates) + 1:
+            name = ARRAY_FORMS[name]
+        if name in ("intc", "bytec", "arg") and len(args) == 1 and args[0].isdigit() and int(args[0]) < 4:
+            name, args = f"{name}_{args[0]}", []
+        spec = OPS.get(name)
+        if spec is None:
+            raise self._error(f"unknown opcode: {name}")
+        if spec.version > self.version:
+            raise self._error(f"{name} opcode was introduced in TEAL v{spec.version}")
+
+        if spec.immediates in ((LABEL,), (LABELS,)):
+            if spec.immediates == (LABEL,):
+                self._expect_args(name, args, 1)
+            self.instructions.append(_Branch(spec.opcode, tuple(args), self._line,
+                                             table=spec.immediates == (LABELS,)))
+            return
+        self.instructions.append(bytes([spec.opcode]) + self._immediates(name, spec, args))
+
+    def _expect_args(self, name: str, args: List[str], count: int) -> None:
+        if len(args) != count:
+            raise self._error(f"{name} expects {count} immediate arguments")
+
+    def _immediates(self, name: str, spec: OpSpec, args: List[str]) -> bytes:
+        kinds = spec.immediates
+        if kinds == (VARUINTS,):
+            values = [parse_uint(a) for a in args]
+            if name == "intcblock":
+                self._manual_block("intc", values)
+            return uvarint(len(values)) + b"".join(uvarint(v) for v in values)
+        if kinds == (BYTESS,):
+            values, rest = [], list(args)
+            while rest:
+                value, used = parse_bytes(rest)
+                values.append(value)
+                rest = rest[used:]
+            if name == "bytecblock":
+                self._manual_block("bytec", values)
+            return uvarint(len(values)) + b"".join(uvarint(len(v)) + v for v in values)
+        if kinds == (PUSHINT,):
+            self._expect_args(name, args, 1)
+            return uvarint(parse_uint(args[0]))
+        if kinds == (PUSHBYTES,):
+            value, used = parse_bytes(args)
+            self._expect_args(name, args, used)
+            return uvarint(len(value)) + value
+
+        self._expect_args(name, args, len(kinds))
+        out = bytearray()
+        for kind, arg in zip(kinds, args):
+            if kind == U8:
+                value = parse_uint(arg)
+                if value > 0xff:
+                    raise ValueError(f"immediate {arg} is larger than 255")
+                out.append(value)
+            elif kind == I8:
+                value = int(arg, 0)
+                if not -128 <= value <= 127:
+                    raise ValueError(f"immediate {arg} is outside -128..127")
+                out.append(value & 0xff)
+            else:
+                table = FIELD_TABLES[kind]
+                if arg not in table:
+                    raise ValueError(f"unknown field: {arg}")
+                if name in ARRAY_FORMS and arg in TXN_ARRAY_FIELDS:
+                    raise ValueError(f"{arg} is an array field and needs an index")
+                if name in ARRAY_FORMS.values() and arg not in TXN_ARRAY_FIELDS:
+                    raise ValueError(f"{arg} is not an array field")
+                out.append(table[arg])
+        return bytes(out)
+
+    def _manual_block(self, kind: str, values: list) -> None:
+        if getattr(self, kind):
+            raise self._error(f"{kind}block following {'int' if kind == 'intc' else 'byte'}")
+        setattr(self, kind, list(values))
+        setattr(self, "manual_" + kind, True)
+
+    def _const(self, kind: str, value: Union[int, bytes]) -> None:
+        block = self.intc if kind == "int" else self.bytec
+        manual = self.manual_intc if kind == "int" else self.manual_bytec
+        if manual:
+            # go-algorand leaves hand-written blocks alone: v4+ pushes, older versions must find the value
+            if self.version >= OPTIMIZE_CONSTANTS_VERSION:
+                self.instructions.append(self._encode_const(_Const(kind, value, self._line), []))
+                return
+            if value not in block:
+                raise self._error(f"value {value!r} does not appear in existing {'intcblock' if kind == 'int' else 'bytecblock'}")
+        elif value not in block:
+            if len(block) == 256:
+                raise self._error(f"cannot have more than 256 {kind} constants")
+            block.append(value)
+        self.instructions.append(_Const(kind, value, self._line))
+
+    # ------------------------------------------------------------------- emit
+
+    def _optimized(self, kind: str) -> list:
+        """Constant block after go-algorand's frequency packing"""
+        block = self.intc if kind == "int" else self.bytec
+        manual = self.manual_intc if kind == "int" else self.manual_bytec
+        if manual or self.version < OPTIMIZE_CONSTANTS_VERSION:
+            return block
+        counts = {value: 0 for value in block}
+        for ins in self.instructions:
+            if isinstance(ins, _Const) and ins.kind == kind:
+                counts[ins.value] += 1
+        # sorted() is stable, so equal counts keep first-use order
+        return [value for value in sorted(block, key=lambda v: -counts[v]) if counts[value] > 1]
+
+    def _encode_const(self, ins: _Const, block: list) -> bytes:
+        if ins.value in block:
+            index = block.index(ins.value)
+            if ins.kind == "int":
+                return bytes([0x22 + index]) if index < 4 else bytes([0x21, index])
+            return bytes([0x28 + index]) if index < 4 else bytes([0x27, index])
+        if self.version < 3:
+            raise TealAssemblyError(ins.line, f"{ins.kind} constant not in the constant block")
+        if ins.kind == "int":
+            return b"\x81" + uvarint(ins.value)
+        return b"\x80" + uvarint(len(ins.value)) + ins.value
+
+    def _emit(self) -> bytes:
+        blocks = {"int": self._optimized("int"), "byte": self._optimized("byte")}
+        encoded: List[Union[bytes, _Branch]] = [
+            self._encode_const(ins, blocks[ins.kind]) if isinstance(ins, _Const) else ins
+            for ins in self.instructions
+        ]
+
+        offsets, pc = [], 0
+        for ins in encoded:
+            offsets.append(pc)
+            pc += ins.size if isinstance(ins, _Branch) else len(ins)
+        offsets.append(pc)
+
+        body = bytearray()
+        for index, ins in enumerate(encoded):
+            if not isinstance(ins, _Branch):
+                body += ins
+                continue
+            end = offsets[index] + ins.size
+            body.append(ins.opcode)
+            if ins.table:
+                body.append(len(ins.labels))
+            for label in ins.labels:
+                if label not in self.labels:
+                    raise TealAssemblyError(ins.line, f"reference to undefined label {label!r}")
+                offset = offsets[self.labels[label]] - end
+                if offset < 0 and self.version < BACKWARD_BRANCH_VERSION:
+                    raise TealAssemblyError(ins.line, f"label {label!r} is a backward branch, "
+                                                      f"which needs TEAL v{BACKWARD_BRANCH_VERSION}")
+                if not -0x8000 <= offset <= 0x7fff:
+                    raise TealAssemblyError(ins.line, f"label {label!r} is too far away")
+                body += (offset & 0xffff).to_bytes(2, "big")
+
+        program = bytearray(uvarint(self.version))
+        if blocks["int"] and not self.manual_intc:
+            program += b"\x20" + uvarint(len(blocks["int"])) + b"".join(uvarint(v) for v in blocks["int"])
+        if blocks["byte"] and not self.manual_bytec:
+            program += b"\x26" + uvarint(len(blocks["byte"])) + b"".join(
+                uvarint(len(v)) + v for v in blocks["byte"])
+        return bytes(program + body)
+
+
+def assemble(source: str) -> bytes:
+    """TEAL source -> program bytes, identical to algod's compile endpoint"""
+    return Assembler(source).assemble()
+
+
+def assemble_file(path: str) -> bytes:
+    with open(path, "r") as f:
+        return assemble(f.read())
+
+
+def program_address(program: bytes) -> str:
+    """Program hash as algod reports it: the logic-sig address of the program"""
+    return encoding.encode_address(encoding.checksum(b"Program" + program))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python -m algoease.assembler <program.teal> [...]")
+        sys.exit(1)
+    for teal_path in sys.argv[1:]:
+        assembled = assemble_file(teal_path)
+        print(f"{teal_path}: {len(assembled)} bytes, hash {program_address(assembled)}")
+        print(base64.b64encode(assembled).decode())
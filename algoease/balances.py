@@ -0,0 +1,145 @@
+"""
+Bulk balance and minimum-balance lookup.
+
+The old check-balance scripts each fetched a full account_info for one
+hard-coded address and threw away everything but amount / min-balance.
+Here every account is fetched as msgpack with exclude=all (no assets,
+apps or created resources in the payload), all of them at once on a
+thread pool, so checking the whole fleet costs about one round trip of
+wall time.
+
+Targets can be addresses, app IDs (their escrow account is checked) or
+the names "creator" and "app" for the configured creator and contract.
+
+    python -m algoease.balances                      # creator + configured app
+    python -m algoease.balances 749707697 3AU6...    # any mix of apps / addresses
+    python -m algoease.balances creator --min-available 0.2
+"""
+
+import argparse
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from algosdk import account, encoding, mnemonic
+from algosdk.logic import get_application_address
+
+from algoease.client import get_algod_client, get_app_id, get_creator_mnemonic, load_config
+from algoease.wire import get_account
+
+MAX_WORKERS = 16
+DEFAULT_TARGETS = ("creator", "app")
+
+
+@dataclass(frozen=True)
+class Balance:
+    label: str
+    address: str
+    amount: int
+    min_balance: int
+    round: int
+
+    @property
+    def available(self) -> int:
+        """microAlgos that can be spent without dropping below the minimum balance"""
+        return self.amount - self.min_balance
+
+
+def resolve_target(target: str, config: Optional[Dict[str, str]] = None) -> Tuple[str, str]:
+    """(label, address) for an address, an app ID, "creator" or "app" """
+    if target == "creator":
+        private_key = mnemonic.to_private_key(get_creator_mnemonic(config))
+        return "creator", account.address_from_private_key(private_key)
+    if target == "app":
+        app_id = get_app_id(config)
+        return f"app {app_id}", get_application_address(app_id)
+    if target.isdigit():
+        return f"app {target}", get_application_address(int(target))
+    if encoding.is_valid_address(target):
+        return target[:8], target
+    raise ValueError(f"{target!r} is not an address, app ID, 'creator' or 'app'")
+
+
+class BalanceChecker:
+    """
+    Fetches balances concurrently and caches them by round.
+
+    A cached balance is reused when it was read at or after the round a
+    caller asks for, so a loop that knows the current round (e.g. the
+    dashboard) only pays for accounts it has not seen this round.
+    """
+
+    def __init__(self, client, max_workers: int = MAX_WORKERS):
+        self.client = client
+        self.max_workers = max_workers
+        self.requests = 0
+        self._cache: Dict[str, Balance] = {}
+        self._lock = threading.Lock()
+
+    def _fetch(self, label: str, address: str) -> Balance:
+        info = get_account(self.client, address)
+        with self._lock:
+            self.requests += 1
+        return Balance(label, address, info.get("amount", 0), info.get("min-balance", 0), info.get("round", 0))
+
+    def balances(self, targets: Iterable[Tuple[str, str]], at_round: Optional[int] = None) -> List[Balance]:
+        """Balances for (label, address) pairs, in input order"""
+        targets = list(targets)
+        stale: Dict[str, str] = {}
+        for label, address in targets:
+            cached = self._cache.get(address)
+            if at_round is None or cached is None or cached.round < at_round:
+                stale.setdefault(address, label)
+
+        if stale:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(stale))) as pool:
+                for balance in pool.map(lambda item: self._fetch(item[1], item[0]), stale.items()):
+                    self._cache[balance.address] = balance
+
+        results = []
+        for label, address in targets:
+            cached = self._cache[address]
+            results.append(cached if cached.label == label else
+                           Balance(label, address, cached.amount, cached.min_balance, cached.round))
+        return results
+
+
+def format_table(balances: Sequence[Balance], min_available: Optional[int] = None) -> str:
+    """One row per account; amounts in ALGO"""
+    lines = [f"{'Account':<14} {'Address':<58} {'Balance':>16} {'Min balance':>14} {'Available':>16} {'Round':>10}"]
+    for b in balances:
+        flag = "  LOW" if min_available is not None and b.available < min_available else ""
+        lines.append(f"{b.label:<14} {b.address:<58} {b.amount / 1_000_000:>16,.6f} "
+                     f"{b.min_balance / 1_000_000:>14,.6f} {b.available / 1_000_000:>16,.6f} {b.round:>10}{flag}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Balances and minimum balances of many accounts at once")
+    parser.add_argument("targets", nargs="*",
+                        help="addresses, app IDs, 'creator' or 'app' (default: creator and app)")
+    parser.add_argument("--min-available", type=float, default=None, metavar="ALGO",
+                        help="exit 1 if any account has less than this available")
+    args = parser.parse_args(argv)
+
+    config = load_config()
+    try:
+        targets = [resolve_target(t, config) for t in args.targets or DEFAULT_TARGETS]
+    except ValueError as e:
+        print(f"[ERROR] {e}")
+        return 2
+
+    min_available = None if args.min_available is None else int(args.min_available * 1_000_000)
+    balances = BalanceChecker(get_algod_client()).balances(targets)
+    print(format_table(balances, min_available))
+    if min_available is not None and any(b.available < min_available for b in balances):
+        print(f"\nSome accounts have less than {args.min_available} ALGO available.")
+        print("Get TestNet ALGO from https://bank.testnet.algorand.network/")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,184 @@
+"""
+JSONL batch runner for bounty operations.
+
+Reads one operation per line, builds it against the V2 contract, and
+pushes chunks of operations through the GroupPacker: one suggested-params
+fetch per chunk, packed atomic groups, and one confirmation wait per
+group instead of one per action. Writes one JSONL result per input line.
+
+Input lines:
+    {"op": "create", "id": "c1", "amount": 100000, "task_desc": "Fix the login page"}
+    {"op": "accept", "bounty_ref": "c1", "signer": "FREELANCER_MNEMONIC"}
+    {"op": "submit", "bounty_ref": "c1", "signer": "FREELANCER_MNEMONIC"}
+    {"op": "approve", "bounty_id": 12}
+    {"op": "reject", "bounty_id": 13}
+
+- "signer" names a config / env key holding a mnemonic
+  (default REACT_APP_CREATOR_MNEMONIC)
+- creates are numbered from the contract's bounty_count in input order;
+  "bounty_ref" points a later line at the create whose "id" matches
+- box sizes, creators and freelancers of existing bounties are read from
+  their boxes once per run
+- every group is simulated before it is signed (see preflight.py);
+  operations that would fail are reported with the reason and never sent
+
+Result lines:
+    {"line": 2, "ref": "c1", "op": "accept", "bounty_id": 41, "ok": true,
+     "txid": "...", "confirmed_round": 123, "group": 0, "error": null}
+"""
+
+import json
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, TextIO, Tuple
+
+from algosdk import account, mnemonic
+
+from algoease import operations
+from algoease.boxes import V2
+from algoease.client import load_config
+from algoease.packer import GroupPacker
+from algoease.preflight import Preflight
+from algoease.state import get_bounty, get_bounty_count
+
+OPS = ("create", "accept", "submit", "approve", "reject")
+DEFAULT_SIGNER = "REACT_APP_CREATOR_MNEMONIC"
+DEFAULT_CHUNK_SIZE = 256
+
+
+class BatchRunner:
+
+    def __init__(self, client, app_id: int, config: Optional[Dict[str, str]] = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, packer: Optional[GroupPacker] = None,
+                 preflight: bool = True):
+        self.client = client
+        self.app_id = app_id
+        self.config = load_config() if config is None else config
+        self.chunk_size = chunk_size
+        self.packer = packer or GroupPacker(client, preflight=Preflight(client) if preflight else None)
+        self.counts: Counter = Counter()
+
+        self._keys: Dict[str, Tuple[str, str]] = {}
+        self._bounties: Dict[int, dict] = {}
+        self._refs: Dict[object, int] = {}
+        self._next_bounty_id: Optional[int] = None
+
+    # ------------------------------------------------------------------- run
+
+    def run(self, lines: Iterable[str], out: TextIO) -> Counter:
+        """Process every input line; returns counts of ok / failed operations"""
+        chunk: List[Tuple[int, str]] = []
+        for number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            chunk.append((number, line))
+            if len(chunk) >= self.chunk_size:
+                self._run_chunk(chunk, out)
+                chunk = []
+        if chunk:
+            self._run_chunk(chunk, out)
+        return self.counts
+
+    def _run_chunk(self, chunk: List[Tuple[int, str]], out: TextIO) -> None:
+        sp = self.client.suggested_params()
+        records: List[dict] = []
+        queued = {}
+        for number, line in chunk:
+            record = {"line": number, "ref": None, "op": None, "bounty_id": None, "ok": False,
+                      "txid": None, "confirmed_round": None, "group": None, "error": None}
+            records.append(record)
+            try:
+                entry = json.loads(line)
+                if not isinstance(entry, dict):
+                    raise ValueError("line is not a JSON object")
+                record["ref"] = entry.get("id")
+                record["op"] = entry.get("op")
+                op = self._build(sp, entry)
+                record["bounty_id"] = op.bounty_id
+                self.packer.add(op)
+            except (ValueError, KeyError, TypeError) as e:
+                record["error"] = f"{type(e).__name__}: {e}"
+                continue
+            queued[id(op)] = record
+
+        created_failed = False
+        for result in self.packer.submit():
+            record = queued[id(result.operation)]
+            record.update(ok=result.ok, txid=result.txid, confirmed_round=result.confirmed_round,
+                          group=result.group_index, error=result.error)
+            created_failed |= record["op"] == "create" and not result.ok
+        if created_failed:
+            # Later creates were numbered past the failed one; renumber from the chain
+            self._next_bounty_id = None
+
+        for record in records:
+            self.counts["ok" if record["ok"] else "failed"] += 1
+            out.write(json.dumps(record) + "\n")
+        out.flush()
+
+    # ----------------------------------------------------------------- build
+
+    def _signer(self, name: str) -> Tuple[str, str]:
+        if name not in self._keys:
+            words = self.config.get(name)
+            if not words:
+                raise ValueError(f"signer {name} not found in config")
+            private_key = mnemonic.to_private_key(words)
+            self._keys[name] = (account.address_from_private_key(private_key), private_key)
+        return self._keys[name]
+
+    def _bounty_id(self, entry: dict) -> int:
+        if "bounty_ref" in entry:
+            if entry["bounty_ref"] not in self._refs:
+                raise ValueError(f"no create with id {entry['bounty_ref']!r} earlier in the batch")
+            return self._refs[entry["bounty_ref"]]
+        return int(entry["bounty_id"])
+
+    def _bounty(self, bounty_id: int) -> dict:
+        """Creator / freelancer / box size of a bounty, read from its box the first time"""
+        if bounty_id not in self._bounties:
+            bounty = get_bounty(self.client, self.app_id, bounty_id)
+            if bounty is None:
+                raise ValueError(f"bounty {bounty_id} does not exist")
+            self._bounties[bounty_id] = {
+                "creator": bounty.creator,
+                "freelancer": bounty.freelancer,
+                "size": V2.task_desc_offset + len(bounty.task_desc.encode('utf-8')),
+            }
+        return self._bounties[bounty_id]
+
+    def _build(self, sp, entry: dict) -> operations.Operation:
+        op = entry.get("op")
+        if op not in OPS:
+            raise ValueError(f"unknown op {op!r}, expected one of {', '.join(OPS)}")
+        sender, private_key = self._signer(entry.get("signer", DEFAULT_SIGNER))
+        ref = entry.get("id")
+
+        if op == "create":
+            if self._next_bounty_id is None:
+                self._next_bounty_id = get_bounty_count(self.client, self.app_id)
+            bounty_id = self._next_bounty_id
+            task_desc = str(entry["task_desc"])
+            built = operations.create_bounty(sp, self.app_id, sender, private_key, bounty_id,
+                                             int(entry["amount"]), task_desc, ref=ref)
+            self._next_bounty_id += 1
+            self._bounties[bounty_id] = {"creator": sender, "freelancer": None,
+                                         "size": V2.task_desc_offset + len(task_desc.encode('utf-8'))}
+            if ref is not None:
+                self._refs[ref] = bounty_id
+            return built
+
+        bounty_id = self._bounty_id(entry)
+        bounty = self._bounty(bounty_id)
+        if op == "accept":
+            bounty["freelancer"] = sender
+            return operations.accept_bounty(sp, self.app_id, sender, private_key, bounty_id, bounty["size"], ref)
+        if op == "submit":
+            return operations.submit_bounty(sp, self.app_id, sender, private_key, bounty_id, bounty["size"], ref)
+        if op == "approve":
+            freelancer = entry.get("freelancer") or bounty["freelancer"]
+            if not freelancer:
+                raise ValueError(f"bounty {bounty_id} has no freelancer to pay")
+            return operations.approve_bounty(sp, self.app_id, sender, private_key, bounty_id, freelancer,
+                                             bounty["size"], ref)
+        return operations.reject_bounty(sp, self.app_id, sender, private_key, bounty_id,
+                                        entry.get("creator") or bounty["creator"], bounty["size"], ref)
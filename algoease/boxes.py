@@ -0,0 +1,164 @@
+"""
+Box codec for AlgoEase bounty boxes.
+
+Box name: "bounty_" + Itob(bounty_id)
+
+V2 layout (contracts/algoease_bounty_escrow_v2.py):
+    creator(32) | freelancer(32) | amount(8) | status(1) | task_desc
+
+V5 layout (algoease_approval_v5.teal):
+    creator(32) | freelancer(32) | verifier(32) | amount(8) | deadline(8) | status(1) | task_desc
+
+V7 (contracts/algoease_approval_v7.teal) keeps the V5 layout and adds sweep_expired.
+"""
+
+from dataclasses import dataclass, field, replace
+from typing import Dict, FrozenSet, Optional
+
+from algosdk import encoding
+
+BOX_PREFIX = b"bounty_"
+BOX_NAME_LENGTH = len(BOX_PREFIX) + 8
+ZERO_ADDRESS_BYTES = bytes(32)
+
+# Each box reference grants 1KB of box I/O budget
+BOX_IO_BUDGET = 1024
+
+# ============================================================================
+# Layouts
+# ============================================================================
+
+@dataclass(frozen=True)
+class BoxLayout:
+    """Byte offsets and status codes of one contract version's bounty box"""
+    name: str
+    amount_offset: int
+    status_offset: int
+    statuses: Dict[int, str]
+    terminal: FrozenSet[str]
+    verifier_offset: Optional[int] = None
+    deadline_offset: Optional[int] = None
+
+    @property
+    def task_desc_offset(self) -> int:
+        return self.status_offset + 1
+
+    def status_code(self, name: str) -> int:
+        for code, status_name in self.statuses.items():
+            if status_name == name:
+                return code
+        raise KeyError(f"{self.name} contract has no {name} status")
+
+
+V2 = BoxLayout(
+    name="v2",
+    amount_offset=64,
+    status_offset=72,
+    statuses={0: "OPEN", 1: "ACCEPTED", 2: "SUBMITTED", 3: "APPROVED", 4: "REJECTED"},
+    terminal=frozenset({"APPROVED", "REJECTED"}),
+)
+
+V5 = BoxLayout(
+    name="v5",
+    amount_offset=96,
+    status_offset=112,
+    statuses={0: "OPEN", 1: "ACCEPTED", 2: "APPROVED", 3: "CLAIMED",
+              4: "REFUNDED", 5: "REJECTED", 6: "SUBMITTED"},
+    terminal=frozenset({"CLAIMED", "REFUNDED", "REJECTED"}),
+    verifier_offset=64,
+    deadline_offset=104,
+)
+
+V7 = replace(V5, name="v7")
+
+LAYOUTS = {layout.name: layout for layout in (V2, V5, V7)}
+
+# ============================================================================
+# Box names
+# ============================================================================
+
+def box_name(bounty_id: int) -> bytes:
+    """Generate box name: "bounty_" + Itob(bounty_id)"""
+    return BOX_PREFIX + bounty_id.to_bytes(8, 'big')
+
+
+def bounty_id_from_box_name(name: bytes) -> Optional[int]:
+    """Inverse of box_name(); None for boxes that are not bounty boxes"""
+    if len(name) != BOX_NAME_LENGTH or not name.startswith(BOX_PREFIX):
+        return None
+    return int.from_bytes(name[len(BOX_PREFIX):], 'big')
+
+
+def box_refs_needed(box_size: int) -> int:
+    """Box references required to cover the I/O budget of a box of this size"""
+    return max(1, -(-box_size // BOX_IO_BUDGET))
+
+# ============================================================================
+# Bounty records
+# ============================================================================
+
+@dataclass
+class Bounty:
+    """Decoded bounty box"""
+    bounty_id: int
+    creator: str
+    freelancer: Optional[str]
+    amount: int
+    status: int
+    task_desc: str
+    layout: BoxLayout = field(default=V2, repr=False)
+    verifier: Optional[str] = None
+    deadline: Optional[int] = None
+
+    @property
+    def status_name(self) -> str:
+        return self.layout.statuses.get(self.status, f"UNKNOWN({self.status})")
+
+    @property
+    def is_terminal(self) -> bool:
+        return self.status_name in self.layout.terminal
+
+
+def _address(raw: bytes) -> Optional[str]:
+    return None if raw == ZERO_ADDRESS_BYTES else encoding.encode_address(raw)
+
+
+def _raw_address(address: Optional[str]) -> bytes:
+    return ZERO_ADDRESS_BYTES if not address else encoding.decode_address(address)
+
+
+def decode_bounty(bounty_id: int, value: bytes, layout: BoxLayout = V2) -> Bounty:
+    """Decode a raw bounty box value"""
+    if len(value) < layout.task_desc_offset:
+        raise ValueError(f"Bounty box {bounty_id} is {len(value)} bytes, "
+                         f"{layout.name} layout needs at least {layout.task_desc_offset}")
+
+    amount_end = layout.amount_offset + 8
+    bounty = Bounty(
+        bounty_id=bounty_id,
+        creator=encoding.encode_address(value[0:32]),
+        freelancer=_address(value[32:64]),
+        amount=int.from_bytes(value[layout.amount_offset:amount_end], 'big'),
+        status=value[layout.status_offset],
+        task_desc=value[layout.task_desc_offset:].decode('utf-8', errors='replace'),
+        layout=layout,
+    )
+    if layout.verifier_offset is not None:
+        bounty.verifier = _address(value[layout.verifier_offset:layout.verifier_offset + 32])
+    if layout.deadline_offset is not None:
+        bounty.deadline = int.from_bytes(value[layout.deadline_offset:layout.deadline_offset + 8], 'big')
+    return bounty
+
+
+def encode_bounty(bounty: Bounty) -> bytes:
+    """Pack a Bounty back into its box value (inverse of decode_bounty)"""
+    layout = bounty.layout
+    parts = [_raw_address(bounty.creator), _raw_address(bounty.freelancer)]
+    if layout.verifier_offset is not None:
+        parts.append(_raw_address(bounty.verifier))
+    parts.append(bounty.amount.to_bytes(8, 'big'))
+    if layout.deadline_offset is not None:
+        parts.append((bounty.deadline or 0).to_bytes(8, 'big'))
+    parts.append(bytes([bounty.status]))
+    parts.append(bounty.task_desc.encode('utf-8'))
+    return b"".join(parts)
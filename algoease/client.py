@@ -0,0 +1,180 @@
+"""
+Shared Algorand client configuration for AlgoEase tooling.
+
+Every script in this repo used to re-declare the same .env loader,
+AlgoNode endpoints and app ID lookup. They live here once so that
+tools can simply do:
+
+    from algoease.client import get_algod_client, get_app_id
+"""
+
+import os
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from algosdk import kmd
+from algosdk.v2client import algod, indexer
+
+from algoease.failover import FailoverAlgodClient, FailoverIndexerClient
+from algoease.ratelimit import DEFAULT_RATE, MAX_RETRIES, LimitedAlgodClient, LimitedIndexerClient
+
+# ============================================================================
+# Defaults
+# ============================================================================
+DEFAULT_ALGOD_ADDRESS = "https://testnet-api.algonode.cloud"
+DEFAULT_INDEXER_ADDRESS = "https://testnet-idx.algonode.cloud"
+
+# AlgoKit LocalNet (algokit localnet start)
+LOCALNET_ALGOD_ADDRESS = "http://localhost:4001"
+LOCALNET_KMD_ADDRESS = "http://localhost:4002"
+LOCALNET_TOKEN = "a" * 64
+LOCALNET_WALLET = "unencrypted-default-wallet"
+
+# Per-endpoint retries when several endpoints are configured
+FAILOVER_RETRIES = 1
+
+# Earlier files take precedence over later ones (contract.env wins)
+ENV_FILES = ("contract.env", "frontend/.env")
+
+# ============================================================================
+# Environment
+# ============================================================================
+
+def load_env_file(filepath):
+    """Simple .env file loader"""
+    env_vars = {}
+    if os.path.exists(filepath):
+        with open(filepath, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith('#') and '=' in line:
+                    key, value = line.split('=', 1)
+                    value = value.strip('"\'')
+                    env_vars[key] = value
+    return env_vars
+
+
+def update_env_file(filepath: str, values: Dict[str, str]) -> bool:
+    """
+    Set keys in an .env file, keeping every other line as it is.
+    The file is replaced atomically and left untouched when nothing changes.
+    """
+    lines = []
+    if os.path.exists(filepath):
+        with open(filepath, 'r') as f:
+            lines = f.readlines()
+
+    pending = dict(values)
+    updated = []
+    for line in lines:
+        key = line.split('=', 1)[0].strip()
+        if '=' in line and key in pending:
+            line = f"{key}={pending.pop(key)}\n"
+        updated.append(line)
+    if updated and not updated[-1].endswith('\n'):
+        updated[-1] += '\n'
+    updated.extend(f"{key}={value}\n" for key, value in pending.items())
+
+    if updated == lines:
+        return False
+    os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
+    tmp_path = f"{filepath}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        f.writelines(updated)
+    os.replace(tmp_path, filepath)
+    return True
+
+
+def load_config(env_files: Sequence[str] = ENV_FILES) -> Dict[str, str]:
+    """Merge the env files with os.environ as the lowest-priority fallback"""
+    config = dict(os.environ)
+    for filepath in reversed(env_files):
+        config.update(load_env_file(filepath))
+    return config
+
+
+def get_app_id(config: Optional[Dict[str, str]] = None) -> int:
+    """Deployed AlgoEase app ID from contract.env / frontend/.env"""
+    config = load_config() if config is None else config
+    app_id = config.get('REACT_APP_CONTRACT_APP_ID') or config.get('CONTRACT_APP_ID')
+    if not app_id:
+        raise ValueError("REACT_APP_CONTRACT_APP_ID not found in contract.env or frontend/.env")
+    return int(app_id)
+
+
+def get_creator_mnemonic(config: Optional[Dict[str, str]] = None) -> str:
+    """Creator mnemonic from contract.env / frontend/.env"""
+    config = load_config() if config is None else config
+    words = config.get('REACT_APP_CREATOR_MNEMONIC') or config.get('CREATOR_MNEMONIC')
+    if not words:
+        raise ValueError("REACT_APP_CREATOR_MNEMONIC not found in contract.env or frontend/.env")
+    return words
+
+# ============================================================================
+# Clients
+# ============================================================================
+
+def _is_local(address: str) -> bool:
+    return any(host in address for host in ("://localhost", "://127.0.0.1", "://[::1]"))
+
+
+def _endpoints(addresses: str, tokens: str) -> List[Tuple[str, str]]:
+    """(address, token) pairs from comma-separated lists; a single token applies to every address"""
+    address_list = [a.strip() for a in addresses.split(',') if a.strip()]
+    token_list = tokens.split(',') if ',' in tokens else [tokens] * len(address_list)
+    if len(token_list) != len(address_list):
+        raise ValueError(f"{len(address_list)} endpoints but {len(token_list)} tokens")
+    return list(zip(address_list, (t.strip() for t in token_list)))
+
+
+def _algod(address: str, token: str, retries: int = MAX_RETRIES) -> algod.AlgodClient:
+    if _is_local(address):
+        return algod.AlgodClient(token, address)
+    return LimitedAlgodClient(token, address, rate=float(os.getenv('ALGOD_RATE', DEFAULT_RATE)), retries=retries)
+
+
+def _indexer(address: str, token: str, retries: int = MAX_RETRIES) -> indexer.IndexerClient:
+    if _is_local(address):
+        return indexer.IndexerClient(token, address)
+    return LimitedIndexerClient(token, address, rate=float(os.getenv('INDEXER_RATE', DEFAULT_RATE)), retries=retries)
+
+
+def get_algod_client(address: Optional[str] = None, token: Optional[str] = None) -> algod.AlgodClient:
+    """
+    Algod client for ALGOD_URL (defaults to AlgoNode TestNet).
+    Remote endpoints get the host-wide rate limiter (see ratelimit.py); a
+    comma-separated list of endpoints gets hedging and failover (see failover.py).
+    """
+    address = address or os.getenv('ALGOD_URL', DEFAULT_ALGOD_ADDRESS)
+    token = token if token is not None else os.getenv('ALGOD_TOKEN', '')
+    endpoints = _endpoints(address, token)
+    if len(endpoints) == 1:
+        return _algod(*endpoints[0])
+    # Other endpoints take over on failure, so each one gives up quickly
+    return FailoverAlgodClient([(_algod(a, t, retries=FAILOVER_RETRIES), a) for a, t in endpoints])
+
+
+def get_indexer_client(address: Optional[str] = None, token: Optional[str] = None) -> indexer.IndexerClient:
+    """
+    Indexer client for INDEXER_URL (defaults to AlgoNode TestNet).
+    Remote endpoints get the host-wide rate limiter (see ratelimit.py); a
+    comma-separated list of endpoints gets hedging and failover (see failover.py).
+    """
+    address = address or os.getenv('INDEXER_URL', DEFAULT_INDEXER_ADDRESS)
+    token = token if token is not None else os.getenv('INDEXER_TOKEN', '')
+    endpoints = _endpoints(address, token)
+    if len(endpoints) == 1:
+        return _indexer(*endpoints[0])
+    return FailoverIndexerClient([(_indexer(a, t, retries=FAILOVER_RETRIES), a) for a, t in endpoints])
+
+
+def get_localnet_dispenser(algod_client: algod.AlgodClient) -> Tuple[str, str]:
+    """(address, private_key) of the richest genesis account in the LocalNet KMD wallet"""
+    kmd_client = kmd.KMDClient(LOCALNET_TOKEN, LOCALNET_KMD_ADDRESS)
+    wallet_id = next(w['id'] for w in kmd_client.list_wallets() if w['name'] == LOCALNET_WALLET)
+    handle = kmd_client.init_wallet_handle(wallet_id, "")
+    try:
+        addresses = kmd_client.list_keys(handle)
+        address = max(addresses, key=lambda a: algod_client.account_info(a)['amount'])
+        return address, kmd_client.export_key(handle, "", address)
+    finally:
+        kmd_client.release_wallet_handle(handle)
@@ -0,0 +1,194 @@
+"""
+Content-addressed build cache for AlgoEase programs.
+
+Two steps used to run on every deploy:
+1. PyTeal -> TEAL (running the contract module's __main__)
+2. TEAL -> bytecode (a round trip to algod's compile endpoint, or the
+   offline assembler in algoease.assembler when no client is given)
+
+Both are now cached under .teal-cache/, keyed on a SHA-256 of their
+inputs, so a step only runs when its inputs change:
+- PyTeal: contract source, TEAL version and PyTeal version
+- TEAL:   TEAL source and the algod build that assembles it
+
+Usage:
+    from algoease.compile import compile_teal
+    approval_program = compile_teal(algod_client, "contracts/algoease_bounty_escrow_v2_approval.teal")
+    approval_program = compile_teal(None, "contracts/algoease_bounty_escrow_v2_approval.teal")  # offline
+
+    python -m algoease.compile contracts/algoease_bounty_escrow_v2.py
+"""
+
+import base64
+import hashlib
+import importlib.util
+import json
+import os
+import sys
+from importlib.metadata import version as package_version
+from typing import Dict, Optional, Tuple
+
+from algoease.assembler import assemble
+
+CACHE_DIR = os.getenv('TEAL_CACHE_DIR', '.teal-cache')
+DEFAULT_TEAL_VERSION = 8
+
+# algod build string per algod address, fetched once per process
+_compiler_versions: Dict[str, str] = {}
+
+# ============================================================================
+# Cache store
+# ============================================================================
+
+class BuildCache:
+    """Files named by the hash of their inputs; writes are atomic"""
+
+    def __init__(self, root: str = CACHE_DIR):
+        self.root = root
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str, suffix: str) -> str:
+        return os.path.join(self.root, key[:2], key + suffix)
+
+    def get(self, key: str, suffix: str) -> Optional[bytes]:
+        try:
+            with open(self._path(key, suffix), 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return data
+
+    def put(self, key: str, suffix: str, data: bytes) -> None:
+        path = self._path(key, suffix)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+
+_default_cache: Optional[BuildCache] = None
+
+
+def default_cache() -> BuildCache:
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = BuildCache()
+    return _default_cache
+
+
+def cache_key(*parts) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        data = part if isinstance(part, bytes) else str(part).encode('utf-8')
+        digest.update(len(data).to_bytes(8, 'big'))
+        digest.update(data)
+    return digest.hexdigest()
+
+# ============================================================================
+# TEAL -> bytecode
+# ============================================================================
+
+def compiler_version(client) -> str:
+    """algod build that assembles TEAL, e.g. "algod-3.24.0-a1b2c3d4" """
+    address = getattr(client, 'algod_address', '')
+    if address not in _compiler_versions:
+        build = client.versions().get('build', {})
+        _compiler_versions[address] = "algod-{}.{}.{}-{}".format(
+            build.get('major'), build.get('minor'), build.get('build_number'), build.get('commit_hash'))
+    return _compiler_versions[address]
+
+
+def compile_teal(client, source_file: Optional[str] = None, source: Optional[str] = None,
+                 cache: Optional[BuildCache] = None) -> bytes:
+    """
+    Compile TEAL file (or source string) to bytes, reusing a cached build when the inputs match.
+    With client=None the program is assembled locally; the bytes are the same algod would return.
+    """
+    if source is None:
+        if not os.path.exists(source_file):
+            raise FileNotFoundError(f"TEAL file not found: {source_file}")
+        with open(source_file, "r") as f:
+            source = f.read()
+
+    if client is None:
+        return assemble(source)
+
+    cache = cache or default_cache()
+    key = cache_key("teal", source, compiler_version(client))
+    program = cache.get(key, ".bin")
+    if program is None:
+        compile_response = client.compile(source)
+        program = base64.b64decode(compile_response["result"])
+        cache.put(key, ".bin", program)
+    return program
+
+# ============================================================================
+# PyTeal -> TEAL
+# ============================================================================
+
+def _load_contract(contract_path: str):
+    name = "_algoease_contract_" + hashlib.sha1(contract_path.encode()).hexdigest()[:8]
+    spec = importlib.util.spec_from_file_location(name, contract_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def build_pyteal(contract_path: str, teal_version: int = DEFAULT_TEAL_VERSION,
+                 cache: Optional[BuildCache] = None, write: bool = True) -> Tuple[str, str]:
+    """
+    Approval and clear TEAL for a PyTeal contract module.
+    With write=True the TEAL is written next to the contract as
+    <name>_approval.teal / <name>_clear.teal (only when it changed).
+    """
+    import pyteal
+
+    with open(contract_path, 'rb') as f:
+        contract_source = f.read()
+
+    cache = cache or default_cache()
+    key = cache_key("pyteal", contract_source, teal_version, package_version("pyteal"))
+    cached = cache.get(key, ".json")
+    if cached is not None:
+        programs = json.loads(cached)
+    else:
+        module = _load_contract(contract_path)
+        programs = {
+            "approval": pyteal.compileTeal(module.approval_program(), mode=pyteal.Mode.Application,
+                                           version=teal_version),
+            "clear": pyteal.compileTeal(module.clear_state_program(), mode=pyteal.Mode.Application,
+                                        version=teal_version),
+        }
+        cache.put(key, ".json", json.dumps(programs).encode('utf-8'))
+
+    if write:
+        stem = os.path.splitext(contract_path)[0]
+        for kind in ("approval", "clear"):
+            _write_if_changed(f"{stem}_{kind}.teal", programs[kind])
+    return programs["approval"], programs["clear"]
+
+
+def _write_if_changed(path: str, content: str) -> None:
+    if os.path.exists(path):
+        with open(path, 'r') as f:
+            if f.read() == content:
+                return
+    with open(path, 'w') as f:
+        f.write(content)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python -m algoease.compile <contract.py> [teal_version]")
+        sys.exit(1)
+    contract = sys.argv[1]
+    version = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_TEAL_VERSION
+    build_cache = default_cache()
+    build_pyteal(contract, version, build_cache)
+    state = "cached" if build_cache.hits else "compiled"
+    stem = os.path.splitext(contract)[0]
+    print(f"Smart contracts {state}: {stem}_approval.teal, {stem}_clear.teal")
@@ -0,0 +1,146 @@
+"""
+Live bounty dashboard over a local box cache.
+
+Instead of re-reading the whole app after every action, the dashboard:
+1. loads every bounty box once
+2. long-polls algod for the next round (status/wait-for-block-after)
+3. reads that block and collects the bounty boxes our app's calls
+   referenced (box refs of outer and inner app calls)
+4. re-reads only those boxes and redraws
+
+An idle round costs the wait plus one block read; a busy one adds one
+box read per bounty that was touched.
+"""
+
+import sys
+import time
+from collections import Counter, deque
+from datetime import datetime
+from typing import Deque, Dict, Iterable, Optional, Set, TextIO, Tuple
+
+from algoease.boxes import V2, Bounty, BoxLayout, bounty_id_from_box_name
+from algoease.state import get_bounty, iter_bounties
+from algoease.wire import get_block
+
+CLEAR_SCREEN = "\033[2J\033[H"
+RECENT_TRANSITIONS = 10
+
+# (round, bounty_id, old status name or None for new, new status name or None for deleted)
+Transition = Tuple[int, int, Optional[str], Optional[str]]
+
+
+def _app_calls(txns: Iterable[dict]) -> Iterable[dict]:
+    """Every application call in a block's transactions, inner calls included"""
+    for stxn in txns:
+        txn = stxn.get("txn", {})
+        if txn.get("type") == "appl":
+            yield txn
+        yield from _app_calls(stxn.get("dt", {}).get("itx", []))
+
+
+def touched_bounty_ids(block: dict, app_id: int) -> Set[int]:
+    """Bounty boxes our app's calls in this block could have written"""
+    ids = set()
+    for txn in _app_calls(block.get("txns", [])):
+        if txn.get("apid") != app_id:
+            continue
+        foreign = txn.get("apfa", [])
+        for ref in txn.get("apbx", []):
+            index = ref.get("i", 0)
+            if index and (index > len(foreign) or foreign[index - 1] != app_id):
+                continue
+            bounty_id = bounty_id_from_box_name(ref.get("n", b""))
+            if bounty_id is not None:
+                ids.add(bounty_id)
+    return ids
+
+
+class Dashboard:
+
+    def __init__(self, client, app_id: int, layout: BoxLayout = V2, history: int = RECENT_TRANSITIONS):
+        self.client = client
+        self.app_id = app_id
+        self.layout = layout
+        self.bounties: Dict[int, Bounty] = {}
+        self.transitions: Deque[Transition] = deque(maxlen=history)
+        self.round = 0
+        self.requests = 0
+
+    # ------------------------------------------------------------------ cache
+
+    def load(self) -> None:
+        """Fill the cache from the chain"""
+        self.round = self.client.status()["last-round"]
+        self.bounties = {b.bounty_id: b for b in iter_bounties(self.client, self.app_id, self.layout)}
+        self.requests += 2 + len(self.bounties)
+
+    def refresh(self, bounty_ids: Iterable[int], round_number: int) -> None:
+        """Re-read these boxes and record any status change"""
+        for bounty_id in sorted(bounty_ids):
+            bounty = get_bounty(self.client, self.app_id, bounty_id, self.layout)
+            self.requests += 1
+            old = self.bounties.get(bounty_id)
+            old_status = old.status_name if old else None
+            new_status = bounty.status_name if bounty else None
+            if old_status != new_status:
+                self.transitions.append((round_number, bounty_id, old_status, new_status))
+            if bounty is None:
+                self.bounties.pop(bounty_id, None)
+            else:
+                self.bounties[bounty_id] = bounty
+
+    def next_round(self) -> Set[int]:
+        """Block until the next round, apply it, and return the bounty IDs it touched"""
+        status = self.client.status_after_block(self.round)
+        self.requests += 1
+        touched: Set[int] = set()
+        for round_number in range(self.round + 1, status["last-round"] + 1):
+            block = get_block(self.client, round_number)
+            self.requests += 1
+            ids = touched_bounty_ids(block, self.app_id)
+            self.refresh(ids, round_number)
+            touched |= ids
+        self.round = max(self.round, status["last-round"])
+        return touched
+
+    # ----------------------------------------------------------------- render
+
+    def status_counts(self) -> Counter:
+        return Counter(b.status_name for b in self.bounties.values())
+
+    def locked_value(self) -> int:
+        """microAlgos still escrowed by bounties that are not finished"""
+        return sum(b.amount for b in self.bounties.values() if not b.is_terminal)
+
+    def render(self) -> str:
+        counts = self.status_counts()
+        lines = [
+            "=" * 80,
+            f"ALGOEASE LIVE DASHBOARD   app {self.app_id}   round {self.round}   "
+            f"{datetime.now().strftime('%H:%M:%S')}",
+            "=" * 80,
+            f"Bounties:      {len(self.bounties)}",
+            "Status:        " + "  ".join(f"{name} {counts.get(name, 0)}"
+                                          for name in self.layout.statuses.values()),
+            f"Locked value:  {self.locked_value() / 1_000_000:,.6f} ALGO",
+            "",
+            "Recent transitions:",
+        ]
+        if not self.transitions:
+            lines.append("   (none yet)")
+        for round_number, bounty_id, old, new in reversed(self.transitions):
+            lines.append(f"   round {round_number:>10}  bounty {bounty_id:>6}  {old or 'NEW':<10} -> {new or 'DELETED'}")
+        lines += ["", f"algod requests: {self.requests}", "=" * 80]
+        return "\n".join(lines)
+
+    def run(self, out: TextIO = sys.stdout, clear: bool = True) -> None:
+        """Redraw after every round until interrupted"""
+        self.load()
+        while True:
+            out.write((CLEAR_SCREEN if clear else "") + self.render() + "\n")
+            out.flush()
+            try:
+                self.next_round()
+            except Exception as e:
+                out.write(f"[WARN] {e}; retrying\n")
+                time.sleep(2)
@@ -0,0 +1,342 @@
+"""
+Idempotent deploy engine for AlgoEase contracts.
+
+The old deploy scripts each created a new app on every run and rewrote
+the .env files, so every redeploy orphaned the previous app (and any
+funds escrowed in it). This engine deploys only what changed:
+
+1. Programs are assembled offline (algoease.assembler), so their hashes
+   are known without a node.
+2. Every app recorded in contract-info*.json for the target network is
+   looked up; a live app with the same approval / clear bytes and schema
+   is reused instead of creating a new one.
+3. Networks are deployed in parallel. Every app that gets created is
+   recorded in the contract's registry file, even if another network
+   fails, so a rerun picks it up instead of deploying again.
+4. The .env files are only touched when the published app changed, and
+   each file is replaced atomically.
+
+Usage:
+    python -m algoease.deploy v2
+    python -m algoease.deploy v2 --network testnet --network localnet --publish testnet
+    python -m algoease.deploy v5 --dry-run
+"""
+
+import argparse
+import base64
+import glob
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from algosdk import account, error, mnemonic, transaction
+from algosdk.logic import get_application_address
+
+from algoease.assembler import program_address
+from algoease.client import (
+    DEFAULT_ALGOD_ADDRESS, DEFAULT_INDEXER_ADDRESS, LOCALNET_ALGOD_ADDRESS, LOCALNET_TOKEN,
+    get_algod_client, get_creator_mnemonic, get_localnet_dispenser, load_config, update_env_file,
+)
+from algoease.compile import build_pyteal, compile_teal
+from algoease.wire import wait_for_confirmation
+
+REGISTRY_PATTERN = "contract-info*.json"
+
+# ============================================================================
+# Contracts and networks
+# ============================================================================
+
+@dataclass(frozen=True)
+class ContractSpec:
+    name: str
+    approval: str
+    clear: str
+    info_file: str
+    global_uints: int = 1       # bounty_count; bounties live in boxes
+    global_bytes: int = 0
+    pyteal: Optional[str] = None  # rebuilt into approval / clear before deploying
+
+
+CONTRACTS: Dict[str, ContractSpec] = {spec.name: spec for spec in (
+    ContractSpec("default", "contracts/algoease_approval.teal", "contracts/algoease_clear.teal",
+                 "contract-info.json"),
+    ContractSpec("v2", "contracts/algoease_bounty_escrow_v2_approval.teal",
+                 "contracts/algoease_bounty_escrow_v2_clear.teal", "contract-info-bounty-escrow-v2.json",
+                 pyteal="contracts/algoease_bounty_escrow_v2.py"),
+    ContractSpec("v4", "contracts/algoease_approval_v4.teal", "contracts/algoease_clear_v4.teal",
+                 "contract-info-v3.json"),
+    ContractSpec("v5", "algoease_approval_v5.teal", "algoease_clear_v5.teal", "contract-info-v5.json"),
+    ContractSpec("v6", "contracts/algoease_approval_v6.teal", "contracts/algoease_clear_v6.teal",
+                 "contract-info-v6.json"),
+    ContractSpec("v7", "contracts/algoease_approval_v7.teal", "contracts/algoease_clear_v7.teal",
+                 "contract-info-v7.json"),
+    ContractSpec("bounty_escrow", "contracts/algoease_bounty_escrow_approval.teal",
+                 "contracts/algoease_bounty_escrow_clear.teal", "contract-info-bounty-escrow.json"),
+)}
+
+
+@dataclass(frozen=True)
+class Network:
+    name: str
+    algod_url: str
+    indexer_url: str
+    token: str = ""
+
+
+NETWORKS: Dict[str, Network] = {network.name: network for network in (
+    Network("testnet", DEFAULT_ALGOD_ADDRESS, DEFAULT_INDEXER_ADDRESS),
+    Network("mainnet", "https://mainnet-api.algonode.cloud", "https://mainnet-idx.algonode.cloud"),
+    Network("localnet", LOCALNET_ALGOD_ADDRESS, "http://localhost:8980", LOCALNET_TOKEN),
+)}
+
+# .env file -> (app ID key, app address key); files other than contract.env are only updated if present
+ENV_TARGETS = {
+    "contract.env": ("REACT_APP_CONTRACT_APP_ID", "REACT_APP_CONTRACT_ADDRESS"),
+    "frontend/.env": ("REACT_APP_CONTRACT_APP_ID", "REACT_APP_CONTRACT_ADDRESS"),
+    "frontend/.env.local": ("REACT_APP_CONTRACT_APP_ID", "REACT_APP_CONTRACT_ADDRESS"),
+    "backend/.env": ("CONTRACT_APP_ID", "CONTRACT_ADDRESS"),
+}
+
+
+@dataclass
+class DeployResult:
+    network: str
+    app_id: Optional[int] = None
+    reused: bool = False
+    txid: Optional[str] = None
+    error: Optional[str] = None
+    record: Dict[str, object] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.app_id is not None
+
+# ============================================================================
+# Registry (contract-info*.json)
+# ============================================================================
+
+def load_registry(pattern: str = REGISTRY_PATTERN) -> List[Dict[str, object]]:
+    """
+    Every app recorded in the registry files. A file holds one record at the
+    top level (network defaults to testnet) plus optional per-network records
+    under "deployments".
+    """
+    records = []
+    for path in sorted(glob.glob(pattern)):
+        try:
+            with open(path, 'r') as f:
+                info = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if not isinstance(info, dict):
+            continue
+        entries = [info] + list(info.get("deployments", {}).values())
+        for entry in entries:
+            if entry.get("appId"):
+                records.append(dict(entry, network=entry.get("network", "testnet"), source=path))
+    return records
+
+
+def write_registry(spec: ContractSpec, results: Sequence[DeployResult], primary: Optional[str]) -> bool:
+    """Merge successful deployments into the contract's registry file"""
+    info: Dict[str, object] = {}
+    if os.path.exists(spec.info_file):
+        with open(spec.info_file, 'r') as f:
+            info = json.load(f)
+    deployments = dict(info.get("deployments", {}))
+    legacy = {k: v for k, v in info.items() if k != "deployments"}
+    if legacy.get("appId"):
+        deployments.setdefault(legacy.get("network", "testnet"), legacy)
+
+    for result in results:
+        if result.ok:
+            deployments[result.network] = result.record
+    top = deployments.get(primary) or legacy or next(iter(deployments.values()), {})
+    updated = dict(top, deployments=deployments)
+    if updated == info:
+        return False
+    _atomic_write(spec.info_file, json.dumps(updated, indent=2) + "\n")
+    return True
+
+
+def _atomic_write(path: str, content: str) -> None:
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+# ============================================================================
+# Deploy
+# ============================================================================
+
+def load_programs(spec: ContractSpec) -> Tuple[bytes, bytes]:
+    """Approval and clear program bytes, rebuilt from PyTeal first when the spec has a source"""
+    if spec.pyteal:
+        try:
+            build_pyteal(spec.pyteal)
+        except ImportError:
+            print(f"[WARN] pyteal not installed, using the committed TEAL for {spec.name}")
+    return compile_teal(None, spec.approval), compile_teal(None, spec.clear)
+
+
+def find_live_app(client, spec: ContractSpec, network: str, approval: bytes, clear: bytes,
+                  registry: Sequence[Dict[str, object]]) -> Optional[int]:
+    """First registered app on this network whose programs and schema match"""
+    approval_hash = program_address(approval)
+    candidates = [r for r in registry if r["network"] == network]
+    # Records that already carry the hash are the likely match; legacy ones are checked after
+    candidates.sort(key=lambda r: r.get("approvalHash") != approval_hash)
+
+    seen = set()
+    for record in candidates:
+        app_id = int(record["appId"])
+        if app_id in seen:
+            continue
+        seen.add(app_id)
+        if record.get("approvalHash") not in (None, approval_hash):
+            continue
+        try:
+            params = client.application_info(app_id)["params"]
+        except error.AlgodHTTPError as e:
+            if e.code == 404:  # deleted
+                continue
+            raise
+        schema = params.get("global-state-schema", {})
+        if (params.get("approval-program") == _b64(approval) and params.get("clear-state-program") == _b64(clear)
+                and schema.get("num-uint", 0) == spec.global_uints
+                and schema.get("num-byte-slice", 0) == spec.global_bytes):
+            return app_id
+    return None
+
+
+def _b64(program: bytes) -> str:
+    return base64.b64encode(program).decode()
+
+
+def _network_key(client, network: Network) -> Tuple[str, str]:
+    """(address, private_key) that deploys to this network"""
+    if network.name == "localnet":
+        return get_localnet_dispenser(client)
+    private_key = mnemonic.to_private_key(get_creator_mnemonic(load_config()))
+    return account.address_from_private_key(private_key), private_key
+
+
+def deploy(spec: ContractSpec, network: Network, approval: bytes, clear: bytes,
+           registry: Sequence[Dict[str, object]], force: bool = False, dry_run: bool = False) -> DeployResult:
+    """Reuse a matching live app on this network, or create one"""
+    result = DeployResult(network.name)
+    try:
+        client = get_algod_client(network.algod_url, network.token)
+        app_id = None if force else find_live_app(client, spec, network.name, approval, clear, registry)
+        sender = None
+        if app_id is not None:
+            result.reused = True
+        elif not dry_run:
+            sender, private_key = _network_key(client, network)
+            txn = transaction.ApplicationCreateTxn(
+                sender=sender,
+                sp=client.suggested_params(),
+                on_complete=transaction.OnComplete.NoOpOC,
+                approval_program=approval,
+                clear_program=clear,
+                global_schema=transaction.StateSchema(spec.global_uints, spec.global_bytes),
+                local_schema=transaction.StateSchema(0, 0),
+            )
+            result.txid = client.send_transaction(txn.sign(private_key))
+            app_id = wait_for_confirmation(client, result.txid, 10)["application-index"]
+        result.app_id = app_id
+    except Exception as e:
+        result.error = str(e)
+        return result
+
+    if app_id is not None:
+        previous = next((r for r in registry if r["network"] == network.name and int(r["appId"]) == app_id), {})
+        record = {k: v for k, v in previous.items() if k not in ("source", "deployments")}
+        record.update({
+            "appId": app_id,
+            "appAddress": get_application_address(app_id),
+            "network": network.name,
+            "version": spec.name,
+            "algodUrl": network.algod_url,
+            "indexerUrl": network.indexer_url,
+            "approvalHash": program_address(approval),
+            "clearHash": program_address(clear),
+        })
+        if not result.reused:
+            record.update({"deployedAt": datetime.now().isoformat(), "creator": sender,
+                           "transactionId": result.txid})
+        result.record = record
+    return result
+
+
+def deploy_networks(spec: ContractSpec, networks: Sequence[Network], force: bool = False,
+                    dry_run: bool = False) -> List[DeployResult]:
+    """Deploy one contract to several networks in parallel"""
+    approval, clear = load_programs(spec)
+    registry = load_registry()
+    with ThreadPoolExecutor(max_workers=len(networks)) as pool:
+        futures = [pool.submit(deploy, spec, network, approval, clear, registry, force, dry_run)
+                   for network in networks]
+        return [future.result() for future in futures]
+
+
+def publish(spec: ContractSpec, results: Sequence[DeployResult], primary: Optional[str]) -> List[str]:
+    """Record deployments in the registry and point the .env files at the primary network's app"""
+    changed = []
+    if write_registry(spec, results, primary):
+        changed.append(spec.info_file)
+    published = next((r for r in results if r.network == primary and r.ok), None)
+    if published is None:
+        return changed
+    for path, (id_key, address_key) in ENV_TARGETS.items():
+        if path != "contract.env" and not os.path.exists(path):
+            continue
+        if update_env_file(path, {id_key: str(published.app_id), address_key: published.record["appAddress"]}):
+            changed.append(path)
+    return changed
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Deploy an AlgoEase contract, reusing unchanged apps")
+    parser.add_argument("contract", choices=sorted(CONTRACTS))
+    parser.add_argument("--network", action="append", choices=sorted(NETWORKS),
+                        help="Repeat to deploy to several networks (default: testnet)")
+    parser.add_argument("--publish", help="Network whose app the .env files point at (default: first network)")
+    parser.add_argument("--force", action="store_true", help="Create a new app even if a matching one exists")
+    parser.add_argument("--dry-run", action="store_true", help="Report what would happen, change nothing")
+    args = parser.parse_args(argv)
+
+    spec = CONTRACTS[args.contract]
+    network_names = args.network or ["testnet"]
+    primary = args.publish or network_names[0]
+
+    print("\n" + "=" * 70)
+    print(f"DEPLOYING ALGOEASE CONTRACT: {spec.name}")
+    print("=" * 70)
+    results = deploy_networks(spec, [NETWORKS[name] for name in network_names], args.force, args.dry_run)
+
+    for result in results:
+        if result.error:
+            print(f"   [FAIL] {result.network}: {result.error}")
+        elif result.reused:
+            print(f"   [OK] {result.network}: unchanged, reusing app {result.app_id}")
+        elif result.app_id is None:
+            print(f"   [DRY RUN] {result.network}: programs changed, would create a new app")
+        else:
+            print(f"   [OK] {result.network}: created app {result.app_id} (txn {result.txid})")
+
+    if not args.dry_run:
+        changed = publish(spec, results, primary)
+        print("\nUpdated: " + (", ".join(changed) if changed else "nothing, configuration already current"))
+    return 0 if all(r.error is None for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+"""
+Partitioned Parquet export of bounty transitions and payments.
+
+Reads the local history log (algoease.history) and writes two tables:
+
+    transitions   round, time, txid, bounty_id, method, status, sender, amount
+    payments      round, time, txid, bounty_id, receiver, amount
+
+Rows are written as Arrow record batches of at most BATCH_ROWS rows, so
+memory stays bounded however long the history is. Files are partitioned
+by round range:
+
+    <out>/transitions/rounds=12300000-12399999/part-12345678.parquet
+
+Each part file is named after the first round it covers. A manifest
+(<out>/_export.json) records the round and log offset the last export
+reached. The next export resumes reading the log at that offset and only
+adds new part files. A rerun after a crash rewrites the same part names,
+so rows are never duplicated.
+
+    python -m algoease.export [--app-id 749707697] [--history history-749707697.jsonl] \\
+        [--out bounty-export] [--sync]
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import Dict, List, Optional, Sequence, TextIO
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from algoease.client import get_app_id, get_indexer_client
+from algoease.history import METHOD_STATUS, Event, HistoryLog
+
+PARTITION_ROUNDS = 100_000
+BATCH_ROWS = 65_536
+MANIFEST = "_export.json"
+
+_TIME = pa.timestamp("s", tz="UTC")
+SCHEMAS = {
+    "transitions": pa.schema([
+        ("round", pa.uint64()), ("time", _TIME), ("txid", pa.string()), ("bounty_id", pa.uint64()),
+        ("method", pa.dictionary(pa.int8(), pa.string())), ("status", pa.dictionary(pa.int8(), pa.string())),
+        ("sender", pa.string()), ("amount", pa.uint64()),
+    ]),
+    "payments": pa.schema([
+        ("round", pa.uint64()), ("time", _TIME), ("txid", pa.string()), ("bounty_id", pa.int64()),
+        ("receiver", pa.string()), ("amount", pa.uint64()),
+    ]),
+}
+
+
+def partition_of(round_number: int, partition_rounds: int = PARTITION_ROUNDS) -> str:
+    start = round_number // partition_rounds * partition_rounds
+    return f"rounds={start}-{start + partition_rounds - 1}"
+
+
+def rows(event: Event) -> Dict[str, List[tuple]]:
+    """Transition and payment rows for one event"""
+    status = METHOD_STATUS.get(event.method)
+    transitions = [(event.round, event.time, event.txid, bounty_id, event.method, status, event.sender, event.amount)
+                   for bounty_id in event.bounties]
+    payments = [(event.round, event.time, event.txid, bounty_id, receiver, amount)
+                for bounty_id, receiver, amount in event.payouts()]
+    return {"transitions": transitions, "payments": payments}
+
+
+class PartitionWriter:
+    """Buffers one table's rows and writes them as record batches into per-partition part files"""
+
+    def __init__(self, out_dir: str, table: str, partition_rounds: int = PARTITION_ROUNDS,
+                 batch_rows: int = BATCH_ROWS):
+        self.root = os.path.join(out_dir, table)
+        self.schema = SCHEMAS[table]
+        self.partition_rounds = partition_rounds
+        self.batch_rows = batch_rows
+        self.files: List[str] = []
+        self.rows = 0
+        self._partition: Optional[str] = None
+        self._writer: Optional[pq.ParquetWriter] = None
+        self._path = ""
+        self._buffer: List[tuple] = []
+
+    def add(self, row: tuple) -> None:
+        partition = partition_of(row[0], self.partition_rounds)
+        if partition != self._partition:
+            self._close()
+            self._open(partition, row[0])
+        self._buffer.append(row)
+        if len(self._buffer) >= self.batch_rows:
+            self._flush()
+
+    def _open(self, partition: str, first_round: int) -> None:
+        directory = os.path.join(self.root, partition)
+        os.makedirs(directory, exist_ok=True)
+        self._partition = partition
+        self._path = os.path.join(directory, f"part-{first_round}.parquet")
+        self._writer = pq.ParquetWriter(f"{self._path}.tmp", self.schema)
+
+    def _flush(self) -> None:
+        if not self._buffer:
+            return
+        columns = list(zip(*self._buffer))
+        arrays = [pa.array(column, type=field.type) for column, field in zip(columns, self.schema)]
+        self._writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=self.schema))
+        self.rows += len(self._buffer)
+        self._buffer = []
+
+    def _close(self) -> None:
+        if self._writer is None:
+            return
+        self._flush()
+        self._writer.close()
+        os.replace(f"{self._path}.tmp", self._path)
+        self.files.append(self._path)
+        self._writer = None
+        self._partition = None
+
+    def close(self) -> None:
+        self._close()
+
+
+def load_manifest(out_dir: str) -> dict:
+    path = os.path.join(out_dir, MANIFEST)
+    if not os.path.exists(path):
+        return {"round": 0, "offset": 0}
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _save_manifest(out_dir: str, manifest: dict) -> None:
+    path = os.path.join(out_dir, MANIFEST)
+    with open(f"{path}.tmp", 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(f"{path}.tmp", path)
+
+
+def export(log: HistoryLog, out_dir: str, partition_rounds: int = PARTITION_ROUNDS,
+           batch_rows: int = BATCH_ROWS) -> Dict[str, List[str]]:
+    """Write every event the last export has not; returns the new part files per table"""
+    manifest = load_manifest(out_dir)
+    if manifest.get("app_id", log.app_id) != log.app_id:
+        raise ValueError(f"{out_dir} holds an export of app {manifest['app_id']}, not {log.app_id}")
+    to_round, to_offset = log.cursor()
+    if to_round <= manifest["round"]:
+        return {table: [] for table in SCHEMAS}
+
+    os.makedirs(out_dir, exist_ok=True)
+    writers = {table: PartitionWriter(out_dir, table, partition_rounds, batch_rows) for table in SCHEMAS}
+    for event in log.events(offset=manifest["offset"], max_round=to_round):
+        for table, table_rows in rows(event).items():
+            for row in table_rows:
+                writers[table].add(row)
+    for writer in writers.values():
+        writer.close()
+    exported = manifest.get("rows", {})
+    _save_manifest(out_dir, {"app_id": log.app_id, "round": to_round, "offset": to_offset,
+                             "rows": {table: exported.get(table, 0) + writer.rows for table, writer in writers.items()}})
+    return {table: writer.files for table, writer in writers.items()}
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main(argv: Optional[Sequence[str]] = None, out: TextIO = sys.stdout) -> int:
+    parser = argparse.ArgumentParser(description="Export bounty transitions and payments to partitioned Parquet")
+    parser.add_argument("--app-id", type=int, help="app to export (default: configured app)")
+    parser.add_argument("--history", help="history log (default: history-<app_id>.jsonl)")
+    parser.add_argument("--out", default="bounty-export", help="output directory (default: bounty-export)")
+    parser.add_argument("--sync", action="store_true", help="sync the history log from the indexer first")
+    parser.add_argument("--partition-rounds", type=int, default=PARTITION_ROUNDS,
+                        help=f"rounds per partition (default: {PARTITION_ROUNDS})")
+    args = parser.parse_args(argv)
+
+    log = HistoryLog(args.app_id or get_app_id(), args.history)
+    if args.sync:
+        log.sync(get_indexer_client())
+    written = export(log, args.out, args.partition_rounds)
+    for table, files in written.items():
+        print(f"{table}: {len(files)} new part files", file=out)
+    print(f"Exported through round {load_manifest(args.out)['round']}", file=out)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
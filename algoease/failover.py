@@ -0,0 +1,196 @@
+"""
+Hedged requests and failover across several algod / indexer endpoints.
+
+ALGOD_URL and INDEXER_URL may list several endpoints separated by commas;
+get_algod_client() / get_indexer_client() then return a client that
+spreads requests over them without any change at the call sites:
+
+- every endpoint keeps a window of response latencies and the last round
+  it reported; reads go to the fastest endpoint that is not behind
+- a read still running after that endpoint's p95 latency gets a hedged
+  duplicate on the next endpoint, and the first answer wins
+- a connection error, 5xx, 429 or open circuit moves the request on to the
+  next endpoint instead of failing it
+- an endpoint more than MAX_ROUND_LAG rounds behind the best one is left
+  out until PROBE_INTERVAL has passed, then tried again as a fallback
+- after require_round(R), typically with a write's confirmed round, reads
+  prefer endpoints that have reported round R, so a client reads its own
+  writes even when one node lags
+
+Writes (POSTs such as send_raw_transaction) are neither hedged nor
+failed over: a send that timed out may still have been accepted, and
+replaying it elsewhere would fail with "already in ledger". A write goes
+to the best endpoint only and raises its error unchanged.
+Status/wait-for-block-after long-polls are neither hedged nor counted in
+the latency window.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, List, Optional, Sequence, Tuple
+
+from algosdk.v2client import algod, indexer
+
+from algoease.ratelimit import is_retryable
+
+LATENCY_WINDOW = 200
+MIN_SAMPLES = 20
+DEFAULT_HEDGE_DELAY = 0.5    # seconds, until an endpoint has MIN_SAMPLES latencies
+MAX_ROUND_LAG = 2
+PROBE_INTERVAL = 30.0
+MAX_WORKERS = 16
+
+ROUND_KEYS = ("last-round", "current-round", "round")
+LONG_POLL_PREFIX = "/status/wait-for-block-after"
+
+
+class Endpoint:
+    """One node: its client, latency window and last reported round"""
+
+    def __init__(self, client, address: str):
+        self.client = client
+        self.address = address
+        self.latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self.last_round = 0
+        self.round_seen_at = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, latency: float, response: Any) -> None:
+        with self._lock:
+            self.latencies.append(latency)
+            if isinstance(response, dict):
+                round_number = next((response[key] for key in ROUND_KEYS if isinstance(response.get(key), int)), None)
+                if round_number is not None:
+                    self.last_round = max(self.last_round, round_number)
+                    self.round_seen_at = time.monotonic()
+
+    def p95(self) -> Optional[float]:
+        with self._lock:
+            if len(self.latencies) < MIN_SAMPLES:
+                return None
+            ordered = sorted(self.latencies)
+        return ordered[int(0.95 * (len(ordered) - 1))]
+
+    def hedge_delay(self) -> float:
+        p95 = self.p95()
+        return DEFAULT_HEDGE_DELAY if p95 is None else p95
+
+    def __repr__(self) -> str:
+        return f"Endpoint({self.address}, round={self.last_round}, p95={self.p95()})"
+
+
+class EndpointPool:
+
+    def __init__(self, endpoints: Sequence[Endpoint], max_workers: int = MAX_WORKERS):
+        if not endpoints:
+            raise ValueError("at least one endpoint is required")
+        self.endpoints = list(endpoints)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="algoease-hedge")
+        self.hedges = 0
+        self.failovers = 0
+        self.min_round = 0
+
+    def ranked(self) -> List[Endpoint]:
+        """Endpoints that are caught up, fastest first; those short of min_round next; stale laggards last"""
+        best_round = max(e.last_round for e in self.endpoints)
+        now = time.monotonic()
+        current, short, probes = [], [], []
+        for endpoint in self.endpoints:
+            # An endpoint that has not reported a round yet is not known to be behind
+            behind = endpoint.last_round and best_round - endpoint.last_round > MAX_ROUND_LAG
+            if behind:
+                if now - endpoint.round_seen_at > PROBE_INTERVAL:
+                    probes.append(endpoint)
+            elif endpoint.last_round and endpoint.last_round < self.min_round:
+                short.append(endpoint)
+            else:
+                current.append(endpoint)
+        # Endpoints without enough samples sort first so they get measured
+        current.sort(key=lambda e: e.p95() or 0.0)
+        short.sort(key=lambda e: -e.last_round)
+        return current + short + probes
+
+    def require_round(self, round_number: int) -> None:
+        """Prefer endpoints at or past round_number from now on"""
+        self.min_round = max(self.min_round, round_number)
+
+    def _timed(self, endpoint: Endpoint, call: Callable[[Any], Any], record: bool):
+        start = time.monotonic()
+        response = call(endpoint.client)
+        if record:
+            endpoint.record(time.monotonic() - start, response)
+        return response
+
+    def request(self, call: Callable[[Any], Any], hedge: bool = True, record: bool = True,
+                failover: bool = True):
+        """Run call(client) on the best endpoint, hedging and failing over as needed"""
+        candidates = iter(self.ranked())
+        running = {}
+        last_error: Optional[Exception] = None
+
+        def launch() -> Optional[Endpoint]:
+            endpoint = next(candidates, None)
+            if endpoint is not None:
+                running[self.executor.submit(self._timed, endpoint, call, record)] = endpoint
+            return endpoint
+
+        primary = launch()
+        hedged = not hedge
+        while running:
+            timeout = None if hedged else primary.hedge_delay()
+            done, _ = wait(list(running), timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                hedged = True
+                if launch() is not None:
+                    self.hedges += 1
+                continue
+            for future in done:
+                running.pop(future)
+                try:
+                    return future.result()
+                except Exception as e:
+                    if not failover or not is_retryable(e):
+                        raise
+                    last_error = e
+            if not running:
+                if launch() is None:
+                    break
+                self.failovers += 1
+        raise last_error or RuntimeError("no endpoint available")
+
+
+class FailoverAlgodClient(algod.AlgodClient):
+    """AlgodClient over an EndpointPool of per-endpoint clients"""
+
+    def __init__(self, endpoints: Sequence[Tuple[Any, str]]):
+        first_client, first_address = endpoints[0]
+        super().__init__(first_client.algod_token, first_address)
+        self.pool = EndpointPool([Endpoint(client, address) for client, address in endpoints])
+
+    def require_round(self, round_number: int) -> None:
+        self.pool.require_round(round_number)
+
+    def algod_request(self, method, requrl, params=None, data=None, headers=None, response_format="json", timeout=30):
+        long_poll = requrl.startswith(LONG_POLL_PREFIX)
+        return self.pool.request(
+            lambda client: client.algod_request(method, requrl, params, data, headers, response_format, timeout),
+            hedge=method == "GET" and not long_poll, record=not long_poll, failover=method == "GET")
+
+
+class FailoverIndexerClient(indexer.IndexerClient):
+    """IndexerClient over an EndpointPool of per-endpoint clients"""
+
+    def __init__(self, endpoints: Sequence[Tuple[Any, str]]):
+        first_client, first_address = endpoints[0]
+        super().__init__(first_client.indexer_token, first_address)
+        self.pool = EndpointPool([Endpoint(client, address) for client, address in endpoints])
+
+    def require_round(self, round_number: int) -> None:
+        self.pool.require_round(round_number)
+
+    def indexer_request(self, method, requrl, params=None, data=None, headers=None, timeout=30):
+        return self.pool.request(
+            lambda client: client.indexer_request(method, requrl, params, data, headers, timeout),
+            hedge=method == "GET", failover=method == "GET")
@@ -0,0 +1,265 @@
+"""
+Local history of an AlgoEase app's calls.
+
+Each AlgoEase app call in the indexer is reduced to one Event line in a
+JSONL file (history-<app_id>.jsonl). The line holds the round, block time,
+method, sender, the bounty IDs the call touched, the amount and deadline
+of a create, and the inner payments the call made. sync() appends only
+the rounds after the last synced one, so analytics and exports read
+months of history from disk instead of paging the indexer again.
+
+A sidecar cursor file (<path>.cursor) records the last complete round and
+the byte length of the log at that point. An interrupted sync is truncated
+back to that length on the next run, so a round is never half-written or
+duplicated.
+
+    python -m algoease.history [--app-id 749707697] [--path history-749707697.jsonl]
+"""
+
+import argparse
+import base64
+import json
+import os
+import sys
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+from algoease.boxes import bounty_id_from_box_name
+from algoease.client import get_app_id, get_indexer_client
+
+PAGE_LIMIT = 1000
+
+CREATE = "create_bounty"
+SWEEP = "sweep_expired"
+
+# Status a bounty is in after each call succeeds
+METHOD_STATUS = {
+    CREATE: "OPEN",
+    "accept_bounty": "ACCEPTED",
+    "submit_bounty": "SUBMITTED",
+    "approve_bounty": "APPROVED",
+    "reject_bounty": "REJECTED",
+    "claim": "CLAIMED",
+    "refund": "REFUNDED",
+    "auto_refund": "REFUNDED",
+    SWEEP: "REFUNDED",
+}
+
+
+@dataclass
+class Event:
+    """One confirmed app call"""
+    round: int
+    time: int
+    txid: str
+    method: str
+    sender: str
+    bounties: List[int]
+    amount: int = 0                  # escrowed by create_bounty
+    deadline: int = 0                # create_bounty on V5+ contracts
+    paid: List[Tuple[str, int]] = field(default_factory=list)    # inner payments (receiver, microAlgos)
+    task_desc: str = ""              # create_bounty
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, line: str) -> "Event":
+        data = json.loads(line)
+        data["paid"] = [tuple(p) for p in data["paid"]]
+        return cls(**data)
+
+    def payouts(self) -> List[Tuple[int, str, int]]:
+        """(bounty_id, receiver, amount) per inner payment"""
+        if self.method == SWEEP:
+            # sweep_expired pays refunds in the order it logs the refunded IDs
+            return [(bounty_id, receiver, amount) for bounty_id, (receiver, amount) in zip(self.bounties, self.paid)]
+        bounty_id = self.bounties[0] if self.bounties else -1
+        return [(bounty_id, receiver, amount) for receiver, amount in self.paid]
+
+# ============================================================================
+# Parsing indexer transactions
+# ============================================================================
+
+def _app_calls(txn: dict, app_id: int) -> Iterator[dict]:
+    """Calls to app_id in this transaction tree; inner calls from other apps included"""
+    if txn.get("tx-type") == "appl" and txn.get("application-transaction", {}).get("application-id") == app_id:
+        yield txn
+    for inner in txn.get("inner-txns", []):
+        yield from _app_calls(inner, app_id)
+
+
+def _bounty_ids(call: dict, app_id: int, method: str, args: Sequence[bytes], logs: Sequence[bytes]) -> List[int]:
+    if method == SWEEP:
+        refunded = logs[-1] if logs else b""
+        return [int.from_bytes(refunded[i:i + 8], 'big') for i in range(0, len(refunded) - 7, 8)]
+    if method != CREATE and len(args) > 1 and len(args[1]) == 8:
+        return [int.from_bytes(args[1], 'big')]
+    # create_bounty's ID is the contract counter; the box it writes names it
+    ids = []
+    for ref in call.get("application-transaction", {}).get("box-references", []):
+        bounty_id = bounty_id_from_box_name(base64.b64decode(ref.get("name", "")))
+        if ref.get("app", 0) in (0, app_id) and bounty_id is not None:
+            ids.append(bounty_id)
+    return ids[:1]
+
+
+def parse_transaction(txn: dict, app_id: int) -> List[Event]:
+    """Events for every call to app_id in one indexer transaction"""
+    events = []
+    for call in _app_calls(txn, app_id):
+        app_txn = call["application-transaction"]
+        args = [base64.b64decode(a) for a in app_txn.get("application-args", [])]
+        if not args:
+            continue
+        method = args[0].decode('utf-8', errors='replace')
+        logs = [base64.b64decode(log) for log in call.get("logs", [])]
+        event = Event(
+            round=call.get("confirmed-round", txn.get("confirmed-round", 0)),
+            time=call.get("round-time", txn.get("round-time", 0)),
+            txid=call.get("id") or txn.get("id", ""),
+            method=method,
+            sender=call.get("sender", ""),
+            bounties=_bounty_ids(call, app_id, method, args, logs),
+            paid=[(inner["payment-transaction"]["receiver"], inner["payment-transaction"]["amount"])
+                  for inner in call.get("inner-txns", []) if inner.get("tx-type") == "pay"],
+        )
+        if method == CREATE and len(args) > 1:
+            # V2: amount, task_desc; V5+: amount, deadline, task_desc
+            event.amount = int.from_bytes(args[1], 'big')
+            if len(args) > 3:
+                event.deadline = int.from_bytes(args[2], 'big')
+            event.task_desc = args[-1].decode('utf-8', errors='replace') if len(args) > 2 else ""
+        events.append(event)
+    return events
+
+# ============================================================================
+# Local log
+# ============================================================================
+
+class HistoryLog:
+    """Append-only JSONL of one app's events with a crash-safe round cursor"""
+
+    def __init__(self, app_id: int, path: Optional[str] = None):
+        self.app_id = app_id
+        self.path = path or f"history-{app_id}.jsonl"
+        self.cursor_path = f"{self.path}.cursor"
+
+    def _load_cursor(self) -> Dict[str, int]:
+        if not os.path.exists(self.cursor_path):
+            return {"round": 0, "offset": 0, "next_bounty_id": 0}
+        with open(self.cursor_path, 'r') as f:
+            return json.load(f)
+
+    def cursor(self) -> Tuple[int, int]:
+        """(last complete round, log length in bytes at that round)"""
+        cursor = self._load_cursor()
+        return cursor["round"], cursor["offset"]
+
+    @property
+    def round(self) -> int:
+        return self.cursor()[0]
+
+    def _save_cursor(self, round_number: int, offset: int, next_bounty_id: int) -> None:
+        tmp_path = f"{self.cursor_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({"app_id": self.app_id, "round": round_number, "offset": offset,
+                       "next_bounty_id": next_bounty_id}, f)
+        os.replace(tmp_path, self.cursor_path)
+
+    def entries(self, offset: int = 0) -> Iterator[Tuple[Event, int]]:
+        """(event, byte offset just past it) for every synced event from a byte offset on"""
+        _, end = self.cursor()
+        if offset >= end:
+            return
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            position = offset
+            for line in f:
+                # Anything past the cursor is the tail of an interrupted sync
+                position += len(line)
+                if position > end:
+                    break
+                yield Event.from_json(line.decode()), position
+
+    def events(self, min_round: int = 0, max_round: Optional[int] = None, offset: int = 0) -> Iterator[Event]:
+        """Stream synced events in round order, starting at a byte offset from an earlier cursor()"""
+        for event, _ in self.entries(offset):
+            if event.round < min_round:
+                continue
+            if max_round is not None and event.round > max_round:
+                break
+            yield event
+
+    def sync(self, indexer, to_round: Optional[int] = None) -> int:
+        """Append every event after the cursor up to to_round (default: indexer tip); returns events added"""
+        cursor = self._load_cursor()
+        start, offset, next_bounty_id = cursor["round"], cursor["offset"], cursor["next_bounty_id"]
+        target = to_round if to_round is not None else indexer.health()["round"]
+        if target <= start:
+            return 0
+        added = 0
+        buffered: List[Event] = []
+        with open(self.path, 'a+b') as f:
+            f.truncate(offset)
+            f.seek(offset)
+
+            saved_next_id = next_bounty_id
+
+            def flush(complete_round: int) -> None:
+                nonlocal added, buffered, saved_next_id
+                done = [e for e in buffered if e.round <= complete_round]
+                buffered = [e for e in buffered if e.round > complete_round]
+                f.write(b"".join(e.to_json().encode() + b"\n" for e in done))
+                f.flush()
+                os.fsync(f.fileno())
+                added += len(done)
+                creates = [e.bounties[0] for e in done if e.method == CREATE]
+                if creates:
+                    saved_next_id = creates[-1] + 1
+                self._save_cursor(complete_round, f.tell(), saved_next_id)
+
+            for page in self._pages(indexer, start + 1, target):
+                for txn in page:
+                    for event in parse_transaction(txn, self.app_id):
+                        if event.method == CREATE:
+                            # Indexers without box references: follow the contract's bounty counter
+                            if not event.bounties:
+                                event.bounties = [next_bounty_id]
+                            next_bounty_id = event.bounties[0] + 1
+                        buffered.append(event)
+                # The indexer returns rounds in order, so every round before the page's last is complete
+                if page and buffered:
+                    flush(page[-1]["confirmed-round"] - 1)
+            flush(target)
+        return added
+
+    def _pages(self, indexer, min_round: int, max_round: int) -> Iterator[List[dict]]:
+        next_page = None
+        while True:
+            response = indexer.search_transactions(application_id=self.app_id, min_round=min_round,
+                                                   max_round=max_round, limit=PAGE_LIMIT, next_page=next_page)
+            transactions = response.get("transactions", [])
+            yield transactions
+            next_page = response.get("next-token")
+            if not transactions or not next_page:
+                return
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main(argv: Optional[Sequence[str]] = None, out: TextIO = sys.stdout) -> int:
+    parser = argparse.ArgumentParser(description="Sync an AlgoEase app's call history to a local JSONL log")
+    parser.add_argument("--app-id", type=int, help="app to follow (default: configured app)")
+    parser.add_argument("--path", help="log file (default: history-<app_id>.jsonl)")
+    args = parser.parse_args(argv)
+
+    log = HistoryLog(args.app_id or get_app_id(), args.path)
+    added = log.sync(get_indexer_client())
+    print(f"{log.path}: {added} new events, synced to round {log.round}", file=out)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
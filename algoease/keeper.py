@@ -0,0 +1,273 @@
+"""
+Auto-refund keeper for the V5 contract.
+
+Keeps every open bounty's deadline in a min-heap and follows the chain
+block by block (status/wait-for-block-after). The contract compares a
+deadline with LatestTimestamp, the timestamp of the last committed
+block, so once a block's timestamp reaches a deadline the refund is
+valid in the very next round. Each round the keeper:
+1. re-reads the bounty boxes the round's app calls referenced
+   (new bounties join the heap, finished ones leave it)
+2. pops every deadline at or before the block timestamp
+3. packs the due auto_refund calls into atomic groups and confirms them
+4. checkpoints the heap and round to disk
+
+With --sweep (V7 contract) due bounties are refunded by sweep_expired
+calls, up to SWEEP_BATCH bounties and 4 creators each, instead of one
+auto_refund call per bounty. A batch also stops growing once its box
+references and opcode budget would need more calls than fit in a group.
+
+A restarted keeper resumes from the checkpoint and catches up on the
+rounds it missed instead of rescanning every box.
+
+    python -m algoease.keeper [--app-id 749689686] [--checkpoint keeper-checkpoint.json] [--once] [--sweep]
+"""
+
+import argparse
+import heapq
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, TextIO, Tuple
+
+from algosdk import account, mnemonic
+
+from algoease import operations
+from algoease.boxes import V5, Bounty, BoxLayout, box_refs_needed
+from algoease.client import get_algod_client, get_creator_mnemonic
+from algoease.dashboard import touched_bounty_ids
+from algoease.deploy import CONTRACTS, load_registry
+from algoease.packer import GroupPacker, OperationResult
+from algoease.state import get_bounty, iter_bounties
+from algoease.wire import get_block
+
+DEFAULT_CHECKPOINT = "keeper-checkpoint.json"
+SWEEP_BATCH = 64
+
+
+@dataclass(frozen=True)
+class PendingRefund:
+    """What an auto_refund call for one bounty needs"""
+    deadline: int
+    creator: str
+    box_size: int
+
+
+class Keeper:
+
+    def __init__(self, client, app_id: int, sender: str, private_key: str,
+                 checkpoint_path: str = DEFAULT_CHECKPOINT, layout: BoxLayout = V5,
+                 packer: Optional[GroupPacker] = None, sweep: bool = False):
+        self.client = client
+        self.app_id = app_id
+        self.sender = sender
+        self.private_key = private_key
+        self.checkpoint_path = checkpoint_path
+        self.layout = layout
+        self.packer = packer or GroupPacker(client)
+        self.sweep = sweep
+        self.pending: Dict[int, PendingRefund] = {}
+        self.round = 0
+        self.timestamp = 0
+        self._heap: List[Tuple[int, int]] = []
+
+    # ------------------------------------------------------------------ state
+
+    def track(self, bounty_id: int, bounty: Optional[Bounty]) -> None:
+        """Add, update or drop a bounty depending on whether it can still be refunded"""
+        if bounty is None or bounty.is_terminal or not bounty.deadline or bounty.amount == 0:
+            self.pending.pop(bounty_id, None)
+            return
+        entry = PendingRefund(bounty.deadline, bounty.creator,
+                              self.layout.task_desc_offset + len(bounty.task_desc.encode('utf-8')))
+        if self.pending.get(bounty_id) != entry:
+            self.pending[bounty_id] = entry
+            heapq.heappush(self._heap, (entry.deadline, bounty_id))
+
+    def load(self) -> None:
+        """Resume from the checkpoint, or scan every box when there is none"""
+        if self._restore():
+            return
+        self.round = self.client.status()["last-round"]
+        self.timestamp = get_block(self.client, self.round).get("ts", 0)
+        for bounty in iter_bounties(self.client, self.app_id, self.layout):
+            self.track(bounty.bounty_id, bounty)
+
+    def _restore(self) -> bool:
+        if not os.path.exists(self.checkpoint_path):
+            return False
+        with open(self.checkpoint_path, 'r') as f:
+            checkpoint = json.load(f)
+        if checkpoint.get("app_id") != self.app_id:
+            return False
+        self.round = checkpoint["round"]
+        self.timestamp = checkpoint["timestamp"]
+        self.pending = {int(bounty_id): PendingRefund(*entry) for bounty_id, entry in checkpoint["pending"].items()}
+        self._heap = [(entry.deadline, bounty_id) for bounty_id, entry in self.pending.items()]
+        heapq.heapify(self._heap)
+        return True
+
+    def checkpoint(self) -> None:
+        """Write the round and pending refunds; the file is replaced atomically"""
+        checkpoint = {
+            "app_id": self.app_id,
+            "round": self.round,
+            "timestamp": self.timestamp,
+            "pending": {str(bounty_id): [entry.deadline, entry.creator, entry.box_size]
+                        for bounty_id, entry in sorted(self.pending.items())},
+        }
+        tmp_path = f"{self.checkpoint_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(checkpoint, f)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    # ------------------------------------------------------------------ rounds
+
+    def follow(self) -> None:
+        """Block until the next round, then apply every round since the last one"""
+        status = self.client.status_after_block(self.round)
+        for round_number in range(self.round + 1, status["last-round"] + 1):
+            block = get_block(self.client, round_number)
+            for bounty_id in sorted(touched_bounty_ids(block, self.app_id)):
+                self.track(bounty_id, get_bounty(self.client, self.app_id, bounty_id, self.layout))
+            self.timestamp = block.get("ts", self.timestamp)
+            self.round = round_number
+
+    def due(self) -> List[int]:
+        """Pop every bounty whose deadline the chain clock has reached"""
+        ids = []
+        while self._heap and self._heap[0][0] <= self.timestamp:
+            deadline, bounty_id = heapq.heappop(self._heap)
+            entry = self.pending.get(bounty_id)
+            # Heap entries are never removed in place; skip ones that were superseded
+            if entry is not None and entry.deadline == deadline and bounty_id not in ids:
+                ids.append(bounty_id)
+        return ids
+
+    def _sweeps(self, bounty_ids: Sequence[int]) -> List[List[int]]:
+        """Split due bounties into sweep_expired batches of at most 4 creators that fit one group"""
+        batches: List[List[int]] = []
+        creators: List[set] = []
+        box_refs: List[int] = []
+        for bounty_id in bounty_ids:
+            entry = self.pending[bounty_id]
+            refs = box_refs_needed(entry.box_size)
+            for index, (batch, batch_creators) in enumerate(zip(batches, creators)):
+                accounts = len(batch_creators | {entry.creator})
+                if (len(batch) < SWEEP_BATCH and accounts <= operations.MAX_APP_TXN_ACCOUNTS
+                        and operations.sweep_calls(box_refs[index] + refs, len(batch) + 1,
+                                                   accounts) <= operations.MAX_GROUP_SIZE):
+                    break
+            else:
+                index, batch, batch_creators = len(batches), [], set()
+                batches.append(batch)
+                creators.append(batch_creators)
+                box_refs.append(0)
+            batch.append(bounty_id)
+            batch_creators.add(entry.creator)
+            box_refs[index] += refs
+        return batches
+
+    def _operations(self, sp, bounty_ids: Sequence[int]) -> List[operations.Operation]:
+        if self.sweep:
+            return [operations.sweep_expired(sp, self.app_id, self.sender, self.private_key,
+                                             [(i, self.pending[i].creator, self.pending[i].box_size) for i in batch],
+                                             ref=tuple(batch))
+                    for batch in self._sweeps(bounty_ids)]
+        return [operations.auto_refund(sp, self.app_id, self.sender, self.private_key, bounty_id,
+                                       self.pending[bounty_id].creator, self.pending[bounty_id].box_size,
+                                       ref=(bounty_id,))
+                for bounty_id in bounty_ids]
+
+    def refund(self, bounty_ids: Sequence[int]) -> List[OperationResult]:
+        """Send auto_refund (or sweep_expired) calls for these bounties in packed groups"""
+        if not bounty_ids:
+            return []
+        try:
+            sp = self.client.suggested_params()
+            self.packer.extend(self._operations(sp, bounty_ids))
+            results = self.packer.submit()
+        except Exception:
+            # Nothing was confirmed; put the deadlines back so the next round retries them
+            for bounty_id in bounty_ids:
+                heapq.heappush(self._heap, (self.pending[bounty_id].deadline, bounty_id))
+            raise
+        for result in results:
+            for bounty_id in result.operation.ref:
+                self.pending.pop(bounty_id, None)
+                # Re-read the box: refunded by someone else, or still due and retried next round.
+                # A sweep skips bounties it cannot refund; follow() re-reads those boxes.
+                if not result.ok:
+                    self.track(bounty_id, get_bounty(self.client, self.app_id, bounty_id, self.layout))
+        return results
+
+    def _refund_due(self) -> List[OperationResult]:
+        results = self.refund(self.due())
+        self.checkpoint()
+        return results
+
+    def step(self) -> List[OperationResult]:
+        self.follow()
+        return self._refund_due()
+
+    def run(self, out: TextIO = sys.stdout, once: bool = False) -> None:
+        """Refund due bounties every round until interrupted"""
+        self.load()
+        out.write(f"[INFO] app {self.app_id}: round {self.round}, {len(self.pending)} open bounties with deadlines\n")
+        results = self._attempt(self._refund_due, out)
+        while True:
+            for result in results:
+                ids = ", ".join(str(bounty_id) for bounty_id in result.operation.ref)
+                if result.ok:
+                    out.write(f"[OK] round {result.confirmed_round}: {result.operation.kind} bounties {ids}\n")
+                else:
+                    out.write(f"[FAIL] {result.operation.kind} bounties {ids}: {result.error}\n")
+            out.flush()
+            if once:
+                return
+            results = self._attempt(self.step, out)
+
+    @staticmethod
+    def _attempt(action: Callable[[], List[OperationResult]], out: TextIO) -> List[OperationResult]:
+        """Run one round's work; a failure is logged and the round retried by the next call"""
+        try:
+            return action()
+        except Exception as e:
+            out.write(f"[WARN] {e}; retrying\n")
+            time.sleep(2)
+            return []
+
+
+def _default_app_id(contract: str) -> Optional[int]:
+    records = load_registry(CONTRACTS[contract].info_file)
+    return int(records[0]["appId"]) if records else None
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Refund V5 bounties as soon as their deadlines pass")
+    parser.add_argument("--app-id", type=int, default=None,
+                        help="app to keep (default: contract-info-v5.json, or contract-info-v7.json with --sweep)")
+    parser.add_argument("--checkpoint", default=DEFAULT_CHECKPOINT, help="checkpoint file")
+    parser.add_argument("--once", action="store_true", help="refund what is due now and exit")
+    parser.add_argument("--sweep", action="store_true", help="refund with V7 sweep_expired batches")
+    args = parser.parse_args(argv)
+
+    contract = "v7" if args.sweep else "v5"
+    app_id = args.app_id or _default_app_id(contract)
+    if not app_id:
+        print(f"[ERROR] no --app-id given and {CONTRACTS[contract].info_file} has no appId")
+        return 2
+    private_key = mnemonic.to_private_key(get_creator_mnemonic())
+    keeper = Keeper(get_algod_client(), app_id, account.address_from_private_key(private_key), private_key,
+                    args.checkpoint, sweep=args.sweep)
+    try:
+        keeper.run(once=args.once)
+    except KeyboardInterrupt:
+        keeper.checkpoint()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
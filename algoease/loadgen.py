@@ -0,0 +1,314 @@
+"""
+LocalNet load generator for the AlgoEase V2 contract.
+
+Drives a configurable mix of create / accept / submit / approve / reject
+calls from many simulated accounts against a local algod and measures:
+- transactions and completed lifecycles per second
+- confirmation latency p50 / p95 / p99
+- failed-transaction rate
+- fee spend
+
+Each worker thread keeps one operation in flight, so concurrency is the
+number of workers. Bounties move through a local copy of the contract's
+state machine; a bounty is reserved while an operation on it is in
+flight so two workers never race on the same box.
+"""
+
+import random
+import threading
+import time
+from collections import Counter, defaultdict
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from algosdk import account, transaction
+from algosdk.logic import get_application_address
+from algosdk.transaction import wait_for_confirmation
+
+from algoease import operations
+from algoease.boxes import V2
+from algoease.compile import compile_teal
+from algoease.packer import GroupPacker
+from algoease.state import get_bounty_count
+
+V2_APPROVAL_TEAL = "contracts/algoease_bounty_escrow_v2_approval.teal"
+V2_CLEAR_TEAL = "contracts/algoease_bounty_escrow_v2_clear.teal"
+
+ACTIONS = ("create", "accept", "submit", "approve", "reject")
+DEFAULT_MIX = {"create": 3, "accept": 3, "submit": 3, "approve": 2, "reject": 1}
+
+# Seconds between suggested-params refreshes
+SP_REFRESH = 30.0
+
+# Status an action needs -> status it leaves behind
+TRANSITIONS = {
+    "accept": ("OPEN", "ACCEPTED"),
+    "submit": ("ACCEPTED", "SUBMITTED"),
+    "approve": ("SUBMITTED", "APPROVED"),
+    "reject": ("SUBMITTED", "REJECTED"),
+}
+
+# ============================================================================
+# Configuration and samples
+# ============================================================================
+
+@dataclass
+class LoadConfig:
+    accounts: int = 20
+    duration: float = 60.0
+    concurrency: int = 8
+    mix: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_MIX))
+    amount: int = 100_000              # microAlgos escrowed per bounty
+    account_funding: int = 20_000_000  # microAlgos per simulated account
+    app_funding: int = 50_000_000      # covers box minimum balance
+    app_id: Optional[int] = None       # None = deploy a fresh V2 app
+    seed: Optional[int] = None
+
+
+@dataclass
+class Sample:
+    action: str
+    txns: int
+    latency: float
+    ok: bool
+    fee: int = 0
+    error: Optional[str] = None
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def _latency_ms(latencies: List[float]) -> Dict[str, Optional[float]]:
+    def ms(value):
+        return None if value is None else round(value * 1000, 1)
+    return {
+        "p50": ms(percentile(latencies, 50)),
+        "p95": ms(percentile(latencies, 95)),
+        "p99": ms(percentile(latencies, 99)),
+        "max": ms(max(latencies) if latencies else None),
+    }
+
+# ============================================================================
+# Load generator
+# ============================================================================
+
+class LoadGenerator:
+
+    def __init__(self, client, config: LoadConfig, funder: Tuple[str, str]):
+        if config.accounts < 2:
+            raise ValueError("accept needs a freelancer other than the creator: use at least 2 accounts")
+        self.client = client
+        self.config = config
+        self.funder_address, self.funder_key = funder
+        self.random = random.Random(config.seed)
+        self.app_id = config.app_id
+        self.keys: Dict[str, str] = {}
+        self.samples: List[Sample] = []
+
+        self._lock = threading.Lock()
+        self._create_lock = threading.Lock()
+        self._pools: Dict[str, List[dict]] = defaultdict(list)
+        self._next_bounty_id = 0
+        self._sp = None
+        self._sp_fetched = 0.0
+
+    # ------------------------------------------------------------------ setup
+
+    def setup(self) -> None:
+        """Deploy (if needed) and fund the app and every simulated account"""
+        if self.app_id is None:
+            self.app_id = self._deploy()
+        sp = self.client.suggested_params()
+
+        packer = GroupPacker(self.client)
+        packer.add(operations.Operation("fund_app", [transaction.PaymentTxn(
+            self.funder_address, sp, get_application_address(self.app_id), self.config.app_funding)],
+            self.funder_key))
+        for _ in range(self.config.accounts):
+            key, address = account.generate_account()
+            self.keys[address] = key
+            packer.add(operations.Operation("fund_account", [transaction.PaymentTxn(
+                self.funder_address, sp, address, self.config.account_funding)], self.funder_key))
+        failed = [r.error for r in packer.submit() if not r.ok]
+        if failed:
+            raise RuntimeError(f"Funding failed: {failed[0]}")
+
+        self._next_bounty_id = get_bounty_count(self.client, self.app_id)
+
+    def _deploy(self) -> int:
+        approval = compile_teal(self.client, V2_APPROVAL_TEAL)
+        clear = compile_teal(self.client, V2_CLEAR_TEAL)
+        txn = transaction.ApplicationCreateTxn(
+            sender=self.funder_address,
+            sp=self.client.suggested_params(),
+            on_complete=transaction.OnComplete.NoOpOC,
+            approval_program=approval,
+            clear_program=clear,
+            global_schema=transaction.StateSchema(num_uints=1, num_byte_slices=0),
+            local_schema=transaction.StateSchema(num_uints=0, num_byte_slices=0),
+        )
+        txid = self.client.send_transaction(txn.sign(self.funder_key))
+        return wait_for_confirmation(self.client, txid, 10)["application-index"]
+
+    # -------------------------------------------------------------------- run
+
+    def run(self) -> dict:
+        """Run for config.duration seconds and return the report"""
+        if len(self.keys) < 2:
+            raise ValueError(f"{len(self.keys)} funded accounts, at least 2 needed: call setup() first")
+        started_at = datetime.now(timezone.utc).isoformat()
+        start = time.perf_counter()
+        stop_at = start + self.config.duration
+
+        workers = [threading.Thread(target=self._worker, args=(stop_at,), daemon=True)
+                   for _ in range(self.config.concurrency)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        return self.report(started_at, time.perf_counter() - start)
+
+    def _worker(self, stop_at: float) -> None:
+        while time.perf_counter() < stop_at:
+            picked = self._pick_action()
+            if picked is None:
+                time.sleep(0.05)
+                continue
+            self._execute(*picked)
+
+    def _pick_action(self):
+        with self._lock:
+            feasible = [a for a in ACTIONS if self.config.mix.get(a, 0) > 0 and
+                        (a == "create" or self._pools[TRANSITIONS[a][0]])]
+            if not feasible:
+                return None
+            action = self.random.choices(feasible, [self.config.mix[a] for a in feasible])[0]
+            if action == "create":
+                return action, None
+            pool = self._pools[TRANSITIONS[action][0]]
+            return action, pool.pop(self.random.randrange(len(pool)))
+
+    def _params(self) -> transaction.SuggestedParams:
+        """Suggested params, refreshed every SP_REFRESH seconds so validity never lapses"""
+        with self._lock:
+            if self._sp is None or time.perf_counter() - self._sp_fetched > SP_REFRESH:
+                self._sp = self.client.suggested_params()
+                self._sp_fetched = time.perf_counter()
+            return self._sp
+
+    def _build(self, action: str, bounty: Optional[dict]) -> operations.Operation:
+        sp, app_id = self._params(), self.app_id
+        if action == "accept":
+            candidates = [a for a in self.keys if a != bounty["creator"]]
+            freelancer = self.random.choice(candidates)
+            bounty["freelancer"] = freelancer
+            return operations.accept_bounty(sp, app_id, freelancer, self.keys[freelancer],
+                                            bounty["id"], bounty["size"])
+        if action == "submit":
+            return operations.submit_bounty(sp, app_id, bounty["freelancer"], self.keys[bounty["freelancer"]],
+                                            bounty["id"], bounty["size"])
+        if action == "approve":
+            return operations.approve_bounty(sp, app_id, bounty["creator"], self.keys[bounty["creator"]],
+                                             bounty["id"], bounty["freelancer"], bounty["size"])
+        return operations.reject_bounty(sp, app_id, bounty["creator"], self.keys[bounty["creator"]],
+                                        bounty["id"], box_size=bounty["size"])
+
+    def _send(self, op: operations.Operation) -> str:
+        txns = op.txns
+        if len(txns) > 1:
+            transaction.assign_group_id(txns)
+        signed = [txn.sign(op.private_key) for txn in txns]
+        self.client.send_transactions(signed)
+        return signed[-1].get_txid()
+
+    def _execute(self, action: str, bounty: Optional[dict]) -> None:
+        start = time.perf_counter()
+        op = None
+        try:
+            if action == "create":
+                creator = self.random.choice(list(self.keys))
+                task_desc = f"load test {self.random.getrandbits(32):08x}"
+                with self._create_lock:
+                    bounty = {"id": self._next_bounty_id, "creator": creator,
+                              "size": V2.task_desc_offset + len(task_desc)}
+                    op = operations.create_bounty(self._params(), self.app_id, creator, self.keys[creator],
+                                                  bounty["id"], self.config.amount, task_desc)
+                    txid = self._send(op)
+                    self._next_bounty_id += 1
+            else:
+                op = self._build(action, bounty)
+                txid = self._send(op)
+            wait_for_confirmation(self.client, txid, 10)
+        except Exception as e:
+            self._record(Sample(action, op.size if op else 0, time.perf_counter() - start, False,
+                                error=str(e)[:200]))
+            if action == "create":
+                self._resync_bounty_count()
+            else:
+                with self._lock:
+                    self._pools[TRANSITIONS[action][0]].append(bounty)
+            return
+
+        self._record(Sample(action, op.size, time.perf_counter() - start, True, fee=op.fee))
+        status = "OPEN" if action == "create" else TRANSITIONS[action][1]
+        if status not in V2.terminal:
+            with self._lock:
+                self._pools[status].append(bounty)
+
+    def _resync_bounty_count(self) -> None:
+        with self._create_lock:
+            try:
+                self._next_bounty_id = get_bounty_count(self.client, self.app_id)
+            except Exception:
+                pass
+
+    def _record(self, sample: Sample) -> None:
+        with self._lock:
+            self.samples.append(sample)
+
+    # ----------------------------------------------------------------- report
+
+    def report(self, started_at: str, elapsed: float) -> dict:
+        ok = [s for s in self.samples if s.ok]
+        failed = [s for s in self.samples if not s.ok]
+        confirmed_txns = sum(s.txns for s in ok)
+        lifecycles = sum(1 for s in ok if s.action in ("approve", "reject"))
+
+        actions = {}
+        for action in ACTIONS:
+            samples = [s for s in self.samples if s.action == action]
+            if not samples:
+                continue
+            latencies = [s.latency for s in samples if s.ok]
+            actions[action] = {
+                "attempted": len(samples),
+                "confirmed": len(latencies),
+                "failed": len(samples) - len(latencies),
+                "latency_ms": _latency_ms(latencies),
+                "fees_microalgos": sum(s.fee for s in samples),
+            }
+
+        return {
+            "started_at": started_at,
+            "duration_s": round(elapsed, 2),
+            "algod": self.client.algod_address,
+            "app_id": self.app_id,
+            "config": asdict(self.config),
+            "operations": {"attempted": len(self.samples), "confirmed": len(ok), "failed": len(failed)},
+            "confirmed_txns": confirmed_txns,
+            "tps": round(confirmed_txns / elapsed, 2) if elapsed else 0.0,
+            "lifecycles_per_s": round(lifecycles / elapsed, 2) if elapsed else 0.0,
+            "latency_ms": _latency_ms([s.latency for s in ok]),
+            "failure_rate": round(len(failed) / len(self.samples), 4) if self.samples else 0.0,
+            "fees_microalgos": sum(s.fee for s in ok),
+            "actions": actions,
+            "top_errors": Counter(s.error for s in failed).most_common(5),
+        }
@@ -0,0 +1,234 @@
+"""
+Transaction builders for AlgoEase contract calls.
+
+Each builder returns an Operation: the unsigned transactions for one
+contract action, the key that signs them and the resources they touch.
+Operations are plain data so they can be queued, packed into atomic
+groups (see packer.py) and submitted later.
+"""
+
+import copy
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Sequence, Set, Tuple
+
+from algosdk import constants, transaction
+from algosdk.logic import get_application_address
+
+from algoease.boxes import V2, box_name, box_refs_needed
+
+# ============================================================================
+# Protocol limits for a single application call
+# ============================================================================
+MAX_APP_TXN_ACCOUNTS = 4
+MAX_APP_TOTAL_TXN_REFERENCES = 8
+MAX_GROUP_SIZE = 16
+APP_CALL_OPCODE_BUDGET = 700
+
+# sweep_expired: opcodes spent per refunded bounty, and per call on dispatch
+SWEEP_COST_PER_BOUNTY = 100
+SWEEP_COST_PER_CALL = 100
+
+# ============================================================================
+# Operation
+# ============================================================================
+
+@dataclass
+class Operation:
+    """One AlgoEase action and the transactions that carry it"""
+    kind: str
+    txns: List[transaction.Transaction]
+    private_key: str
+    bounty_id: Optional[int] = None
+    inner_txns: int = 0
+    # create_bounty asserts GroupSize == 2, so it can never share a group
+    standalone: bool = False
+    # Caller-supplied tag, echoed back in OperationResult
+    ref: Any = None
+    txids: List[str] = field(default_factory=list, repr=False)
+
+    @property
+    def size(self) -> int:
+        return len(self.txns)
+
+    @property
+    def fee(self) -> int:
+        return sum(txn.fee for txn in self.txns)
+
+    @property
+    def box_refs(self) -> Set[Tuple[int, bytes]]:
+        """Named boxes as (app_id, name); these are pooled across a group"""
+        return {(txn.index, box.name) for txn in self.txns
+                for box in (getattr(txn, 'boxes', None) or []) if box.name}
+
+    @property
+    def budget_refs(self) -> int:
+        """Empty-name references that only add box I/O budget"""
+        return sum(1 for txn in self.txns
+                   for box in (getattr(txn, 'boxes', None) or []) if not box.name)
+
+    @property
+    def account_refs(self) -> Set[str]:
+        return {acct for txn in self.txns for acct in (getattr(txn, 'accounts', None) or [])}
+
+    def validate(self) -> None:
+        """Check per-transaction reference limits"""
+        for txn in self.txns:
+            if not isinstance(txn, transaction.ApplicationCallTxn):
+                continue
+            accounts = len(txn.accounts or [])
+            total = accounts + len(txn.boxes or []) + len(txn.foreign_apps or []) + len(txn.foreign_assets or [])
+            if accounts > MAX_APP_TXN_ACCOUNTS:
+                raise ValueError(f"{self.kind}: {accounts} account references, max {MAX_APP_TXN_ACCOUNTS}")
+            if total > MAX_APP_TOTAL_TXN_REFERENCES:
+                raise ValueError(f"{self.kind}: {total} references, max {MAX_APP_TOTAL_TXN_REFERENCES}")
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+def _flat_params(sp: transaction.SuggestedParams, inner_txns: int = 0) -> transaction.SuggestedParams:
+    """Flat fee covering the call itself plus its zero-fee inner payments"""
+    params = copy.copy(sp)
+    params.flat_fee = True
+    params.fee = (sp.min_fee or constants.MIN_TXN_FEE) * (1 + inner_txns)
+    return params
+
+
+def _boxes(app_id: int, bounty_id: int, box_size: Optional[int]) -> List[Tuple[int, bytes]]:
+    refs = [(app_id, box_name(bounty_id))]
+    if box_size is not None:
+        refs += [(0, b"")] * (box_refs_needed(box_size) - 1)
+    return refs
+
+
+def _app_call(sp, app_id, sender, method, bounty_id, box_size=None, accounts=None, inner_txns=0):
+    return transaction.ApplicationCallTxn(
+        sender=sender,
+        sp=_flat_params(sp, inner_txns),
+        index=app_id,
+        on_complete=transaction.OnComplete.NoOpOC,
+        app_args=[method, bounty_id.to_bytes(8, 'big')],
+        accounts=accounts,
+        boxes=_boxes(app_id, bounty_id, box_size),
+    )
+
+# ============================================================================
+# Builders (V2 contract)
+# ============================================================================
+
+def create_bounty(sp, app_id, sender, private_key, bounty_id, amount, task_desc, ref=None) -> Operation:
+    """
+    Payment to escrow + create_bounty call.
+    bounty_id must be the contract's current bounty_count (the box it will create).
+    """
+    task_bytes = task_desc.encode('utf-8')
+    pay_txn = transaction.PaymentTxn(
+        sender=sender,
+        sp=_flat_params(sp),
+        receiver=get_application_address(app_id),
+        amt=amount,
+    )
+    app_call_txn = transaction.ApplicationCallTxn(
+        sender=sender,
+        sp=_flat_params(sp),
+        index=app_id,
+        on_complete=transaction.OnComplete.NoOpOC,
+        app_args=[b"create_bounty", amount.to_bytes(8, 'big'), task_bytes],
+        boxes=_boxes(app_id, bounty_id, V2.task_desc_offset + len(task_bytes)),
+    )
+    return Operation("create_bounty", [pay_txn, app_call_txn], private_key,
+                     bounty_id=bounty_id, standalone=True, ref=ref)
+
+
+def accept_bounty(sp, app_id, sender, private_key, bounty_id, box_size=None, ref=None) -> Operation:
+    txn = _app_call(sp, app_id, sender, b"accept_bounty", bounty_id, box_size)
+    return Operation("accept_bounty", [txn], private_key, bounty_id=bounty_id, ref=ref)
+
+
+def submit_bounty(sp, app_id, sender, private_key, bounty_id, box_size=None, ref=None) -> Operation:
+    txn = _app_call(sp, app_id, sender, b"submit_bounty", bounty_id, box_size)
+    return Operation("submit_bounty", [txn], private_key, bounty_id=bounty_id, ref=ref)
+
+
+def approve_bounty(sp, app_id, sender, private_key, bounty_id, freelancer, box_size=None, ref=None) -> Operation:
+    """Freelancer must be referenced: the contract pays it with an inner payment"""
+    txn = _app_call(sp, app_id, sender, b"approve_bounty", bounty_id, box_size,
+                    accounts=[freelancer], inner_txns=1)
+    return Operation("approve_bounty", [txn], private_key, bounty_id=bounty_id, inner_txns=1, ref=ref)
+
+
+def reject_bounty(sp, app_id, sender, private_key, bounty_id, creator=None, box_size=None, ref=None) -> Operation:
+    """Refund goes to the creator, who is also the caller"""
+    txn = _app_call(sp, app_id, sender, b"reject_bounty", bounty_id, box_size,
+                    accounts=[creator or sender], inner_txns=1)
+    return Operation("reject_bounty", [txn], private_key, bounty_id=bounty_id, inner_txns=1, ref=ref)
+
+# ============================================================================
+# Builders (V5 contract)
+# ============================================================================
+
+def auto_refund(sp, app_id, sender, private_key, bounty_id, creator, box_size=None, ref=None) -> Operation:
+    """
+    Refund a bounty whose deadline has passed; anyone may send it.
+    The creator must be referenced: the contract refunds it with an inner payment.
+    """
+    txn = _app_call(sp, app_id, sender, b"auto_refund", bounty_id, box_size,
+                    accounts=[creator], inner_txns=1)
+    return Operation("auto_refund", [txn], private_key, bounty_id=bounty_id, inner_txns=1, ref=ref)
+
+
+# ============================================================================
+# Builders (V7 contract)
+# ============================================================================
+
+def sweep_calls(box_refs: int, bounties: int, creators: int) -> int:
+    """App calls a sweep_expired group needs for its box references and opcode budget"""
+    extra_boxes = max(0, box_refs - (MAX_APP_TOTAL_TXN_REFERENCES - creators))
+    return max(1 + -(-extra_boxes // MAX_APP_TOTAL_TXN_REFERENCES),
+               -(-(SWEEP_COST_PER_BOUNTY * bounties) // (APP_CALL_OPCODE_BUDGET - SWEEP_COST_PER_CALL)))
+
+
+def sweep_expired(sp, app_id, sender, private_key, refunds: Sequence[Tuple[int, str, int]], ref=None) -> Operation:
+    """
+    Refund many expired bounties with one sweep_expired call.
+    refunds: (bounty_id, creator, box_size) per bounty.
+
+    Creators must be referenced by the sweep call itself (accounts are not
+    shared across a group before AVM 9), so at most 4 distinct creators fit.
+    Trailing sweep_expired calls on the first ID carry the remaining box
+    references and opcode budget; by the time they run that bounty is
+    already settled, so they only skip it.
+    """
+    if not refunds:
+        raise ValueError("sweep_expired needs at least one bounty")
+    creators = list(dict.fromkeys(creator for _, creator, _ in refunds))
+    if len(creators) > MAX_APP_TXN_ACCOUNTS:
+        raise ValueError(f"sweep_expired: {len(creators)} creators, max {MAX_APP_TXN_ACCOUNTS} per call")
+
+    boxes = []
+    for bounty_id, _, box_size in refunds:
+        boxes += _boxes(app_id, bounty_id, box_size)
+    first_boxes = MAX_APP_TOTAL_TXN_REFERENCES - len(creators)
+    calls = sweep_calls(len(boxes), len(refunds), len(creators))
+    if calls > MAX_GROUP_SIZE:
+        raise ValueError(f"sweep_expired: {len(refunds)} bounties need {calls} calls, max {MAX_GROUP_SIZE}")
+
+    ids = b"".join(bounty_id.to_bytes(8, 'big') for bounty_id, _, _ in refunds)
+    txns = []
+    for index in range(calls):
+        if index == 0:
+            params, args, accounts, chunk = _flat_params(sp, len(refunds)), ids, creators, boxes[:first_boxes]
+        else:
+            start = first_boxes + (index - 1) * MAX_APP_TOTAL_TXN_REFERENCES
+            params, args, accounts = _flat_params(sp), ids[:8], None
+            chunk = boxes[start:start + MAX_APP_TOTAL_TXN_REFERENCES]
+        txns.append(transaction.ApplicationCallTxn(
+            sender=sender,
+            sp=params,
+            index=app_id,
+            on_complete=transaction.OnComplete.NoOpOC,
+            app_args=[b"sweep_expired", args],
+            accounts=accounts,
+            boxes=chunk,
+        ))
+    return Operation("sweep_expired", txns, private_key, inner_txns=len(refunds), ref=ref)
@@ -0,0 +1,226 @@
+"""
+Optimistic local state for submitted operations.
+
+Waiting for finality costs about a round per action. An Overlay lets a
+client show the effect of an operation, and plan the next one, as soon as
+it is submitted. The overlay sits on a bounty source: anything with
+.bounties and .round, such as the read API's Mirror, the stream Follower
+or the Dashboard.
+
+- apply() checks each operation against the contract's state machine and
+  the predicted state. It raises ValueError for an operation the contract
+  would reject, and records a PENDING write for each legal one.
+- bounty() and state() return the source's bounties with every live write
+  replayed on top, using the same transition function as the history
+  replay (replay.apply_event).
+- reconcile() takes the packer's OperationResults. A confirmed write stays
+  layered until the source has synced its round. A failed write is rolled
+  back, and any later writes are replayed without it.
+- submit() applies the operations, then submits them through a
+  GroupPacker on a worker thread and reconciles when the packer returns.
+
+    overlay = Overlay(mirror)
+    done = overlay.submit(packer, [accept, submit])   # returns at once
+    overlay.bounty(12).status_name                    # "SUBMITTED", pending
+    done.result()                                     # confirmed or rolled back
+
+The caller checks in RULES follow the V2 contract, which the operation
+builders target. Other layouts get the terminal-status check only. A call
+the layout's contract does not have, such as sweep_expired on V2, is
+rejected.
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+
+from algosdk import transaction
+
+from algoease.boxes import V2, Bounty, BoxLayout
+from algoease.history import CREATE, SWEEP, Event
+from algoease.operations import Operation
+from algoease.packer import GroupPacker, OperationResult
+from algoease.replay import apply_event, has_method
+
+PENDING = "pending"
+CONFIRMED = "confirmed"
+ROLLED_BACK = "rolled_back"
+
+# V2 contract: method -> (statuses it may be called in, who may call it)
+RULES = {
+    "accept_bounty": ({"OPEN"}, "not creator"),
+    "submit_bounty": ({"ACCEPTED"}, "freelancer"),
+    "approve_bounty": ({"SUBMITTED"}, "creator"),
+    "reject_bounty": ({"SUBMITTED"}, "creator"),
+}
+
+
+@dataclass
+class Write:
+    """One submitted operation and what became of it"""
+    operation: Operation
+    event: Event
+    state: str = PENDING
+    confirmed_round: Optional[int] = None
+    error: Optional[str] = None
+
+    @property
+    def bounty_ids(self) -> List[int]:
+        return self.event.bounties
+
+
+def describe(operation: Operation) -> Event:
+    """The app call an operation makes, as an unconfirmed history Event"""
+    call = next(txn for txn in operation.txns if isinstance(txn, transaction.ApplicationCallTxn))
+    method = call.app_args[0].decode()
+    if method == CREATE:
+        return Event(0, 0, "", method, call.sender, [operation.bounty_id], int.from_bytes(call.app_args[1], 'big'),
+                     task_desc=call.app_args[-1].decode('utf-8', errors='replace'))
+    if method == SWEEP:
+        ids = call.app_args[1]
+        return Event(0, 0, "", method, call.sender, [int.from_bytes(ids[i:i + 8], 'big')
+                                                      for i in range(0, len(ids), 8)])
+    return Event(0, 0, "", method, call.sender, [operation.bounty_id])
+
+
+def check(event: Event, state: Dict[int, Bounty], layout: BoxLayout = V2) -> None:
+    """Raise ValueError if the contract would reject this call in this state"""
+    if not has_method(layout, event.method):
+        raise ValueError(f"{event.method}: not a call of the {layout.name} contract")
+    for bounty_id in event.bounties:
+        bounty = state.get(bounty_id)
+        if event.method == CREATE:
+            if bounty is not None:
+                raise ValueError(f"create_bounty: bounty {bounty_id} already exists")
+            if event.amount <= 0:
+                raise ValueError("create_bounty: amount must be positive")
+            continue
+        if bounty is None:
+            raise ValueError(f"{event.method}: bounty {bounty_id} does not exist")
+        if bounty.is_terminal:
+            raise ValueError(f"{event.method}: bounty {bounty_id} is already {bounty.status_name}")
+        if layout is not V2 or event.method not in RULES:
+            continue
+        statuses, caller = RULES[event.method]
+        if bounty.status_name not in statuses:
+            raise ValueError(f"{event.method}: bounty {bounty_id} is {bounty.status_name}, "
+                             f"needs {' or '.join(sorted(statuses))}")
+        if ((caller == "creator" and event.sender != bounty.creator)
+                or (caller == "freelancer" and event.sender != bounty.freelancer)
+                or (caller == "not creator" and event.sender == bounty.creator)):
+            raise ValueError(f"{event.method}: {event.sender} may not call it on bounty {bounty_id}")
+
+
+class Overlay:
+    """Predicted bounty state: a synced source plus the writes it has not caught up with"""
+
+    def __init__(self, source, layout: BoxLayout = V2):
+        self.source = source
+        self.layout = layout
+        self.writes: List[Write] = []
+        self._by_operation: Dict[int, Write] = {}
+        self._lock = threading.RLock()
+        # One sender thread: a GroupPacker's queue is not shared between threads
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="algoease-overlay")
+
+    # ------------------------------------------------------------------ view
+
+    def _live(self) -> List[Write]:
+        """Writes still layered: pending, or confirmed in a round the source has not synced"""
+        self.writes = [w for w in self.writes if w.state == PENDING
+                       or (w.state == CONFIRMED and w.confirmed_round > self.source.round)]
+        return self.writes
+
+    def _replay(self, bounty_ids: Optional[Set[int]] = None) -> Dict[int, Bounty]:
+        live = self._live()
+        if bounty_ids is None:
+            bounty_ids = set(self.source.bounties) | {i for w in live for i in w.bounty_ids}
+        else:
+            # A sweep spans several bounties: replay all of them or none of its effect applies
+            bounty_ids = set(bounty_ids)
+            grown = True
+            while grown:
+                grown = False
+                for write in live:
+                    if bounty_ids.intersection(write.bounty_ids) and not bounty_ids.issuperset(write.bounty_ids):
+                        bounty_ids.update(write.bounty_ids)
+                        grown = True
+        state = {i: replace(self.source.bounties[i]) for i in bounty_ids if i in self.source.bounties}
+        for write in live:
+            if not bounty_ids.intersection(write.bounty_ids):
+                continue
+            try:
+                check(write.event, state, self.layout)
+            except ValueError:
+                # An earlier write it depended on was rolled back; it will fail on chain too
+                continue
+            apply_event(state, write.event, self.layout)
+        return state
+
+    def bounty(self, bounty_id: int) -> Optional[Bounty]:
+        with self._lock:
+            return self._replay({bounty_id}).get(bounty_id)
+
+    def state(self) -> Dict[int, Bounty]:
+        with self._lock:
+            return self._replay()
+
+    def pending(self, bounty_id: Optional[int] = None) -> List[Write]:
+        """Writes not yet confirmed or rolled back, optionally only those touching one bounty"""
+        with self._lock:
+            return [w for w in self._live() if w.state == PENDING
+                    and (bounty_id is None or bounty_id in w.bounty_ids)]
+
+    # ------------------------------------------------------------------ writes
+
+    def apply(self, operations: Sequence[Operation]) -> List[Write]:
+        """Check the operations in order against the predicted state and layer them; all or nothing"""
+        with self._lock:
+            events = [describe(op) for op in operations]
+            state = self._replay({i for event in events for i in event.bounties})
+            for event in events:
+                check(event, state, self.layout)
+                apply_event(state, event, self.layout)
+            writes = [Write(op, event) for op, event in zip(operations, events)]
+            self.writes.extend(writes)
+            self._by_operation.update((id(w.operation), w) for w in writes)
+            return writes
+
+    def confirm(self, write: Write, round_number: int) -> None:
+        with self._lock:
+            write.state, write.confirmed_round = CONFIRMED, round_number
+            self._by_operation.pop(id(write.operation), None)
+
+    def rollback(self, write: Write, error: str) -> None:
+        with self._lock:
+            write.state, write.error = ROLLED_BACK, error
+            self._by_operation.pop(id(write.operation), None)
+
+    def reconcile(self, results: Iterable[OperationResult]) -> None:
+        """Settle the writes of the packer's results"""
+        for result in results:
+            write = self._by_operation.get(id(result.operation))
+            if write is None:
+                continue
+            if result.ok:
+                self.confirm(write, result.confirmed_round)
+            else:
+                self.rollback(write, result.error or "not confirmed")
+
+    def submit(self, packer: GroupPacker, operations: Sequence[Operation]) -> "Future[List[OperationResult]]":
+        """Layer the operations now; send and reconcile them in the background"""
+        writes = self.apply(operations)
+
+        def send() -> List[OperationResult]:
+            try:
+                packer.extend(operations)
+                results = packer.submit()
+            except Exception as e:
+                for write in writes:
+                    self.rollback(write, str(e))
+                raise
+            self.reconcile(results)
+            return results
+
+        return self._executor.submit(send)
@@ -0,0 +1,262 @@
+"""
+Atomic-group packer for independent AlgoEase operations.
+
+Queue any number of operations (see operations.py) and the packer bins
+them into atomic groups of up to 16 transactions, so a burst of accepts,
+submits and approves costs one submission round trip per group instead
+of one per action.
+
+Packing rules:
+- A group never exceeds the GroupLimits (transactions, distinct box and
+  account references, pooled fee).
+- Operations on the same bounty keep their queue order.
+- Standalone operations (create_bounty) always get a group of their own.
+
+A rejected group fails as a whole. The packer traces the rejection back
+to the operation that caused it, records that failure, and resubmits the
+rest of the group. If algod does not name a transaction, every operation
+in the group is retried in a group of its own so the culprit is exact.
+
+With a preflight (see preflight.py) every group is simulated before it is
+signed: operations that would fail are recorded and never sent. A group
+that touches a bounty an earlier group of the same pass already touched
+waits for the next pass, so it is simulated against the confirmed state.
+"""
+
+import base64
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set
+
+from algosdk import error
+
+from algoease.operations import Operation
+from algoease.signing import assign_group_ids, sign_one
+from algoease.wire import wait_for_confirmation
+
+# "TransactionPool.Remember: transaction <TXID>: logic eval error: ..."
+FAILED_TXID_RE = re.compile(r"transaction ([A-Z2-7]{52})")
+
+# ============================================================================
+# Limits and results
+# ============================================================================
+
+@dataclass(frozen=True)
+class GroupLimits:
+    """Per-group packing limits"""
+    max_txns: int = 16
+    # Box references are pooled across the group: 8 references x 16 app calls
+    max_box_refs: int = 128
+    max_account_refs: int = 64
+    # Upper bound on the pooled fee of one group, in microAlgos (None = no cap)
+    max_fee: Optional[int] = None
+
+
+@dataclass
+class OperationResult:
+    """Outcome of one queued operation"""
+    operation: Operation
+    txid: Optional[str] = None
+    confirmed_round: Optional[int] = None
+    error: Optional[str] = None
+    group_index: Optional[int] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.confirmed_round is not None
+
+    @property
+    def ref(self) -> Any:
+        return self.operation.ref
+
+
+class _Group:
+    """Running totals of one group being packed"""
+
+    def __init__(self):
+        self.operations: List[Operation] = []
+        self.txns = 0
+        self.box_refs: Set = set()
+        self.budget_refs = 0
+        self.account_refs: Set[str] = set()
+        self.fee = 0
+        self.closed = False
+
+    def fits(self, op: Operation, limits: GroupLimits) -> bool:
+        if self.closed:
+            return False
+        if self.txns + op.size > limits.max_txns:
+            return False
+        if len(self.box_refs | op.box_refs) + self.budget_refs + op.budget_refs > limits.max_box_refs:
+            return False
+        if len(self.account_refs | op.account_refs) > limits.max_account_refs:
+            return False
+        if limits.max_fee is not None and self.fee + op.fee > limits.max_fee:
+            return False
+        return True
+
+    def add(self, op: Operation, close: bool = False) -> None:
+        self.operations.append(op)
+        self.txns += op.size
+        self.box_refs |= op.box_refs
+        self.budget_refs += op.budget_refs
+        self.account_refs |= op.account_refs
+        self.fee += op.fee
+        self.closed = self.closed or close
+
+# ============================================================================
+# Packer
+# ============================================================================
+
+class GroupPacker:
+    """Collects operations and submits them as packed atomic groups"""
+
+    def __init__(self, client, limits: Optional[GroupLimits] = None, wait_rounds: int = 4,
+                 signer=None, preflight=None):
+        self.client = client
+        self.limits = limits or GroupLimits()
+        self.wait_rounds = wait_rounds
+        # Optional signing.BulkSigner; signs each pass's groups across processes
+        self.signer = signer
+        # Optional preflight.Preflight; simulates each group before signing
+        self.preflight = preflight
+        self._queue: List[Operation] = []
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def add(self, op: Operation) -> None:
+        """Queue an operation; raises ValueError if it can never fit a group"""
+        op.validate()
+        if not _Group().fits(op, self.limits):
+            raise ValueError(f"{op.kind} does not fit in a single group under {self.limits}")
+        self._queue.append(op)
+
+    def extend(self, ops) -> None:
+        for op in ops:
+            self.add(op)
+
+    def pack(self, operations: Optional[List[Operation]] = None,
+             isolated: Optional[Set[int]] = None) -> List[List[Operation]]:
+        """First-fit bin packing that keeps per-bounty order"""
+        operations = self._queue if operations is None else operations
+        isolated = isolated or set()
+        groups: List[_Group] = []
+        last_group: Dict[int, int] = {}
+
+        for op in operations:
+            alone = op.standalone or id(op) in isolated
+            target = None
+            if not alone:
+                start = last_group.get(op.bounty_id, 0) if op.bounty_id is not None else 0
+                for index in range(start, len(groups)):
+                    if groups[index].fits(op, self.limits):
+                        target = index
+                        break
+            if target is None:
+                groups.append(_Group())
+                target = len(groups) - 1
+            groups[target].add(op, close=alone)
+            if op.bounty_id is not None:
+                last_group[op.bounty_id] = target
+
+        return [group.operations for group in groups]
+
+    def sign_groups(self, groups: List[List[Operation]]) -> List[List[bytes]]:
+        """Assign group IDs across each group's operations, then sign; returns blobs per group"""
+        assign_group_ids([[txn for op in group for txn in op.txns] for group in groups])
+
+        ops = [op for group in groups for op in group]
+        if self.signer is not None:
+            signed = iter(self.signer.sign_with_txids([txn for op in ops for txn in op.txns]))
+        else:
+            signed = iter([sign_one(txn, {txn.sender: op.private_key}) for op in ops for txn in op.txns])
+
+        result = []
+        for group in groups:
+            blobs = []
+            for op in group:
+                pairs = [next(signed) for _ in op.txns]
+                op.txids = [txid for txid, _ in pairs]
+                blobs.extend(blob for _, blob in pairs)
+            result.append(blobs)
+        return result
+
+    def submit(self) -> List[OperationResult]:
+        """Send every queued operation; returns one result per operation, in queue order"""
+        queued, self._queue = self._queue, []
+        results: Dict[int, OperationResult] = {id(op): OperationResult(op) for op in queued}
+
+        order = {id(op): index for index, op in enumerate(queued)}
+        pending = queued
+        isolated: Set[int] = set()
+        group_index = 0
+        while pending:
+            retry: List[Operation] = []
+            sent = []
+            groups = self.pack(pending, isolated)
+            if self.preflight is not None:
+                groups = self._preflight(groups, results, retry)
+            for group, blobs in zip(groups, self.sign_groups(groups)):
+                for op in group:
+                    results[id(op)].group_index = group_index
+                    results[id(op)].txid = op.txids[-1]
+                group_index += 1
+                try:
+                    self.client.send_raw_transaction(base64.b64encode(b"".join(blobs)))
+                except error.AlgodHTTPError as e:
+                    retry.extend(self._trace_failure(group, str(e), results, isolated))
+                    continue
+                sent.append(group)
+
+            for group in sent:
+                last_txid = group[-1].txids[-1]
+                try:
+                    confirmed = wait_for_confirmation(self.client, last_txid, self.wait_rounds)
+                except Exception as e:
+                    for op in group:
+                        results[id(op)].error = str(e)
+                    continue
+                for op in group:
+                    results[id(op)].confirmed_round = confirmed.get('confirmed-round')
+
+            pending = sorted(retry, key=lambda op: order[id(op)])
+
+        return [results[id(op)] for op in queued]
+
+    def _preflight(self, groups, results, retry) -> List[List[Operation]]:
+        """Drop operations that would fail; defer groups that depend on this pass's earlier groups"""
+        checked = []
+        touched: Set[int] = set()
+        for group in groups:
+            bounty_ids = {op.bounty_id for op in group if op.bounty_id is not None}
+            if bounty_ids & touched:
+                retry.extend(group)
+            else:
+                failures = self.preflight.check(group)
+                for op in group:
+                    if id(op) in failures:
+                        results[id(op)].error = failures[id(op)]
+                group = [op for op in group if id(op) not in failures]
+                if group:
+                    checked.append(group)
+            touched |= bounty_ids
+        return checked
+
+    def _trace_failure(self, group, message, results, isolated) -> List[Operation]:
+        """Pin a rejected group on one operation; returns the operations to retry"""
+        culprit = None
+        match = FAILED_TXID_RE.search(message)
+        if match:
+            culprit = next((op for op in group if match.group(1) in op.txids), None)
+
+        if culprit is None and len(group) == 1:
+            culprit = group[0]
+
+        if culprit is None:
+            # Unattributed: retry each operation alone so the next failure is exact
+            isolated.update(id(op) for op in group)
+            return list(group)
+
+        results[id(culprit)].error = message
+        return [op for op in group if op is not culprit]
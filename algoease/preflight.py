@@ -0,0 +1,220 @@
+"""
+Preflight checks for AlgoEase operations.
+
+Before a group is signed and sent, Preflight runs it through algod's
+simulate endpoint (empty signatures, unnamed resources allowed):
+- box / account references the programs touched but the transactions did
+  not name are added to the transactions
+- app calls whose fee does not cover their zero-fee inner payments are
+  topped up
+- an operation that would fail is dropped and its failure is explained in
+  AlgoEase terms ("bounty 12 is OPEN, submit_bounty needs ACCEPTED")
+  from the bounty box, instead of a raw "assert failed pc=412"
+
+When algod cannot be reached the same contract rules are checked locally
+against the known bounty boxes, so an offline run still never spends a
+round trip or a fee on a transaction that was bound to fail.
+
+    packer = GroupPacker(client, preflight=Preflight(client))
+"""
+
+import base64
+import re
+from typing import Dict, List, Optional, Sequence
+
+from algosdk import constants, error, transaction
+from algosdk.v2client.models import SimulateRequest, SimulateRequestTransactionGroup
+
+from algoease.boxes import V2, V5, Bounty, BoxLayout, box_name, bounty_id_from_box_name
+from algoease.operations import MAX_APP_TOTAL_TXN_REFERENCES, Operation
+from algoease.ratelimit import CircuitOpenError
+from algoease.signing import assign_group_ids
+from algoease.state import get_bounty
+
+# Bounty status an operation requires, and who may send it (V2 contract)
+REQUIRED_STATUS = {
+    "accept_bounty": "OPEN",
+    "submit_bounty": "ACCEPTED",
+    "approve_bounty": "SUBMITTED",
+    "reject_bounty": "SUBMITTED",
+}
+REQUIRED_SENDER = {
+    "submit_bounty": "freelancer",
+    "approve_bounty": "creator",
+    "reject_bounty": "creator",
+}
+V5_KINDS = ("auto_refund", "sweep_expired")
+
+# Raw algod / AVM failure text -> AlgoEase reason
+FAILURE_PATTERNS = [
+    (re.compile(r"overspend"), "sender cannot cover the amount plus fees"),
+    (re.compile(r"fee too small|in fees, which is less than the minimum"),
+     "fee does not cover the app call and its inner payments"),
+    (re.compile(r"invalid Box reference|unavailable Box"), "box not referenced"),
+    (re.compile(r"invalid Account reference|unavailable Account"), "account not referenced"),
+    (re.compile(r"below min"), "payment would leave an account below its minimum balance"),
+]
+
+
+def _app_calls(op: Operation) -> List[transaction.ApplicationCallTxn]:
+    return [txn for txn in op.txns if isinstance(txn, transaction.ApplicationCallTxn)]
+
+
+def _layout(op: Operation) -> BoxLayout:
+    return V5 if op.kind in V5_KINDS else V2
+
+
+def rule_violation(op: Operation, bounty: Optional[Bounty]) -> Optional[str]:
+    """Why the contract would reject this operation given the bounty's box, or None"""
+    if op.bounty_id is None:
+        return None
+    sender = _app_calls(op)[-1].sender
+    if op.kind == "create_bounty":
+        return f"bounty {op.bounty_id} already exists; bounty_count is stale" if bounty else None
+    if bounty is None:
+        return f"bounty {op.bounty_id} does not exist"
+
+    required = REQUIRED_STATUS.get(op.kind)
+    if required and bounty.status_name != required:
+        return f"bounty {op.bounty_id} is {bounty.status_name}, {op.kind} needs {required}"
+    role = REQUIRED_SENDER.get(op.kind)
+    if role and sender != getattr(bounty, role):
+        return f"{op.kind} must be sent by the bounty's {role} {getattr(bounty, role)}"
+    if op.kind == "accept_bounty" and sender == bounty.creator:
+        return f"the creator cannot accept their own bounty {op.bounty_id}"
+    if op.kind == "approve_bounty" and not bounty.freelancer:
+        return f"bounty {op.bounty_id} has no freelancer to pay"
+    if op.kind == "auto_refund" and bounty.is_terminal:
+        return f"bounty {op.bounty_id} is already {bounty.status_name}"
+    return None
+
+
+class Preflight:
+
+    def __init__(self, client, min_fee: int = constants.MIN_TXN_FEE,
+                 bounties: Optional[Dict[int, Bounty]] = None, offline: bool = False):
+        self.client = client
+        self.min_fee = min_fee
+        # Known bounty boxes, used by the offline check
+        self.bounties = bounties if bounties is not None else {}
+        self.offline = offline
+        self.simulations = 0
+
+    # ------------------------------------------------------------------ check
+
+    def check(self, ops: Sequence[Operation]) -> Dict[int, str]:
+        """
+        Check one group of operations; fills in references and fees in place.
+        Returns id(op) -> reason for every operation that would fail.
+        """
+        failures: Dict[int, str] = {}
+        remaining = list(ops)
+        while remaining:
+            for op in remaining:
+                self.fill_fee(op)
+            if not self.offline:
+                try:
+                    failed = self._simulate(remaining)
+                except (OSError, error.AlgodHTTPError, CircuitOpenError):
+                    # algod unreachable, failing or refused by the rate limiter:
+                    # fall back to the local rules for this and later groups
+                    self.offline = True
+                    continue
+            else:
+                failed = self._local(remaining)
+            if failed is None:
+                break
+            op, reason = failed
+            failures[id(op)] = reason
+            remaining.remove(op)
+        return failures
+
+    def fill_fee(self, op: Operation) -> None:
+        """Raise the last app call's fee until the operation pays for its inner transactions"""
+        shortfall = self.min_fee * (op.size + op.inner_txns) - op.fee
+        calls = _app_calls(op)
+        if shortfall > 0 and calls:
+            calls[-1].fee += shortfall
+
+    # -------------------------------------------------------------- simulate
+
+    def _simulate(self, ops: List[Operation]):
+        txns = [txn for op in ops for txn in op.txns]
+        assign_group_ids([txns])
+        request = SimulateRequest(
+            txn_groups=[SimulateRequestTransactionGroup(txns=[transaction.SignedTransaction(txn, None) for txn in txns])],
+            allow_empty_signatures=True,
+            allow_unnamed_resources=True,
+        )
+        self.simulations += 1
+        group = self.client.simulate_transactions(request)["txn-groups"][0]
+
+        owners = [op for op in ops for _ in op.txns]
+        if group.get("failure-message"):
+            index = group.get("failed-at", [0])[0]
+            op = owners[index]
+            return op, self.explain(op, group["failure-message"])
+
+        calls = [txn for txn in txns if isinstance(txn, transaction.ApplicationCallTxn)]
+        for txn, result in zip(txns, group.get("txn-results", [])):
+            if isinstance(txn, transaction.ApplicationCallTxn):
+                self._name_resources(txn, result.get("unnamed-resources-accessed"))
+        if calls:
+            self._name_resources(calls[0], group.get("unnamed-resources-accessed"), spill=calls)
+
+        for op in ops:
+            try:
+                op.validate()
+            except ValueError as e:
+                return op, f"needs more references than one call can hold: {e}"
+        return None
+
+    @staticmethod
+    def _name_resources(txn, unnamed: Optional[dict], spill: Sequence = ()) -> None:
+        """Add the boxes / accounts simulate saw being used without a reference"""
+        if not unnamed:
+            return
+        boxes = [(ref.get("app", 0), base64.b64decode(ref.get("name", ""))) for ref in unnamed.get("boxes", [])]
+        boxes += [(0, b"")] * unnamed.get("extra-box-refs", 0)
+        for app_id, name in boxes:
+            if app_id not in (0, txn.index):
+                continue  # AlgoEase programs only read their own boxes
+            # Box references are shared by the whole group; put each on a call of this app with room
+            target = next((t for t in [txn, *spill] if t.index == txn.index and
+                           len(t.boxes or []) + len(t.accounts or []) < MAX_APP_TOTAL_TXN_REFERENCES), txn)
+            target.boxes = list(target.boxes or []) + [transaction.BoxReference(0, name)]
+        for address in unnamed.get("accounts", []):
+            if address not in (txn.accounts or []):
+                txn.accounts = list(txn.accounts or []) + [address]
+
+    def explain(self, op: Operation, message: str) -> str:
+        """AlgoEase-level reason for a simulate failure"""
+        reason = None
+        if op.bounty_id is not None and ("assert failed" in message or "logic eval error" in message
+                                         or "err opcode" in message):
+            app_id = _app_calls(op)[-1].index
+            reason = rule_violation(op, get_bounty(self.client, app_id, op.bounty_id, _layout(op)))
+        if reason is None:
+            reason = next((text for pattern, text in FAILURE_PATTERNS if pattern.search(message)), None)
+        detail = message.split("\n")[0]
+        return f"{op.kind}: {reason} ({detail})" if reason else f"{op.kind}: {detail}"
+
+    # ----------------------------------------------------------------- local
+
+    def _local(self, ops: List[Operation]):
+        """Contract rules and references checked against the known boxes"""
+        for op in ops:
+            if op.bounty_id is not None:
+                named = {bounty_id_from_box_name(name) for _, name in op.box_refs}
+                if op.bounty_id not in named:
+                    calls = _app_calls(op)
+                    calls[-1].boxes = list(calls[-1].boxes or []) + [transaction.BoxReference(0, box_name(op.bounty_id))]
+                if op.bounty_id in self.bounties or op.kind == "create_bounty":
+                    reason = rule_violation(op, self.bounties.get(op.bounty_id))
+                    if reason:
+                        return op, f"{op.kind}: {reason}"
+            try:
+                op.validate()
+            except ValueError as e:
+                return op, str(e)
+        return None
@@ -0,0 +1,300 @@
+"""
+Caching reverse proxy for algod and indexer.
+
+Every component points ALGOD_URL / INDEXER_URL at the proxy instead of at
+AlgoNode. Identical reads then cost one upstream request:
+
+- identical GETs in flight at the same time are merged into one upstream
+  call, and every caller gets its response
+- current-state reads (status, applications, boxes, accounts, searches)
+  are cached until the round advances
+- confirmed data (blocks, deltas, indexer lookups of a transaction, a
+  pending transaction once it has a confirmed round) is cached for good,
+  up to IMMUTABLE_CACHE_BYTES, least recently used first out
+- status/wait-for-block-after long-polls are merged too. A long-poll for a
+  round that has already passed is answered from the cached status.
+
+The proxy tracks the round itself. Against algod it keeps one long-poll
+open, shared with any client long-polls. Against the indexer it polls
+/health every INDEXER_POLL_SECONDS. POSTs and other writes pass through
+uncached. GET /proxy/stats reports hits, merges and upstream calls.
+
+    python -m algoease.proxy [--algod URL] [--indexer URL] [--host 127.0.0.1] \\
+        [--algod-port 4101] [--indexer-port 8981]
+    ALGOD_URL=http://127.0.0.1:4101 INDEXER_URL=http://127.0.0.1:8981 python -m algoease.dashboard ...
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import sys
+import urllib.error
+import urllib.request
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import Dict, Optional, Sequence, TextIO, Tuple
+from urllib.parse import urlsplit
+
+from algosdk import constants
+
+from algoease.client import DEFAULT_ALGOD_ADDRESS, DEFAULT_INDEXER_ADDRESS
+from algoease.wire import unpack
+
+IMMUTABLE_CACHE_BYTES = 256 * 1024 * 1024
+CURRENT_CACHE_ENTRIES = 50_000
+INDEXER_POLL_SECONDS = 1.0
+UPSTREAM_TIMEOUT = 30
+MAX_HEADER = 16 * 1024
+
+IMMUTABLE_PATHS = [re.compile(pattern) for pattern in (
+    r"^/v2/blocks/\d+(/.*)?$",              # blocks, block hashes, txids and proofs (algod and indexer)
+    r"^/v2/deltas/\d+(/.*)?$",
+    r"^/v2/transactions/[A-Z2-7]{52}$",     # indexer lookup of a confirmed transaction
+)]
+PENDING_PATH = re.compile(r"^/v2/transactions/pending/[A-Z2-7]{52}$")
+LONG_POLL_PATH = re.compile(r"^/v2/status/wait-for-block-after/(\d+)$")
+STATUS_PATHS = ("/v2/status", "/health")
+ROUND_KEYS = ("last-round", "round")
+
+
+@dataclass
+class Response:
+    status: int
+    content_type: str
+    body: bytes
+
+
+class Upstream:
+    """One algod or indexer endpoint, called with urllib like the SDK does"""
+
+    def __init__(self, address: str, token: str = "", token_header: str = constants.algod_auth_header):
+        self.address = address.rstrip("/")
+        self.headers = {"User-Agent": "algoease-proxy"}
+        if token:
+            self.headers[token_header] = token
+
+    def fetch(self, method: str, target: str, body: Optional[bytes] = None,
+              content_type: Optional[str] = None) -> Response:
+        """Never raises: transport failures come back as a 502"""
+        headers = dict(self.headers)
+        if content_type:
+            headers["Content-Type"] = content_type
+        request = urllib.request.Request(self.address + target, data=body, headers=headers, method=method)
+        try:
+            with urllib.request.urlopen(request, timeout=UPSTREAM_TIMEOUT) as response:
+                return Response(response.status, response.headers.get("Content-Type", "application/json"),
+                                response.read())
+        except urllib.error.HTTPError as e:
+            return Response(e.code, e.headers.get("Content-Type", "application/json"), e.read())
+        except Exception as e:
+            return Response(502, "application/json", json.dumps({"message": f"upstream: {e}"}).encode())
+
+
+def _reason(status: int) -> str:
+    try:
+        return HTTPStatus(status).phrase
+    except ValueError:
+        return "Unknown"
+
+
+def _decode(response: Response) -> dict:
+    try:
+        if "msgpack" in response.content_type:
+            return unpack(response.body)
+        return json.loads(response.body)
+    except ValueError:
+        return {}
+
+
+class CachingProxy:
+    """Round-aware response cache and in-flight request merging in front of one Upstream"""
+
+    def __init__(self, upstream: Upstream, immutable_bytes: int = IMMUTABLE_CACHE_BYTES):
+        self.upstream = upstream
+        self.immutable_bytes = immutable_bytes
+        self.round = 0
+        self.stats: Counter = Counter()
+        self._current: Dict[str, Response] = {}
+        self._immutable: "OrderedDict[str, Response]" = OrderedDict()
+        self._immutable_size = 0
+        self._inflight: Dict[Tuple[str, int], asyncio.Future] = {}
+
+    # ------------------------------------------------------------------ cache
+
+    def advance(self, round_number: int) -> None:
+        if round_number > self.round:
+            self.round = round_number
+            self._current.clear()
+
+    def _immutable_get(self, target: str) -> Optional[Response]:
+        response = self._immutable.get(target)
+        if response is not None:
+            self._immutable.move_to_end(target)
+        return response
+
+    def _store(self, target: str, path: str, round_number: int, response: Response) -> None:
+        if response.status != 200:
+            # A missing box or account is current state too; errors are not cached
+            if response.status == 404 and round_number == self.round and not PENDING_PATH.match(path):
+                self._current[target] = response
+            return
+        if path in STATUS_PATHS or LONG_POLL_PATH.match(path):
+            info = _decode(response)
+            self.advance(next((info[key] for key in ROUND_KEYS if isinstance(info.get(key), int)), 0))
+            # A long-poll answers with the same status document as /v2/status
+            self._current[path if path in STATUS_PATHS else "/v2/status"] = response
+            return
+        if PENDING_PATH.match(path) and not _decode(response).get("confirmed-round"):
+            # Still in the pool: a confirmation poll must see the change as soon as it happens
+            return
+        if any(pattern.match(path) for pattern in IMMUTABLE_PATHS) or PENDING_PATH.match(path):
+            self._immutable[target] = response
+            self._immutable_size += len(response.body)
+            while self._immutable_size > self.immutable_bytes and self._immutable:
+                _, evicted = self._immutable.popitem(last=False)
+                self._immutable_size -= len(evicted.body)
+            return
+        if round_number == self.round and len(self._current) < CURRENT_CACHE_ENTRIES:
+            self._current[target] = response
+
+    def cached(self, target: str) -> Optional[Response]:
+        path = urlsplit(target).path
+        response = self._immutable_get(target) or self._current.get(target)
+        if response is None:
+            long_poll = LONG_POLL_PATH.match(path)
+            if long_poll and self.round > int(long_poll.group(1)):
+                response = self._current.get("/v2/status")
+        return response
+
+    # ------------------------------------------------------------------ requests
+
+    async def get(self, target: str) -> Tuple[Response, str]:
+        """(response, "hit" | "merged" | "miss") for one GET"""
+        self.stats["requests"] += 1
+        response = self.cached(target)
+        if response is not None:
+            self.stats["hits"] += 1
+            return response, "hit"
+        key = (target, self.round)
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.stats["merged"] += 1
+            return await asyncio.shield(inflight), "merged"
+        return await self._fetch(target, key), "miss"
+
+    async def _fetch(self, target: str, key: Tuple[str, int]) -> Response:
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        self.stats["upstream"] += 1
+        try:
+            response = await asyncio.to_thread(self.upstream.fetch, "GET", target)
+            self._store(target, urlsplit(target).path, key[1], response)
+            future.set_result(response)
+            return response
+        finally:
+            del self._inflight[key]
+            if not future.done():
+                # Failed or cancelled: the merged callers must not wait for it forever
+                future.set_result(Response(502, "application/json", b'{"message":"upstream request failed"}'))
+
+    async def forward(self, method: str, target: str, body: bytes, content_type: Optional[str]) -> Response:
+        """Writes and anything else that must not be cached"""
+        self.stats["requests"] += 1
+        self.stats["passthrough"] += 1
+        self.stats["upstream"] += 1
+        return await asyncio.to_thread(self.upstream.fetch, method, target, body or None, content_type)
+
+    # ------------------------------------------------------------------ round tracking
+
+    async def follow_algod(self) -> None:
+        """Keep one wait-for-block-after open; client long-polls for the same round merge into it"""
+        while True:
+            target = f"/v2/status/wait-for-block-after/{self.round}" if self.round else "/v2/status"
+            response, source = await self.get(target)
+            if response.status != 200 or source == "hit":
+                await asyncio.sleep(2)
+
+    async def follow_indexer(self, interval: float = INDEXER_POLL_SECONDS) -> None:
+        while True:
+            await self._fetch("/health", ("/health", -1))
+            await asyncio.sleep(interval)
+
+    # ------------------------------------------------------------------ HTTP
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except asyncio.IncompleteReadError:
+                    return
+                if len(head) > MAX_HEADER:
+                    return
+                request_line, *header_lines = head.decode("latin-1").rstrip("\r\n").split("\r\n")
+                method, target, version = request_line.split(" ", 2)
+                headers = {k.strip().lower(): v.strip() for k, _, v in (h.partition(":") for h in header_lines)}
+                body = await reader.readexactly(int(headers.get("content-length", 0) or 0))
+
+                if method == "GET" and target == "/proxy/stats":
+                    stats = dict(self.stats, round=self.round, immutable_bytes=self._immutable_size,
+                                 current_entries=len(self._current))
+                    response, source = Response(200, "application/json", json.dumps(stats).encode()), "local"
+                elif method == "GET":
+                    response, source = await self.get(target)
+                else:
+                    response, source = await self.forward(method, target, body, headers.get("content-type")), "pass"
+
+                close = headers.get("connection", "").lower() == "close" or version == "HTTP/1.0"
+                writer.write(f"HTTP/1.1 {response.status} {_reason(response.status)}\r\n"
+                             f"Content-Type: {response.content_type}\r\nContent-Length: {len(response.body)}\r\n"
+                             f"X-Proxy-Cache: {source}\r\nX-Proxy-Round: {self.round}\r\n"
+                             f"Connection: {'close' if close else 'keep-alive'}\r\n\r\n".encode() + response.body)
+                await writer.drain()
+                if close:
+                    return
+        except (ConnectionError, ValueError, asyncio.LimitOverrunError):
+            pass
+        finally:
+            writer.close()
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+async def serve(algod: CachingProxy, indexer: CachingProxy, host: str, algod_port: int, indexer_port: int,
+                out: TextIO = sys.stdout) -> None:
+    algod_server = await asyncio.start_server(algod.handle, host, algod_port, limit=MAX_HEADER)
+    indexer_server = await asyncio.start_server(indexer.handle, host, indexer_port, limit=MAX_HEADER)
+    print(f"algod   {algod.upstream.address} -> http://{host}:{algod_port}", file=out)
+    print(f"indexer {indexer.upstream.address} -> http://{host}:{indexer_port}", file=out)
+    async with algod_server, indexer_server:
+        await asyncio.gather(algod_server.serve_forever(), indexer_server.serve_forever(),
+                             algod.follow_algod(), indexer.follow_indexer())
+
+
+def main(argv: Optional[Sequence[str]] = None, out: TextIO = sys.stdout) -> int:
+    parser = argparse.ArgumentParser(description="Caching, request-merging proxy for algod and indexer")
+    parser.add_argument("--algod", default=os.getenv("ALGOD_URL", DEFAULT_ALGOD_ADDRESS).split(",")[0],
+                        help="upstream algod (default: first ALGOD_URL endpoint)")
+    parser.add_argument("--indexer", default=os.getenv("INDEXER_URL", DEFAULT_INDEXER_ADDRESS).split(",")[0],
+                        help="upstream indexer (default: first INDEXER_URL endpoint)")
+    parser.add_argument("--host", default="127.0.0.1", help="listen address (default: 127.0.0.1)")
+    parser.add_argument("--algod-port", type=int, default=4101, help="algod listen port (default: 4101)")
+    parser.add_argument("--indexer-port", type=int, default=8981, help="indexer listen port (default: 8981)")
+    args = parser.parse_args(argv)
+
+    algod = CachingProxy(Upstream(args.algod, os.getenv("ALGOD_TOKEN", "").split(",")[0]))
+    indexer = CachingProxy(Upstream(args.indexer, os.getenv("INDEXER_TOKEN", "").split(",")[0],
+                                    constants.indexer_auth_header))
+    try:
+        asyncio.run(serve(algod, indexer, args.host, args.algod_port, args.indexer_port, out))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
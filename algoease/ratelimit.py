@@ -0,0 +1,273 @@
+"""
+Shared request budget for the public AlgoNode endpoints.
+
+AlgoNode rate-limits per client IP, so several tools running on one host
+share a single budget. Every request first takes a token from a bucket
+whose state lives in a small JSON file under the temp directory, guarded
+by an flock, so all processes on the host draw from the same bucket.
+
+- A 429 halves the shared rate for everyone (recovering a little with
+  every success) and pauses the bucket for an exponential backoff with
+  full jitter; a GET is then retried.
+- Connection errors and 5xx responses are retried with the same backoff.
+  After FAILURE_THRESHOLD of them in a row the circuit opens and calls
+  fail fast with CircuitOpenError for COOLDOWN seconds, after which one
+  trial request is let through.
+- Only GETs are retried. A POST whose response was lost may still have
+  been accepted, and resending the signed group would then fail with
+  "already in ledger". A write raises its first error unchanged.
+
+get_algod_client() / get_indexer_client() return the limited clients for
+remote endpoints; tune with ALGOD_RATE / INDEXER_RATE (requests per second).
+"""
+
+import json
+import os
+import random
+import re
+import tempfile
+import threading
+import time
+from typing import Callable, Optional, TypeVar
+from urllib.parse import urlparse
+
+from algosdk import error
+from algosdk.v2client import algod, indexer
+
+try:
+    import fcntl
+except ImportError:  # Windows: the bucket is shared by the threads of one process only
+    fcntl = None
+
+DEFAULT_RATE = 20.0          # requests per second, per host
+DEFAULT_BURST = 20
+MIN_RATE_SCALE = 0.05
+RECOVERY_STEP = 0.02         # rate scale regained per successful request
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 30.0
+MAX_RETRIES = 5
+FAILURE_THRESHOLD = 5
+COOLDOWN = 30.0
+
+THROTTLED_RE = re.compile(r"\b429\b|too many requests|rate limit", re.IGNORECASE)
+
+T = TypeVar("T")
+
+
+class CircuitOpenError(Exception):
+    """The endpoint failed repeatedly; calls are refused until the cooldown ends"""
+
+
+def backoff_delay(attempt: int, base: float = BACKOFF_BASE, cap: float = BACKOFF_CAP) -> float:
+    """Exponential backoff with full jitter"""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+# ============================================================================
+# Token bucket
+# ============================================================================
+
+class TokenBucket:
+    """Token bucket whose state is shared by every process on the host through a locked file"""
+
+    def __init__(self, name: str, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST,
+                 state_dir: Optional[str] = None):
+        self.rate = rate
+        self.burst = burst
+        self.path = os.path.join(state_dir or tempfile.gettempdir(), f"algoease-ratelimit-{name}.json")
+        self._lock = threading.Lock()
+
+    def _update(self, change: Callable[[dict, float], T]) -> T:
+        """Apply change(state, now) to the shared state under the file lock"""
+        with self._lock:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+                raw = os.read(fd, 4096)
+                now = time.time()
+                try:
+                    state = json.loads(raw) if raw else {}
+                except ValueError:
+                    state = {}
+                state.setdefault("tokens", float(self.burst))
+                state.setdefault("updated", now)
+                state.setdefault("scale", 1.0)
+                state.setdefault("paused_until", 0.0)
+                state.setdefault("strikes", 0)
+                # Refill at the current (possibly reduced) rate
+                elapsed = max(0.0, now - state["updated"])
+                state["tokens"] = min(float(self.burst), state["tokens"] + elapsed * self.rate * state["scale"])
+                state["updated"] = now
+                result = change(state, now)
+                encoded = json.dumps(state).encode()
+                os.lseek(fd, 0, os.SEEK_SET)
+                os.ftruncate(fd, 0)
+                os.write(fd, encoded)
+                return result
+            finally:
+                os.close(fd)
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until one is available; returns the time waited"""
+        waited = 0.0
+        while True:
+            def take(state, now):
+                if now < state["paused_until"]:
+                    return state["paused_until"] - now
+                if state["tokens"] >= 1:
+                    state["tokens"] -= 1
+                    return 0.0
+                return (1 - state["tokens"]) / (self.rate * state["scale"])
+            wait = self._update(take)
+            if wait <= 0:
+                return waited
+            time.sleep(wait)
+            waited += wait
+
+    def throttled(self, retry_after: Optional[float] = None) -> float:
+        """Record a 429: halve the shared rate and pause every process; returns the pause"""
+        def penalize(state, now):
+            state["scale"] = max(MIN_RATE_SCALE, state["scale"] / 2)
+            state["tokens"] = 0.0
+            delay = retry_after if retry_after is not None else backoff_delay(state["strikes"])
+            state["strikes"] += 1
+            state["paused_until"] = max(state["paused_until"], now + delay)
+            return state["paused_until"] - now
+        return self._update(penalize)
+
+    def succeeded(self) -> None:
+        """Additive recovery of the shared rate after a successful request"""
+        def recover(state, now):
+            state["scale"] = min(1.0, state["scale"] + RECOVERY_STEP)
+            state["strikes"] = 0
+        self._update(recover)
+
+    @property
+    def scale(self) -> float:
+        return self._update(lambda state, now: state["scale"])
+
+# ============================================================================
+# Circuit breaker
+# ============================================================================
+
+class CircuitBreaker:
+    """Opens after `threshold` consecutive failures; half-opens after `cooldown` seconds"""
+
+    def __init__(self, threshold: int = FAILURE_THRESHOLD, cooldown: float = COOLDOWN):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def before(self) -> None:
+        with self._lock:
+            if self.opened_at is None:
+                return
+            if time.monotonic() - self.opened_at < self.cooldown:
+                raise CircuitOpenError(f"circuit open after {self.failures} consecutive failures")
+            # Half-open: let this request through as the trial; a failure re-opens at once
+            self.opened_at = None
+            self.failures = self.threshold - 1
+
+    def success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.threshold:
+                self.opened_at = time.monotonic()
+
+# ============================================================================
+# Limited calls and clients
+# ============================================================================
+
+def is_retryable(e: Exception) -> bool:
+    """Whether another attempt (or another endpoint) could succeed"""
+    return isinstance(e, CircuitOpenError) or _classify(e) is not None
+
+
+def _classify(e: Exception) -> Optional[str]:
+    """'throttled', 'failed' (retryable) or None (a real answer, e.g. 404)"""
+    code = getattr(e, "code", None)
+    if code == 429 or THROTTLED_RE.search(str(e)):
+        return "throttled"
+    if isinstance(e, (error.AlgodHTTPError, error.IndexerHTTPError)):
+        return "failed" if code is not None and code >= 500 else None
+    if isinstance(e, OSError):
+        return "failed"
+    return None
+
+
+def call_limited(bucket: TokenBucket, breaker: CircuitBreaker, call: Callable[[], T],
+                 retries: int = MAX_RETRIES) -> T:
+    """Run call() under the bucket and breaker, retrying throttled and transient failures"""
+    for attempt in range(retries + 1):
+        breaker.before()
+        bucket.acquire()
+        try:
+            result = call()
+        except Exception as e:
+            kind = _classify(e)
+            if kind is None:
+                breaker.success()
+                raise
+            if kind == "throttled":
+                # The endpoint is healthy, just busy: slow everyone down rather than tripping the breaker
+                delay = bucket.throttled()
+            else:
+                breaker.failure()
+                delay = backoff_delay(attempt)
+            if attempt == retries:
+                raise
+            time.sleep(delay)
+            continue
+        breaker.success()
+        bucket.succeeded()
+        return result
+    raise AssertionError("unreachable")
+
+
+def _retries(retries: int, args, kwargs) -> int:
+    """The retry budget for one request: none for writes, which may have landed despite the error"""
+    method = args[0] if args else kwargs.get("method", "GET")
+    return retries if method.upper() == "GET" else 0
+
+
+def _host(address: str) -> str:
+    return re.sub(r"[^A-Za-z0-9.-]", "_", urlparse(address).netloc or address)
+
+
+class LimitedAlgodClient(algod.AlgodClient):
+    """AlgodClient whose requests share the host-wide budget"""
+
+    def __init__(self, algod_token: str, algod_address: str, rate: float = DEFAULT_RATE,
+                 burst: int = DEFAULT_BURST, retries: int = MAX_RETRIES, **kwargs):
+        super().__init__(algod_token, algod_address, **kwargs)
+        self.bucket = TokenBucket(_host(algod_address), rate, burst)
+        self.breaker = CircuitBreaker()
+        self.retries = retries
+
+    def algod_request(self, *args, **kwargs):
+        return call_limited(self.bucket, self.breaker,
+                            lambda: super(LimitedAlgodClient, self).algod_request(*args, **kwargs),
+                            _retries(self.retries, args, kwargs))
+
+
+class LimitedIndexerClient(indexer.IndexerClient):
+    """IndexerClient whose requests share the host-wide budget"""
+
+    def __init__(self, indexer_token: str, indexer_address: str, rate: float = DEFAULT_RATE,
+                 burst: int = DEFAULT_BURST, retries: int = MAX_RETRIES, **kwargs):
+        super().__init__(indexer_token, indexer_address, **kwargs)
+        self.bucket = TokenBucket(_host(indexer_address), rate, burst)
+        self.breaker = CircuitBreaker()
+        self.retries = retries
+
+    def indexer_request(self, *args, **kwargs):
+        return call_limited(self.bucket, self.breaker,
+                            lambda: super(LimitedIndexerClient, self).indexer_request(*args, **kwargs),
+                            _retries(self.retries, args, kwargs))
@@ -0,0 +1,193 @@
+"""
+Time-travel queries: bounty state as of any past round.
+
+algod only serves current box state. Replay rebuilds past state from the
+local history log (algoease.history). The log's events are the per-round
+deltas; each one is applied with apply_event(). Every SNAPSHOT_INTERVAL
+events, build() writes a full snapshot at the round boundary. A snapshot
+holds every bounty plus the log offset where the following round starts.
+
+state_at(R) loads the newest snapshot at or before R and applies only the
+events after it, up to R. That is never more than SNAPSHOT_INTERVAL
+events, plus those of one round.
+
+    python -m algoease.replay --round 41234567 [--bounty 12] [--app-id 749707697] [--build]
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from typing import Dict, List, Optional, Sequence, TextIO, Tuple
+
+from algoease.boxes import LAYOUTS, V2, Bounty, BoxLayout
+from algoease.client import get_app_id, get_indexer_client
+from algoease.history import CREATE, METHOD_STATUS, Event, HistoryLog
+
+SNAPSHOT_INTERVAL = 5_000     # events between snapshots
+SNAPSHOT_RE = re.compile(r"^snapshot-(\d+)\.json$")
+
+State = Dict[int, Bounty]
+
+
+def has_method(layout: BoxLayout, method: str) -> bool:
+    """Whether the layout's contract has the status a call to this method leaves behind"""
+    status = METHOD_STATUS.get(method)
+    return status is None or status in layout.statuses.values()
+
+
+def apply_event(state: State, event: Event, layout: BoxLayout = V2) -> None:
+    """Apply one confirmed call to the bounty state"""
+    status = METHOD_STATUS.get(event.method)
+    if status is None:
+        return
+    if not has_method(layout, event.method):
+        raise ValueError(f"{event.method} in round {event.round} leaves a bounty {status}, but the {layout.name} "
+                         f"layout has no {status} status: the log is from another contract version")
+    if event.method == CREATE:
+        for bounty_id in event.bounties:
+            # The contract records the caller as creator (and, from V5 on, as verifier)
+            state[bounty_id] = Bounty(
+                bounty_id, event.sender, None, event.amount, layout.status_code(status), event.task_desc, layout,
+                verifier=event.sender if layout.verifier_offset is not None else None,
+                deadline=event.deadline if layout.deadline_offset is not None else None)
+        return
+    for bounty_id in event.bounties:
+        bounty = state.get(bounty_id)
+        if bounty is None:
+            continue
+        bounty.status = layout.status_code(status)
+        if event.method == "accept_bounty":
+            bounty.freelancer = event.sender
+
+
+def _encode(bounty: Bounty) -> list:
+    return [bounty.bounty_id, bounty.creator, bounty.freelancer, bounty.amount, bounty.status, bounty.task_desc,
+            bounty.verifier, bounty.deadline]
+
+
+def _decode(row: list, layout: BoxLayout) -> Bounty:
+    bounty_id, creator, freelancer, amount, status, task_desc, verifier, deadline = row
+    return Bounty(bounty_id, creator, freelancer, amount, status, task_desc, layout, verifier, deadline)
+
+
+class Replay:
+    """Snapshots plus history-log deltas for one app"""
+
+    def __init__(self, log: HistoryLog, layout: BoxLayout = V2, snapshot_dir: Optional[str] = None,
+                 interval: int = SNAPSHOT_INTERVAL):
+        self.log = log
+        self.layout = layout
+        self.snapshot_dir = snapshot_dir or f"{log.path}.snapshots"
+        self.interval = interval
+
+    # ------------------------------------------------------------------ snapshots
+
+    def snapshots(self) -> List[int]:
+        """Rounds that have a snapshot, ascending"""
+        if not os.path.isdir(self.snapshot_dir):
+            return []
+        matches = (SNAPSHOT_RE.match(name) for name in os.listdir(self.snapshot_dir))
+        return sorted(int(m.group(1)) for m in matches if m)
+
+    def _path(self, round_number: int) -> str:
+        return os.path.join(self.snapshot_dir, f"snapshot-{round_number:012d}.json")
+
+    def _save(self, round_number: int, offset: int, state: State) -> None:
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+        path = self._path(round_number)
+        with open(f"{path}.tmp", 'w') as f:
+            json.dump({"app_id": self.log.app_id, "layout": self.layout.name, "round": round_number,
+                       "offset": offset, "bounties": [_encode(b) for _, b in sorted(state.items())]}, f)
+        os.replace(f"{path}.tmp", path)
+
+    def _load(self, round_number: int) -> Tuple[int, State]:
+        """(log offset after the snapshot round, state) of a stored snapshot"""
+        with open(self._path(round_number), 'r') as f:
+            snapshot = json.load(f)
+        return snapshot["offset"], {row[0]: _decode(row, self.layout) for row in snapshot["bounties"]}
+
+    def _base(self, round_number: int) -> Tuple[int, int, State]:
+        """(round, log offset, state) of the newest snapshot at or before round_number"""
+        rounds = [r for r in self.snapshots() if r <= round_number]
+        if not rounds:
+            return 0, 0, {}
+        offset, state = self._load(rounds[-1])
+        return rounds[-1], offset, state
+
+    def build(self) -> int:
+        """Snapshot the log from the newest snapshot on; returns the snapshots written"""
+        snapshot_round, offset, state = self._base(self.log.round)
+        written = 0
+        since = 0
+        last_round = snapshot_round
+        for event, end in self.log.entries(offset):
+            # Snapshots are only taken between rounds, once enough events have gone by
+            if event.round != last_round and since >= self.interval:
+                self._save(last_round, offset, state)
+                written += 1
+                since = 0
+            apply_event(state, event, self.layout)
+            last_round, offset = event.round, end
+            since += 1
+        return written
+
+    # ------------------------------------------------------------------ queries
+
+    def state_at(self, round_number: int) -> State:
+        """Every bounty as it was after round_number"""
+        if round_number > self.log.round:
+            raise ValueError(f"round {round_number} is past the synced history (round {self.log.round})")
+        _, offset, state = self._base(round_number)
+        for event in self.log.events(offset=offset, max_round=round_number):
+            apply_event(state, event, self.layout)
+        return state
+
+    def bounty_at(self, bounty_id: int, round_number: int) -> Optional[Bounty]:
+        return self.state_at(round_number).get(bounty_id)
+
+    def locked_at(self, round_number: int) -> int:
+        """microAlgos the escrow held for unfinished bounties after round_number"""
+        return sum(b.amount for b in self.state_at(round_number).values() if not b.is_terminal)
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main(argv: Optional[Sequence[str]] = None, out: TextIO = sys.stdout) -> int:
+    parser = argparse.ArgumentParser(description="Bounty state as of a past round")
+    parser.add_argument("--round", type=int, required=True, help="round to rebuild")
+    parser.add_argument("--bounty", type=int, help="show only this bounty")
+    parser.add_argument("--app-id", type=int, help="app (default: configured app)")
+    parser.add_argument("--history", help="history log (default: history-<app_id>.jsonl)")
+    parser.add_argument("--layout", choices=sorted(LAYOUTS), default=V2.name, help="box layout (default: v2)")
+    parser.add_argument("--build", action="store_true", help="sync the log and refresh snapshots first")
+    args = parser.parse_args(argv)
+
+    log = HistoryLog(args.app_id or get_app_id(), args.history)
+    replay = Replay(log, LAYOUTS[args.layout])
+    try:
+        if args.build:
+            log.sync(get_indexer_client())
+            replay.build()
+
+        if args.bounty is not None:
+            bounty = replay.bounty_at(args.bounty, args.round)
+            print(f"Bounty {args.bounty} at round {args.round}: {bounty if bounty else 'did not exist'}", file=out)
+            return 0 if bounty else 1
+
+        state = replay.state_at(args.round)
+    except ValueError as e:
+        print(f"[ERROR] {e}", file=out)
+        return 2
+    print(f"{len(state)} bounties at round {args.round}, "
+          f"{replay.locked_at(args.round) / 1_000_000:,.6f} ALGO locked", file=out)
+    for bounty_id, bounty in sorted(state.items()):
+        print(f"   #{bounty_id:<6} {bounty.status_name:<10} {bounty.amount / 1_000_000:>14,.6f} ALGO  "
+              f"creator {bounty.creator}  freelancer {bounty.freelancer or '-'}", file=out)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
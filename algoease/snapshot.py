@@ -0,0 +1,327 @@
+"""
+Memory-mapped binary bounty snapshots.
+
+A snapshot file holds the full bounty set as of one round. A service can
+start from disk instead of reading every box from the network:
+
+    header          magic, format version, layout, app ID, round,
+                    record count and size, block sizes and counts
+    block index     per block: file offset, stored and raw length,
+                    codec, first bounty ID (record blocks)
+    record blocks   fixed-width records sorted by bounty ID
+    heap blocks     the UTF-8 task descriptions, back to back
+
+A record is the bounty ID, then the box's fixed-width prefix byte for
+byte, then the offset and length of the description in the heap. The
+prefix is creator | freelancer | [verifier] | amount | [deadline] | status,
+big-endian as in the box. A record therefore decodes with the same box
+codec as a live box.
+
+Records are grouped BLOCK_RECORDS to a block and the heap is cut into
+HEAP_BLOCK byte blocks. Each block is zlib-compressed on its own, or
+stored raw when compression does not help, so a reader decodes only the
+blocks it touches. SnapshotReader mmaps the file and views the header
+and block index in place as NumPy arrays, so opening a snapshot takes
+well under a millisecond. For a file written with compress=False,
+records() is a zero-copy structured array over the mapping.
+
+    python -m algoease.snapshot write [--app-id 749707697] [--layout v2] [--out bounties.snap] [--raw]
+    python -m algoease.snapshot info bounties.snap
+    python -m algoease.snapshot get bounties.snap 12
+"""
+
+import argparse
+import mmap
+import os
+import struct
+import sys
+import zlib
+from collections import OrderedDict
+from typing import Iterable, Iterator, List, Optional, Sequence, TextIO
+
+import numpy as np
+from algosdk import encoding
+
+from algoease.boxes import LAYOUTS, V2, ZERO_ADDRESS_BYTES, Bounty, BoxLayout, decode_bounty, encode_bounty
+from algoease.client import get_algod_client, get_app_id
+from algoease.state import iter_bounties
+from algoease.store import BountyStore
+
+MAGIC = b"ALGOSNAP"
+VERSION = 1
+BLOCK_RECORDS = 4096
+HEAP_BLOCK = 256 * 1024
+CACHED_BLOCKS = 64
+
+CODEC_RAW = 0
+CODEC_ZLIB = 1
+
+# magic, version, layout, app ID, round, records, record size, records per block, heap block size,
+# heap size, record blocks, heap blocks
+HEADER = struct.Struct("<8sH8sQQQIIIQII")
+INDEX_DTYPE = np.dtype([("offset", "<u8"), ("stored", "<u8"), ("raw", "<u8"), ("codec", "u1"), ("first_id", "<u8")])
+
+
+class SnapshotError(Exception):
+    """The file is not a snapshot this version can read"""
+
+
+def record_dtype(layout: BoxLayout) -> np.dtype:
+    """Structured dtype of one record: bounty ID, the box prefix field by field, heap slice"""
+    fields = [("bounty_id", ">u8"), ("creator", "V32"), ("freelancer", "V32")]
+    if layout.verifier_offset is not None:
+        fields.append(("verifier", "V32"))
+    fields.append(("amount", ">u8"))
+    if layout.deadline_offset is not None:
+        fields.append(("deadline", ">u8"))
+    fields += [("status", "u1"), ("desc_offset", ">u8"), ("desc_length", ">u4")]
+    dtype = np.dtype(fields)
+    assert dtype.itemsize == 8 + layout.task_desc_offset + 12
+    return dtype
+
+# ============================================================================
+# Writing
+# ============================================================================
+
+def _blocks(data: bytes, block_size: int, compress: bool) -> List[tuple]:
+    """(stored bytes, raw length, codec) per block"""
+    blocks = []
+    for start in range(0, len(data), block_size):
+        raw = data[start:start + block_size]
+        packed = zlib.compress(raw, 6) if compress else raw
+        if compress and len(packed) < len(raw):
+            blocks.append((packed, len(raw), CODEC_ZLIB))
+        else:
+            blocks.append((raw, len(raw), CODEC_RAW))
+    return blocks
+
+
+def write_snapshot(path: str, bounties: Iterable[Bounty], round_number: int, app_id: int,
+                   layout: BoxLayout = V2, compress: bool = True, block_records: int = BLOCK_RECORDS,
+                   heap_block: int = HEAP_BLOCK) -> int:
+    """Write a snapshot atomically; returns the number of records"""
+    dtype = record_dtype(layout)
+    records = bytearray()
+    heap = bytearray()
+    first_ids = []
+    for index, bounty in enumerate(sorted(bounties, key=lambda b: b.bounty_id)):
+        if bounty.layout != layout:
+            raise ValueError(f"bounty {bounty.bounty_id} is {bounty.layout.name}, snapshot is {layout.name}")
+        value = encode_bounty(bounty)
+        desc = value[layout.task_desc_offset:]
+        if index % block_records == 0:
+            first_ids.append(bounty.bounty_id)
+        records += bounty.bounty_id.to_bytes(8, 'big') + value[:layout.task_desc_offset]
+        records += len(heap).to_bytes(8, 'big') + len(desc).to_bytes(4, 'big')
+        heap += desc
+    count = len(records) // dtype.itemsize
+
+    record_blocks = _blocks(bytes(records), block_records * dtype.itemsize, compress)
+    heap_blocks = _blocks(bytes(heap), heap_block, compress)
+    index = np.zeros(len(record_blocks) + len(heap_blocks), INDEX_DTYPE)
+    offset = HEADER.size + index.nbytes
+    for i, (stored, raw_length, codec) in enumerate(record_blocks + heap_blocks):
+        first_id = first_ids[i] if i < len(record_blocks) else 0
+        index[i] = (offset, len(stored), raw_length, codec, first_id)
+        offset += len(stored)
+
+    header = HEADER.pack(MAGIC, VERSION, layout.name.encode(), app_id, round_number, count, dtype.itemsize,
+                         block_records, heap_block, len(heap), len(record_blocks), len(heap_blocks))
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(header)
+        f.write(index.tobytes())
+        for stored, _, _ in record_blocks + heap_blocks:
+            f.write(stored)
+    os.replace(tmp_path, path)
+    return count
+
+# ============================================================================
+# Reading
+# ============================================================================
+
+class SnapshotReader:
+    """A snapshot file mapped into memory; blocks are decoded on first use"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._cache: "OrderedDict[tuple, bytes]" = OrderedDict()
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            self._file.close()
+            raise SnapshotError(f"{path} is empty")
+        if len(self._map) < HEADER.size:
+            self.close()
+            raise SnapshotError(f"{path} is too short for a snapshot header")
+        (magic, version, layout, self.app_id, self.round, self.count, record_size, self.block_records,
+         self.heap_block, self.heap_size, record_blocks, heap_blocks) = HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise SnapshotError(f"{path} is not a version {VERSION} bounty snapshot")
+        self.layout = LAYOUTS[layout.rstrip(b"\0").decode()]
+        self.dtype = record_dtype(self.layout)
+        if record_size != self.dtype.itemsize:
+            self.close()
+            raise SnapshotError(f"{path}: {record_size}-byte records do not match the {self.layout.name} layout")
+        index = np.frombuffer(self._map, INDEX_DTYPE, record_blocks + heap_blocks, HEADER.size)
+        self.record_index, self.heap_index = index[:record_blocks], index[record_blocks:]
+
+    def __enter__(self) -> "SnapshotReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def close(self) -> None:
+        """Unmap the file; arrays returned by records() must not be used afterwards"""
+        self.record_index = self.heap_index = None
+        self._cache.clear()
+        try:
+            self._map.close()
+        except BufferError:
+            # A zero-copy view is still alive; the mapping goes away with it
+            pass
+        self._file.close()
+
+    # ------------------------------------------------------------------ blocks
+
+    def _block(self, index: np.ndarray, i: int, kind: str) -> memoryview:
+        entry = index[i]
+        start, stored = int(entry["offset"]), int(entry["stored"])
+        if entry["codec"] == CODEC_RAW:
+            return memoryview(self._map)[start:start + stored]
+        key = (kind, i)
+        data = self._cache.get(key)
+        if data is None:
+            data = zlib.decompress(self._map[start:start + stored])
+            self._cache[key] = data
+            if len(self._cache) > CACHED_BLOCKS:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+        return memoryview(data)
+
+    def block(self, i: int) -> np.ndarray:
+        """Records of one record block"""
+        return np.frombuffer(self._block(self.record_index, i, "records"), self.dtype)
+
+    def records(self) -> np.ndarray:
+        """Every record as a structured array; zero-copy when all record blocks are raw"""
+        if not len(self.record_index):
+            return np.zeros(0, self.dtype)
+        if (self.record_index["codec"] == CODEC_RAW).all():
+            return np.frombuffer(self._map, self.dtype, self.count, int(self.record_index[0]["offset"]))
+        return np.concatenate([self.block(i) for i in range(len(self.record_index))])
+
+    def task_desc_bytes(self, offset: int, length: int) -> bytes:
+        parts = []
+        while length > 0:
+            i, start = divmod(offset, self.heap_block)
+            chunk = self._block(self.heap_index, i, "heap")[start:start + length]
+            parts.append(bytes(chunk))
+            offset += len(chunk)
+            length -= len(chunk)
+        return b"".join(parts)
+
+    # ------------------------------------------------------------------ bounties
+
+    def record(self, bounty_id: int) -> Optional[np.void]:
+        """The record of one bounty, decoding only its block; None if absent"""
+        if not len(self.record_index):
+            return None
+        i = int(np.searchsorted(self.record_index["first_id"], bounty_id, side="right")) - 1
+        if i < 0:
+            return None
+        block = self.block(i)
+        row = int(np.searchsorted(block["bounty_id"], bounty_id))
+        if row == len(block) or block[row]["bounty_id"] != bounty_id:
+            return None
+        return block[row]
+
+    def _bounty(self, record: np.void) -> Bounty:
+        prefix = record.tobytes()[8:8 + self.layout.task_desc_offset]
+        desc = self.task_desc_bytes(int(record["desc_offset"]), int(record["desc_length"]))
+        return decode_bounty(int(record["bounty_id"]), prefix + desc, self.layout)
+
+    def bounty(self, bounty_id: int) -> Optional[Bounty]:
+        record = self.record(bounty_id)
+        return None if record is None else self._bounty(record)
+
+    def __iter__(self) -> Iterator[Bounty]:
+        for i in range(len(self.record_index)):
+            for record in self.block(i):
+                yield self._bounty(record)
+
+    def to_store(self) -> BountyStore:
+        """Columnar store of every bounty, filled column by column"""
+        records = self.records()
+        store = BountyStore(self.layout, capacity=max(len(records), 1))
+        store.round = self.round
+        # Encode each distinct address once, then map every row through the distinct index
+        raw = np.concatenate([records["creator"], records["freelancer"]]).view("S32")
+        distinct, inverse = np.unique(raw, return_inverse=True)
+        ids = np.array([store.addresses.intern(None if address.ljust(32, b"\0") == ZERO_ADDRESS_BYTES
+                                               else encoding.encode_address(address.ljust(32, b"\0")))
+                        for address in distinct.tolist()], np.uint32)
+        mapped = ids[inverse.reshape(-1)]
+        columns = {
+            "bounty_id": records["bounty_id"].astype(np.uint64),
+            "creator": mapped[:len(records)],
+            "freelancer": mapped[len(records):],
+            "amount": records["amount"].astype(np.uint64),
+            "status": records["status"],
+        }
+        if "deadline" in records.dtype.names:
+            columns["deadline"] = records["deadline"].astype(np.uint64)
+        store.append_columns(columns, self.round)
+        return store
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main(argv: Optional[Sequence[str]] = None, out: TextIO = sys.stdout) -> int:
+    parser = argparse.ArgumentParser(description="Write and inspect binary bounty snapshots")
+    commands = parser.add_subparsers(dest="command", required=True)
+    write = commands.add_parser("write", help="snapshot every bounty box from the chain")
+    write.add_argument("--app-id", type=int, help="app to read (default: configured app)")
+    write.add_argument("--layout", choices=sorted(LAYOUTS), default=V2.name, help="box layout (default: v2)")
+    write.add_argument("--out", help="snapshot file (default: bounties-<app_id>.snap)")
+    write.add_argument("--raw", action="store_true", help="store blocks uncompressed (zero-copy reads)")
+    info = commands.add_parser("info", help="show a snapshot's header")
+    info.add_argument("path")
+    get = commands.add_parser("get", help="show one bounty from a snapshot")
+    get.add_argument("path")
+    get.add_argument("bounty_id", type=int)
+    args = parser.parse_args(argv)
+
+    if args.command == "write":
+        client = get_algod_client()
+        app_id = args.app_id or get_app_id()
+        layout = LAYOUTS[args.layout]
+        path = args.out or f"bounties-{app_id}.snap"
+        round_number = client.status()["last-round"]
+        count = write_snapshot(path, iter_bounties(client, app_id, layout), round_number, app_id, layout,
+                               compress=not args.raw)
+        print(f"Wrote {count} bounties at round {round_number} to {path} ({os.path.getsize(path):,} bytes)",
+              file=out)
+        return 0
+
+    with SnapshotReader(args.path) as reader:
+        if args.command == "info":
+            print(f"{args.path}: app {reader.app_id}, {reader.layout.name} layout, round {reader.round}, "
+                  f"{reader.count} bounties in {len(reader.record_index)} record blocks, "
+                  f"{reader.heap_size:,} bytes of descriptions in {len(reader.heap_index)} heap blocks", file=out)
+            return 0
+        bounty = reader.bounty(args.bounty_id)
+        print(bounty if bounty else f"Bounty {args.bounty_id} is not in the snapshot", file=out)
+        return 0 if bounty else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
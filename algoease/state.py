@@ -0,0 +1,58 @@
+"""
+Chain reads for AlgoEase apps: global state and bounty boxes.
+"""
+
+import base64
+from typing import Dict, Iterator, List, Optional
+
+from algosdk import error
+
+from algoease.boxes import V2, Bounty, BoxLayout, box_name, bounty_id_from_box_name, decode_bounty
+
+
+def decode_state(state_array) -> Dict[str, object]:
+    """Decode the global state"""
+    state = {}
+    for item in state_array:
+        key = base64.b64decode(item['key']).decode('utf-8', errors='replace')
+        value = item['value']
+        if value['type'] == 1:  # uint
+            state[key] = value.get('uint', 0)
+        elif value['type'] == 2:  # bytes
+            state[key] = base64.b64decode(value.get('bytes', ''))
+    return state
+
+
+def get_global_state(client, app_id: int) -> Dict[str, object]:
+    app_info = client.application_info(app_id)
+    return decode_state(app_info.get('params', {}).get('global-state', []))
+
+
+def get_bounty_count(client, app_id: int) -> int:
+    """Next bounty ID the contract will assign"""
+    return int(get_global_state(client, app_id).get('bounty_count', 0))
+
+
+def get_bounty(client, app_id: int, bounty_id: int, layout: BoxLayout = V2) -> Optional[Bounty]:
+    """Read and decode one bounty box; None if the box does not exist"""
+    try:
+        response = client.application_box_by_name(app_id, box_name(bounty_id))
+    except error.AlgodHTTPError as e:
+        if e.code == 404:
+            return None
+        raise
+    return decode_bounty(bounty_id, base64.b64decode(response['value']), layout)
+
+
+def list_bounty_ids(client, app_id: int) -> List[int]:
+    """IDs of every bounty box the app currently holds"""
+    response = client.application_boxes(app_id)
+    ids = (bounty_id_from_box_name(base64.b64decode(box['name'])) for box in response.get('boxes', []))
+    return sorted(i for i in ids if i is not None)
+
+
+def iter_bounties(client, app_id: int, layout: BoxLayout = V2) -> Iterator[Bounty]:
+    for bounty_id in list_bounty_ids(client, app_id):
+        bounty = get_bounty(client, app_id, bounty_id, layout)
+        if bounty is not None:
+            yield bounty
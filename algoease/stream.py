@@ -0,0 +1,278 @@
+"""
+Push stream of bounty state changes over Server-Sent Events.
+
+One chain reader (Follower) long-polls algod for each new round, re-reads
+only the bounty boxes the round touched, and hands the changes to a
+Broker. The Broker fans them out to every subscriber whose filter matches.
+A change is on the wire within one round of being confirmed, and algod
+sees one reader however many clients listen.
+
+    GET /events?bounty=3,7&creator=ADDR&freelancer=ADDR[&since=ROUND]
+    GET /health
+
+Every message carries all of one round's matching changes, with the round
+as its SSE id. A dropped EventSource reconnects with Last-Event-ID. The
+stream then resumes after that round from the Broker's backlog, which holds
+the last RETAIN_ROUNDS rounds. An older cursor gets a "reset" event: the
+client reloads full state and continues from the id on that event.
+
+    python -m algoease.stream [--app-id 749707697] [--layout v2] [--host 127.0.0.1] [--port 8765]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Deque, Dict, Iterable, List, Optional, Sequence, Set, TextIO, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from algoease.boxes import LAYOUTS, V2, Bounty, BoxLayout
+from algoease.client import get_algod_client, get_app_id
+from algoease.dashboard import Dashboard
+
+RETAIN_ROUNDS = 10_000     # about eight hours of rounds kept for resuming clients
+MAX_QUEUED = 1_000         # rounds a slow subscriber may fall behind before it is dropped
+HEARTBEAT_SECONDS = 15.0
+RETRY_MS = 2_000
+
+
+@dataclass
+class Change:
+    """One bounty box that differs after a round; status None means the box is gone"""
+    round: int
+    bounty_id: int
+    old_status: Optional[str]
+    status: Optional[str]
+    creator: str
+    freelancer: Optional[str]
+    amount: int
+
+    @classmethod
+    def of(cls, round_number: int, old: Optional[Bounty], new: Optional[Bounty]) -> "Change":
+        current = new or old
+        return cls(round_number, current.bounty_id, old.status_name if old else None,
+                   new.status_name if new else None, current.creator, current.freelancer, current.amount)
+
+
+class Follower(Dashboard):
+    """The dashboard's box cache, collecting every changed bounty per round instead of drawing it"""
+
+    def __init__(self, client, app_id: int, layout: BoxLayout = V2):
+        super().__init__(client, app_id, layout)
+        self.changes: List[Change] = []
+
+    def refresh(self, bounty_ids: Iterable[int], round_number: int) -> None:
+        bounty_ids = sorted(bounty_ids)
+        old = {bounty_id: self.bounties.get(bounty_id) for bounty_id in bounty_ids}
+        super().refresh(bounty_ids, round_number)
+        for bounty_id in bounty_ids:
+            new = self.bounties.get(bounty_id)
+            if new != old[bounty_id]:
+                self.changes.append(Change.of(round_number, old[bounty_id], new))
+
+    def next_rounds(self) -> List[Tuple[int, List[Change]]]:
+        """Block until the next round; returns (round, changes) for every round applied, empty ones included"""
+        start = self.round
+        self.next_round()
+        by_round: Dict[int, List[Change]] = {r: [] for r in range(start + 1, self.round + 1)}
+        for change in self.changes:
+            by_round[change.round].append(change)
+        self.changes = []
+        return sorted(by_round.items())
+
+# ============================================================================
+# Fan-out
+# ============================================================================
+
+@dataclass(eq=False)
+class Subscription:
+    """A client's filter and its queue of (round, changes); empty filters match everything"""
+    bounty_ids: Set[int] = field(default_factory=set)
+    creators: Set[str] = field(default_factory=set)
+    freelancers: Set[str] = field(default_factory=set)
+    queue: "asyncio.Queue[Optional[Tuple[int, List[Change]]]]" = field(default_factory=asyncio.Queue)
+
+    def matches(self, change: Change) -> bool:
+        if not (self.bounty_ids or self.creators or self.freelancers):
+            return True
+        return (change.bounty_id in self.bounty_ids or change.creator in self.creators
+                or change.freelancer in self.freelancers)
+
+    def select(self, changes: Sequence[Change]) -> List[Change]:
+        return [change for change in changes if self.matches(change)]
+
+
+class Broker:
+    """Recent rounds' changes plus the live subscribers they are pushed to"""
+
+    def __init__(self, retain_rounds: int = RETAIN_ROUNDS):
+        self.retain_rounds = retain_rounds
+        self.round = 0
+        self.first_round = 0       # resuming is exact for cursors at or after this round
+        self.backlog: Deque[Tuple[int, List[Change]]] = deque()
+        self.subscribers: Set[Subscription] = set()
+
+    def start(self, round_number: int) -> None:
+        """The follower's cache is current as of round_number; nothing older can be replayed"""
+        self.round = self.first_round = round_number
+
+    def publish(self, round_number: int, changes: List[Change]) -> None:
+        self.round = round_number
+        if changes:
+            self.backlog.append((round_number, changes))
+        self.first_round = max(self.first_round, round_number - self.retain_rounds)
+        while self.backlog and self.backlog[0][0] <= self.first_round:
+            self.backlog.popleft()
+        for subscription in list(self.subscribers):
+            selected = subscription.select(changes)
+            if not selected:
+                continue
+            if subscription.queue.qsize() >= MAX_QUEUED:
+                # Too far behind: end its stream; it resumes from its cursor on reconnect
+                self.unsubscribe(subscription)
+                subscription.queue.put_nowait(None)
+            else:
+                subscription.queue.put_nowait((round_number, selected))
+
+    def subscribe(self, subscription: Subscription, since: Optional[int] = None) -> Tuple[int, bool]:
+        """Register a subscriber and queue what it missed after `since`.
+
+        Returns (cursor, resumed). Without a cursor, or one older than the
+        backlog, the subscriber starts at the current round and resumed is
+        False."""
+        self.subscribers.add(subscription)
+        if since is None or since < self.first_round or since > self.round:
+            return self.round, False
+        for round_number, changes in self.backlog:
+            selected = subscription.select(changes) if round_number > since else []
+            if selected:
+                subscription.queue.put_nowait((round_number, selected))
+        return since, True
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self.subscribers.discard(subscription)
+
+# ============================================================================
+# HTTP
+# ============================================================================
+
+def _message(event: str, data, event_id: Optional[int] = None) -> bytes:
+    lines = [f"id: {event_id}"] if event_id is not None else []
+    lines += [f"event: {event}", f"data: {json.dumps(data, separators=(',', ':'))}"]
+    return ("\n".join(lines) + "\n\n").encode()
+
+
+def _response(status: str, body: bytes, content_type: str = "application/json") -> bytes:
+    return (f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\nContent-Length: {len(body)}\r\n"
+            f"Access-Control-Allow-Origin: *\r\nConnection: close\r\n\r\n").encode() + body
+
+
+def parse_subscription(query: Dict[str, List[str]]) -> Subscription:
+    def values(key: str) -> Set[str]:
+        return {v for raw in query.get(key, []) for v in raw.split(",") if v}
+    return Subscription({int(v) for v in values("bounty")}, values("creator"), values("freelancer"))
+
+
+class StreamServer:
+    """SSE endpoint over a Broker"""
+
+    def __init__(self, broker: Broker, heartbeat: float = HEARTBEAT_SECONDS):
+        self.broker = broker
+        self.heartbeat = heartbeat
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request = await reader.readuntil(b"\r\n\r\n")
+            request_line, *header_lines = request.decode("latin-1").split("\r\n")
+            method, target, _ = request_line.split(" ", 2)
+            headers = {k.strip().lower(): v.strip() for k, _, v in (h.partition(":") for h in header_lines if h)}
+            url = urlsplit(target)
+            if method != "GET":
+                writer.write(_response("405 Method Not Allowed", b'{"error":"GET only"}'))
+            elif url.path == "/health":
+                body = {"round": self.broker.round, "first_round": self.broker.first_round,
+                        "subscribers": len(self.broker.subscribers)}
+                writer.write(_response("200 OK", json.dumps(body).encode()))
+            elif url.path == "/events":
+                await self._events(writer, parse_qs(url.query), headers)
+            else:
+                writer.write(_response("404 Not Found", b'{"error":"not found"}'))
+            await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _events(self, writer: asyncio.StreamWriter, query: Dict[str, List[str]],
+                      headers: Dict[str, str]) -> None:
+        cursor = headers.get("last-event-id") or next(iter(query.get("since", [])), None)
+        subscription = parse_subscription(query)
+        since, resumed = self.broker.subscribe(subscription, int(cursor) if cursor else None)
+        try:
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nCache-Control: no-cache\r\n"
+                         b"Access-Control-Allow-Origin: *\r\nConnection: keep-alive\r\n\r\n")
+            writer.write(f"retry: {RETRY_MS}\n\n".encode())
+            writer.write(_message("ready" if resumed or cursor is None else "reset", {"round": since}, since))
+            await writer.drain()
+            while True:
+                try:
+                    item = await asyncio.wait_for(subscription.queue.get(), self.heartbeat)
+                except asyncio.TimeoutError:
+                    writer.write(b": keep-alive\n\n")
+                    await writer.drain()
+                    continue
+                if item is None:
+                    return
+                round_number, changes = item
+                writer.write(_message("changes", [asdict(c) for c in changes], round_number))
+                await writer.drain()
+        finally:
+            self.broker.unsubscribe(subscription)
+
+# ============================================================================
+# Service
+# ============================================================================
+
+async def follow(follower: Follower, broker: Broker, out: TextIO = sys.stdout) -> None:
+    """Feed every round the follower reads into the broker"""
+    await asyncio.to_thread(follower.load)
+    broker.start(follower.round)
+    while True:
+        try:
+            rounds = await asyncio.to_thread(follower.next_rounds)
+        except Exception as e:
+            out.write(f"[WARN] {e}; retrying\n")
+            await asyncio.sleep(2)
+            continue
+        for round_number, changes in rounds:
+            broker.publish(round_number, changes)
+
+
+async def serve(follower: Follower, host: str, port: int, out: TextIO = sys.stdout) -> None:
+    broker = Broker()
+    server = await asyncio.start_server(StreamServer(broker).handle, host, port)
+    print(f"Streaming app {follower.app_id} on http://{host}:{port}/events", file=out)
+    async with server:
+        await asyncio.gather(server.serve_forever(), follow(follower, broker, out))
+
+
+def main(argv: Optional[Sequence[str]] = None, out: TextIO = sys.stdout) -> int:
+    parser = argparse.ArgumentParser(description="Push bounty state changes to subscribers over SSE")
+    parser.add_argument("--app-id", type=int, help="app to follow (default: configured app)")
+    parser.add_argument("--layout", choices=sorted(LAYOUTS), default=V2.name, help="box layout (default: v2)")
+    parser.add_argument("--host", default="127.0.0.1", help="listen address (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="listen port (default: 8765)")
+    args = parser.parse_args(argv)
+
+    follower = Follower(get_algod_client(), args.app_id or get_app_id(), LAYOUTS[args.layout])
+    try:
+        asyncio.run(serve(follower, args.host, args.port, out))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
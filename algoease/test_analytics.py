@@ -0,0 +1,38 @@
+"""
+Tests for the escrow analytics report
+"""
+
+from algoease.analytics import DAY, HOUR, HistoryTables, build_report, write_report
+from algoease.history import Event
+
+T0 = 1_700_006_400   # midnight UTC
+
+
+def event(time, method, bounty_ids, sender="CREATOR", amount=0, paid=()):
+    return Event(time // 10, time, "TX", method, sender, list(bounty_ids), amount, 0, list(paid))
+
+
+def test_report_reduces_history(tmp_path):
+    events = [
+        event(T0, "create_bounty", [0], amount=5_000_000),
+        event(T0 + HOUR, "create_bounty", [1], sender="OTHER", amount=3_000_000),
+        event(T0 + 2 * HOUR, "create_bounty", [2], amount=1_000_000),
+        event(T0 + 4 * HOUR, "approve_bounty", [0], paid=[("F", 5_000_000)]),
+        event(T0 + DAY + HOUR, "reject_bounty", [1], paid=[("OTHER", 3_000_000)]),
+        event(T0 + 2 * DAY, "create_bounty", [3], amount=2_000_000),
+    ]
+    report = build_report(HistoryTables().extend(events), app_id=7)
+
+    assert report["bounties"] == {"created": 4, "value_created": 11_000_000, "approved": 1, "rejected": 1,
+                                  "refunded": 0, "unfinished": 2}
+    assert report["rejection_rate"] == 0.5
+    assert report["time_to_approve"]["median_hours"] == 4.0
+    assert report["peak_locked"] == {"microalgos": 9_000_000, "date": "2023-11-15"}
+    assert [(d["created"], d["paid_out"], d["locked"]) for d in report["daily"]] == [
+        (3, 5_000_000, 4_000_000), (0, 3_000_000, 1_000_000), (1, 0, 3_000_000)]
+    assert [(c["address"], c["value"]) for c in report["top_creators"]] == [("CREATOR", 8_000_000),
+                                                                            ("OTHER", 3_000_000)]
+
+    json_path, html_path = write_report(report, str(tmp_path / "report"))
+    with open(html_path) as f:
+        assert "Rejection rate" in f.read()
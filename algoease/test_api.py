@@ -0,0 +1,112 @@
+"""
+Tests for the read API over the local mirror
+"""
+
+import asyncio
+import json
+
+import msgpack
+
+from algoease.api import HttpProtocol, Mirror, ReadApi
+from algoease.boxes import V2, Bounty
+
+ACCEPTED = V2.status_code("ACCEPTED")
+
+
+def mirror_of(count):
+    mirror = Mirror(V2)
+    mirror.load([Bounty(i, "ALICE" if i % 2 else "BOB", None, 1_000 * i, 0, f"task {i}", V2) for i in range(count)], 10)
+    return mirror
+
+
+def body(response):
+    return json.loads(response.split(b"\r\n\r\n", 1)[1])
+
+
+def test_keyset_pages_follow_indexes():
+    mirror = mirror_of(10)
+    mirror.apply(12, 3, Bounty(3, "ALICE", "CAROL", 3_000, ACCEPTED, "task 3", V2))
+    mirror.apply(13, 7, Bounty(7, "ALICE", "CAROL", 7_000, ACCEPTED, "task 7", V2))
+
+    page, next_id = mirror.page(limit=3, creator="ALICE")
+    assert [b["bounty_id"] for b in page] == [1, 3, 5] and next_id == 5
+    page, next_id = mirror.page(after=next_id, limit=3, creator="ALICE")
+    assert [b["bounty_id"] for b in page] == [7, 9] and next_id is None
+    page, _ = mirror.page(status="OPEN", creator="ALICE")
+    assert [b["bounty_id"] for b in page] == [1, 5, 9]
+    page, _ = mirror.page(freelancer="CAROL")
+    assert [(b["bounty_id"], b["updated_round"]) for b in page] == [(3, 12), (7, 13)]
+    assert mirror.by_status[0] == [0, 1, 2, 4, 5, 6, 8, 9]
+
+    mirror.apply(14, 3, None)
+    assert mirror.many([3, 7]) == ([mirror.get(7)], [3])
+    assert 3 not in mirror.ids and mirror.by_freelancer["CAROL"] == [7]
+
+
+def test_etags_and_binary_responses():
+    mirror = mirror_of(4)
+    api = ReadApi(mirror, app_id=7)
+    response = api.respond("GET", "/bounties/2", {})
+    assert response.startswith(b"HTTP/1.1 200 OK") and b'ETag: W/"7-10"' in response
+    assert body(response)["bounty"]["task_desc"] == "task 2"
+    assert api.respond("GET", "/bounties/2", {"if-none-match": 'W/"7-10"'}).startswith(b"HTTP/1.1 304")
+
+    mirror.apply(11, 2, Bounty(2, "BOB", "CAROL", 2_000, ACCEPTED, "task 2", V2))
+    mirror.round = 11
+    response = api.respond("GET", "/bounties/2", {"if-none-match": 'W/"7-10"'})
+    assert response.startswith(b"HTTP/1.1 200") and b"X-Algoease-Round: 11" in response
+
+    packed = api.respond("GET", "/bounties?ids=1,2,9", {"accept": "application/msgpack"})
+    assert b"Content-Type: application/msgpack" in packed
+    decoded = msgpack.unpackb(packed.split(b"\r\n\r\n", 1)[1])
+    assert [b["bounty_id"] for b in decoded["bounties"]] == [1, 2] and decoded["missing"] == [9]
+
+    assert api.respond("GET", "/bounties/9", {}).startswith(b"HTTP/1.1 404")
+    assert body(api.respond("GET", "/bounties?status=LOST", {}))["error"] == "unknown status LOST"
+    assert api.respond("GET", "/bounties?limit=x", {}).startswith(b"HTTP/1.1 400")
+
+
+def test_keep_alive_and_pipelining():
+    async def run():
+        api = ReadApi(mirror_of(3), app_id=7)
+        server = await asyncio.get_running_loop().create_server(lambda: HttpProtocol(api), "127.0.0.1", 0)
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.sockets[0].getsockname()[1])
+        writer.write(b"GET /bounties/0 HTTP/1.1\r\n\r\nGET /health HTTP/1.1\r\nConnection: close\r\n\r\n")
+        data = await reader.read()
+        writer.close()
+        server.close()
+        await server.wait_closed()
+        return data
+
+    data = asyncio.run(run())
+    assert data.count(b"HTTP/1.1 200 OK") == 2
+    assert b'"bounties":3' in data
+
+
+def test_min_round_waits_for_the_follower():
+    async def run():
+        mirror = mirror_of(3)
+        api = ReadApi(mirror, app_id=7, min_round_wait=0.2)
+        server = await asyncio.get_running_loop().create_server(lambda: HttpProtocol(api), "127.0.0.1", 0)
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.sockets[0].getsockname()[1])
+        # The write landed in round 11; the mirror is still at round 10
+        writer.write(b"GET /bounties/2?min_round=11 HTTP/1.1\r\n\r\nGET /health HTTP/1.1\r\n\r\n")
+        await asyncio.sleep(0.05)
+        mirror.apply(11, 2, Bounty(2, "BOB", "CAROL", 2_000, ACCEPTED, "task 2", V2))
+        mirror.advance(11)
+        first = await reader.readuntil(b"}}")
+        second = await reader.readuntil(b"}")
+        assert b"X-Algoease-Round: 11" in first and b'"status":"ACCEPTED"' in first
+        # Answered on arrival at round 10, but held back to keep the responses in order
+        assert b'"round":10' in second
+
+        writer.write(b"GET /bounties/2?min_round=50 HTTP/1.1\r\nConnection: close\r\n\r\n")
+        timed_out = await reader.read()
+        writer.close()
+        server.close()
+        await server.wait_closed()
+        return timed_out
+
+    timed_out = asyncio.run(run())
+    assert timed_out.startswith(b"HTTP/1.1 503") and b"Retry-After: 1" in timed_out
+    assert b'"round":11' in timed_out
@@ -0,0 +1,51 @@
+"""
+Tests for the offline TEAL assembler.
+
+Expected hashes in ALGOD_HASHES come from algod's compile endpoint for the
+same files. ASSEMBLER_HASHES pins this assembler's own output for files not
+yet checked against algod; it catches regressions, not assembler bugs.
+"""
+
+import pytest
+
+from algoease.assembler import TealAssemblyError, assemble, assemble_file, program_address
+
+ALGOD_HASHES = {
+    "contracts/algoease_bounty_escrow_v2_approval.teal": "HZHQWTYTOKP6RHHJRM73DMAVCVU5JEWWIFWECRXOGND4WSL3YRMFDIMDUI",
+    "contracts/algoease_approval.teal": "TVS2OBQJNWD65JPBCBIAVZ4CL5WHDSIWLIC3NDM3C4NEZ4PAG2QTOWZGIQ",
+    "contracts/algoease_clear.teal": "OHV4S2PM4R3XXXQOIKERQ6OV2OYRZZG6A66XSUVR5ADF4NXVPEZRXMYYQE",
+    "algoease_approval.teal": "774OBN6E2E6FGVXGBHKJZK4OIZE24KSQO4P63BYKKJZTAHWNC66YZRNELE",
+    "algoease_approval_v5.teal": "7C2MSPEG6KF4A5HOZKHHMR2DHAK6F7QB62KBSOCCPVWVO4DXGVIUZGFQY4",
+}
+
+# Move an entry to ALGOD_HASHES once algod's /v2/teal/compile has confirmed it
+ASSEMBLER_HASHES = {
+    "contracts/algoease_approval_v7.teal": "XFBUMEESRBEAAXOI3T7BJMMAUTA2WIZ6JPZU7J5LN4B5GZINLOIRTOLLGY",
+}
+
+
+@pytest.mark.parametrize("path", sorted(ALGOD_HASHES))
+def test_matches_algod(path):
+    assert program_address(assemble_file(path)) == ALGOD_HASHES[path]
+
+
+@pytest.mark.parametrize("path", sorted(ASSEMBLER_HASHES))
+def test_output_is_unchanged(path):
+    assert program_address(assemble_file(path)) == ASSEMBLER_HASHES[path]
+
+
+def test_constant_blocks():
+    # 7 and "k" repeat and go into the blocks; 9 and "x" are used once and get pushed
+    program = assemble('#pragma version 8\nint 7\nint 9\nint 7\nbyte "k"\nbyte "x"\nbyte "k"\n')
+    assert program.hex() == "08" "200107" "2601016b" "22" "8109" "22" "28" "800178" "28"
+
+
+def test_branch_offsets():
+    program = assemble("#pragma version 8\nloop:\nint 1\nbnz done\nb loop\ndone:\nint 1\n")
+    # bnz skips the 3-byte b; b jumps back over itself, bnz and intc_0
+    assert program.hex() == "08" "200101" "22" "400003" "42fff9" "22"
+
+
+def test_unknown_opcode():
+    with pytest.raises(TealAssemblyError, match="line 2"):
+        assemble("#pragma version 8\nfrobnicate\n")
@@ -0,0 +1,75 @@
+"""
+Tests for the bulk balance checker
+"""
+
+import runpy
+import sys
+import threading
+from pathlib import Path
+
+import msgpack
+import pytest
+from algosdk import account
+from algosdk.logic import get_application_address
+
+from algoease import balances
+from algoease.balances import BalanceChecker, format_table, resolve_target
+
+
+class FakeAlgod:
+
+    def __init__(self, round_number=50):
+        self.round = round_number
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def algod_request(self, method, requrl, params=None, data=None, headers=None, response_format="json", timeout=30):
+        assert params["format"] == response_format == "msgpack"
+        address = requrl.rsplit("/", 1)[-1]
+        with self.lock:
+            self.calls.append((address, params.get("exclude")))
+        return msgpack.packb({"address": address, "amount": 5_000_000, "min-balance": 100_000 * (1 + len(address) % 3),
+                              "round": self.round})
+
+
+def test_fetches_trimmed_accounts_once_per_round():
+    client = FakeAlgod()
+    _, a = account.generate_account()
+    _, b = account.generate_account()
+    checker = BalanceChecker(client)
+
+    balances = checker.balances([("a", a), ("b", b), ("again", a)])
+    assert [x.label for x in balances] == ["a", "b", "again"]
+    assert balances[2].amount == balances[0].amount
+    assert sorted(client.calls) == sorted([(a, "all"), (b, "all")])
+
+    checker.balances([("a", a), ("b", b)], at_round=50)
+    assert len(client.calls) == 2
+
+    client.round = 51
+    fresh = checker.balances([("a", a)], at_round=51)
+    assert len(client.calls) == 3 and fresh[0].round == 51
+    assert "LOW" in format_table(fresh, min_available=fresh[0].available + 1)
+
+
+def test_resolve_target():
+    _, address = account.generate_account()
+    assert resolve_target(address) == (address[:8], address)
+    assert resolve_target("749707697") == ("app 749707697", get_application_address(749707697))
+    assert resolve_target("app", {"REACT_APP_CONTRACT_APP_ID": "12"}) == ("app 12", get_application_address(12))
+    with pytest.raises(ValueError):
+        resolve_target("not-an-address")
+
+
+def test_quick_check_script_takes_extra_addresses(monkeypatch, capsys):
+    client = FakeAlgod()
+    _, extra = account.generate_account()
+    monkeypatch.setattr(balances, "get_algod_client", lambda: client)
+    monkeypatch.setattr(balances, "load_config", lambda: {})
+    monkeypatch.setattr(sys, "argv", ["check-balance-quick.py", extra])
+
+    with pytest.raises(SystemExit) as exit_info:
+        runpy.run_path(str(Path(__file__).parent.parent / "scripts" / "check-balance-quick.py"), run_name="__main__")
+    assert exit_info.value.code == 0
+    assert sorted(address for address, _ in client.calls) == sorted(
+        ["3AU6XYBNSEW7DRXJVNTGDAZLUYL54CTW3BUYKTBN6LX76KJ3EAVIQLPEBI", extra])
@@ -0,0 +1,75 @@
+"""
+Tests for the JSONL batch runner
+"""
+
+import base64
+import io
+import json
+
+import msgpack
+from algosdk import account, mnemonic, transaction
+
+from algoease.batch import BatchRunner
+
+APP_ID = 749707697
+
+
+class FakeAlgod:
+    """Accepts every group; the app's bounty_count starts at 5"""
+
+    def __init__(self):
+        self.groups = []
+        self.param_fetches = 0
+        self.simulations = 0
+
+    def suggested_params(self):
+        self.param_fetches += 1
+        return transaction.SuggestedParams(fee=0, first=1, last=1000, gh="SGO1GKSzyE7IEPItTxCByw9x8FmnrCDexi9/cOUJOiI=",
+                                           min_fee=1000)
+
+    def application_info(self, app_id):
+        return {"params": {"global-state": [
+            {"key": base64.b64encode(b"bounty_count").decode(), "value": {"type": 1, "uint": 5}},
+        ]}}
+
+    def simulate_transactions(self, request):
+        self.simulations += 1
+        return {"txn-groups": [{"txn-results": [{} for _ in request.txn_groups[0].txns]}]}
+
+    def send_raw_transaction(self, blob):
+        unpacker = msgpack.Unpacker(raw=False)
+        unpacker.feed(base64.b64decode(blob))
+        self.groups.append([transaction.SignedTransaction.undictify(d).transaction for d in unpacker])
+        return "TXID"
+
+    def status(self):
+        return {"last-round": 100}
+
+    def pending_transaction_info(self, txid, response_format="json"):
+        return msgpack.packb({"confirmed-round": 101, "pool-error": ""})
+
+
+def test_lifecycle_batch():
+    creator_key, _ = account.generate_account()
+    freelancer_key, freelancer = account.generate_account()
+    config = {"REACT_APP_CREATOR_MNEMONIC": mnemonic.from_private_key(creator_key),
+              "FREELANCER": mnemonic.from_private_key(freelancer_key)}
+    lines = [
+        json.dumps({"op": "create", "id": "c1", "amount": 100000, "task_desc": "Fix login"}),
+        json.dumps({"op": "accept", "bounty_ref": "c1", "signer": "FREELANCER"}),
+        "",
+        "not json",
+        json.dumps({"op": "approve", "bounty_ref": "c1"}),
+    ]
+    client = FakeAlgod()
+    out = io.StringIO()
+    counts = BatchRunner(client, APP_ID, config).run(lines, out)
+
+    results = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [r["line"] for r in results] == [1, 2, 4, 5]
+    assert [r["ok"] for r in results] == [True, True, False, True]
+    assert results[0]["bounty_id"] == results[1]["bounty_id"] == 5
+    assert counts == {"ok": 3, "failed": 1}
+    assert client.param_fetches == 1
+    approve = client.groups[-1][-1]
+    assert approve.accounts == [freelancer]
@@ -0,0 +1,42 @@
+"""
+Tests for the content-addressed TEAL build cache
+"""
+
+import base64
+
+from algoease.compile import BuildCache, compile_teal
+
+
+class FakeAlgod:
+
+    def __init__(self, commit="abc123"):
+        self.algod_address = f"http://fake-{commit}"
+        self.commit = commit
+        self.compiles = 0
+
+    def versions(self):
+        return {"build": {"major": 3, "minor": 24, "build_number": 0, "commit_hash": self.commit}}
+
+    def compile(self, source):
+        self.compiles += 1
+        return {"result": base64.b64encode(source.encode()).decode(), "hash": ""}
+
+
+def test_unchanged_teal_skips_compile(tmp_path):
+    cache = BuildCache(str(tmp_path))
+    client = FakeAlgod()
+    first = compile_teal(client, source="#pragma version 8\nint 1", cache=cache)
+    second = compile_teal(client, source="#pragma version 8\nint 1", cache=cache)
+    assert first == second
+    assert client.compiles == 1
+
+
+def test_changed_inputs_recompile(tmp_path):
+    cache = BuildCache(str(tmp_path))
+    client = FakeAlgod()
+    compile_teal(client, source="#pragma version 8\nint 1", cache=cache)
+    compile_teal(client, source="#pragma version 8\nint 0", cache=cache)
+    upgraded = FakeAlgod(commit="def456")
+    compile_teal(upgraded, source="#pragma version 8\nint 1", cache=cache)
+    assert client.compiles == 2
+    assert upgraded.compiles == 1
@@ -0,0 +1,75 @@
+"""
+Tests for the live dashboard
+"""
+
+import base64
+
+import msgpack
+from algosdk import account
+
+from algoease.boxes import V2, Bounty, box_name, encode_bounty
+from algoease.dashboard import Dashboard, touched_bounty_ids
+
+APP_ID = 749707697
+
+
+def box_ref(bounty_id, index=None):
+    ref = {"n": box_name(bounty_id)}
+    if index:
+        ref["i"] = index
+    return ref
+
+
+class FakeAlgod:
+    """One app with bounty boxes; round 11 accepts bounty 1"""
+
+    def __init__(self, boxes):
+        self.boxes = boxes
+        self.box_reads = []
+
+    def status(self):
+        return {"last-round": 10}
+
+    def status_after_block(self, round_number):
+        return {"last-round": round_number + 1}
+
+    def block_info(self, round_number, response_format="json"):
+        call = {"type": "appl", "apid": APP_ID, "apbx": [box_ref(1)]}
+        return msgpack.packb({"block": {"rnd": round_number, "txns": [{"txn": call}, {"txn": {"type": "pay"}}]}})
+
+    def application_boxes(self, app_id):
+        return {"boxes": [{"name": base64.b64encode(box_name(i)).decode()} for i in self.boxes]}
+
+    def application_box_by_name(self, app_id, name):
+        bounty_id = int.from_bytes(name[-8:], 'big')
+        self.box_reads.append(bounty_id)
+        return {"value": base64.b64encode(encode_bounty(self.boxes[bounty_id])).decode()}
+
+
+def test_touched_ids_follow_box_refs():
+    other_app = 1234
+    block = {"txns": [
+        {"txn": {"type": "appl", "apid": APP_ID, "apfa": [other_app], "apbx": [box_ref(3), box_ref(4, index=1)]}},
+        {"txn": {"type": "appl", "apid": other_app, "apbx": [box_ref(5)]},
+         "dt": {"itx": [{"txn": {"type": "appl", "apid": APP_ID, "apbx": [box_ref(6), {"n": b""}]}}]}},
+    ]}
+    assert touched_bounty_ids(block, APP_ID) == {3, 6}
+
+
+def test_only_touched_boxes_are_reread():
+    _, creator = account.generate_account()
+    _, freelancer = account.generate_account()
+    boxes = {i: Bounty(i, creator, None, 1_000_000, 0, "task", V2) for i in range(3)}
+    boxes[2].status = V2.status_code("APPROVED")
+    client = FakeAlgod(boxes)
+    dashboard = Dashboard(client, APP_ID)
+    dashboard.load()
+    assert dashboard.locked_value() == 2_000_000
+
+    boxes[1].freelancer, boxes[1].status = freelancer, V2.status_code("ACCEPTED")
+    client.box_reads.clear()
+    assert dashboard.next_round() == {1}
+    assert client.box_reads == [1]
+    assert dashboard.status_counts() == {"OPEN": 1, "ACCEPTED": 1, "APPROVED": 1}
+    assert list(dashboard.transitions) == [(11, 1, "OPEN", "ACCEPTED")]
+    assert "ACCEPTED 1" in dashboard.render()
@@ -0,0 +1,97 @@
+"""
+Tests for the idempotent deploy engine
+"""
+
+import base64
+import json
+import threading
+
+import msgpack
+from algosdk import account, error, transaction
+
+from algoease import deploy
+
+SPEC = deploy.ContractSpec("test", "approval.teal", "clear.teal", "contract-info-test.json")
+APPROVAL = "#pragma version 8\nint 1\nreturn\n"
+CLEAR = "#pragma version 8\nint 1\n"
+
+
+class FakeAlgod:
+    """Knows the apps in `apps` (app ID -> (approval, clear)); creates new ones from 1000 up"""
+
+    def __init__(self, apps=None):
+        self.apps = dict(apps or {})
+        self.created = []
+        self.lock = threading.Lock()
+
+    def application_info(self, app_id):
+        if app_id not in self.apps:
+            raise error.AlgodHTTPError("application does not exist", code=404)
+        approval, clear = self.apps[app_id]
+        return {"params": {"approval-program": base64.b64encode(approval).decode(),
+                           "clear-state-program": base64.b64encode(clear).decode(),
+                           "global-state-schema": {"num-uint": 1, "num-byte-slice": 0}}}
+
+    def suggested_params(self):
+        return transaction.SuggestedParams(fee=0, first=1, last=1000, gh="SGO1GKSzyE7IEPItTxCByw9x8FmnrCDexi9/cOUJOiI=",
+                                           min_fee=1000)
+
+    def send_transaction(self, signed):
+        with self.lock:
+            app_id = 1000 + len(self.created)
+            self.apps[app_id] = (signed.transaction.approval_program, signed.transaction.clear_program)
+            self.created.append(app_id)
+        return f"TX{app_id}"
+
+    def status(self):
+        return {"last-round": 100}
+
+    def pending_transaction_info(self, txid, response_format="json"):
+        return msgpack.packb({"confirmed-round": 101, "application-index": int(txid[2:])})
+
+
+def setup_tree(tmp_path, monkeypatch, client):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "approval.teal").write_text(APPROVAL)
+    (tmp_path / "clear.teal").write_text(CLEAR)
+    (tmp_path / "contract.env").write_text("# config\nREACT_APP_CREATOR_ADDRESS=X\n")
+    key, address = account.generate_account()
+    monkeypatch.setattr(deploy, "get_algod_client", lambda *args: client)
+    monkeypatch.setattr(deploy, "_network_key", lambda *args: (address, key))
+
+
+def run(networks=("testnet",)):
+    results = deploy.deploy_networks(SPEC, [deploy.NETWORKS[n] for n in networks])
+    return results, deploy.publish(SPEC, results, networks[0])
+
+
+def test_second_deploy_reuses_app(tmp_path, monkeypatch):
+    client = FakeAlgod()
+    setup_tree(tmp_path, monkeypatch, client)
+
+    results, changed = run()
+    assert results[0].app_id == 1000 and not results[0].reused
+    assert changed == ["contract-info-test.json", "contract.env"]
+    assert "REACT_APP_CONTRACT_APP_ID=1000\n" in (tmp_path / "contract.env").read_text()
+
+    results, changed = run()
+    assert results[0].app_id == 1000 and results[0].reused
+    assert changed == []
+    assert client.created == [1000]
+
+
+def test_changed_program_or_deleted_app_deploys(tmp_path, monkeypatch):
+    client = FakeAlgod()
+    setup_tree(tmp_path, monkeypatch, client)
+    (tmp_path / "contract-info-old.json").write_text(json.dumps({"appId": 7, "network": "testnet"}))
+    client.apps[7] = (b"\x08\x81\x00\x43", b"\x08\x81\x01")
+
+    testnet, localnet = run(("testnet", "localnet"))[0]
+    assert sorted([testnet.app_id, localnet.app_id]) == [1000, 1001]
+    del client.apps[testnet.app_id]
+
+    results, _ = run(("testnet", "localnet"))
+    assert [(r.app_id, r.reused) for r in results] == [(1002, False), (localnet.app_id, True)]
+    info = json.loads((tmp_path / "contract-info-test.json").read_text())
+    assert info["appId"] == 1002
+    assert info["deployments"]["localnet"]["appId"] == localnet.app_id
@@ -0,0 +1,49 @@
+"""
+Tests for the Parquet export
+"""
+
+import os
+
+import pyarrow.dataset as ds
+
+from algoease.export import export, load_manifest
+from algoease.history import Event, HistoryLog
+
+APP_ID = 749707697
+
+
+def write_log(log, events, round_number):
+    """Append events to the log the way HistoryLog.sync does"""
+    with open(log.path, 'ab') as f:
+        f.write(b"".join(e.to_json().encode() + b"\n" for e in events))
+        offset = f.tell()
+    log._save_cursor(round_number, offset, 0)
+
+
+def event(round_number, method, bounty_ids, amount=0, paid=()):
+    return Event(round_number, 1_700_000_000 + round_number, f"TX{round_number}", method, "CREATOR",
+                 list(bounty_ids), amount, 0, list(paid))
+
+
+def test_export_is_partitioned_and_incremental(tmp_path):
+    log = HistoryLog(APP_ID, str(tmp_path / "history.jsonl"))
+    out = str(tmp_path / "export")
+    write_log(log, [event(5, "create_bounty", [0], amount=1_000), event(8, "create_bounty", [1], amount=2_000),
+                    event(12, "approve_bounty", [0], paid=[("F", 1_000)])], 12)
+
+    first = export(log, out, partition_rounds=10, batch_rows=1)
+    assert [os.path.relpath(p, out) for p in first["transitions"]] == [
+        os.path.join("transitions", "rounds=0-9", "part-5.parquet"),
+        os.path.join("transitions", "rounds=10-19", "part-12.parquet")]
+    assert export(log, out, partition_rounds=10) == {"transitions": [], "payments": []}
+
+    write_log(log, [event(15, "sweep_expired", [1], paid=[("CREATOR", 2_000)])], 15)
+    second = export(log, out, partition_rounds=10)
+    assert [os.path.basename(p) for p in second["transitions"]] == ["part-15.parquet"]
+    assert load_manifest(out)["rows"] == {"transitions": 4, "payments": 2}
+
+    transitions = ds.dataset(os.path.join(out, "transitions"), format="parquet", partitioning="hive").to_table()
+    rows = sorted(zip(*(transitions.column(c).to_pylist() for c in ("round", "bounty_id", "status"))))
+    assert rows == [(5, 0, "OPEN"), (8, 1, "OPEN"), (12, 0, "APPROVED"), (15, 1, "REFUNDED")]
+    payments = ds.dataset(os.path.join(out, "payments"), format="parquet", partitioning="hive").to_table()
+    assert sorted(payments.column("amount").to_pylist()) == [1_000, 2_000]
@@ -0,0 +1,100 @@
+"""
+Tests for hedged requests and failover across endpoints
+"""
+
+import time
+import urllib.error
+
+import pytest
+
+from algoease.failover import MIN_SAMPLES, FailoverAlgodClient
+
+
+class FakeNode:
+
+    def __init__(self, name, round_number=100, delay=0.0, down=False, timed_out=False):
+        self.name = name
+        self.algod_token = ""
+        self.round = round_number
+        self.delay = delay
+        self.down = down
+        self.timed_out = timed_out
+        self.calls = []
+
+    def algod_request(self, method, requrl, params=None, data=None, headers=None, response_format="json", timeout=30):
+        self.calls.append((method, requrl))
+        time.sleep(self.delay)
+        if self.down:
+            raise urllib.error.URLError("connection refused")
+        if self.timed_out:
+            raise TimeoutError("timed out")
+        return {"last-round": self.round, "node": self.name}
+
+
+def make_client(*nodes):
+    return FailoverAlgodClient([(node, f"https://{node.name}") for node in nodes])
+
+
+def test_slow_read_is_hedged_to_the_next_endpoint():
+    slow, fast = FakeNode("slow"), FakeNode("fast")
+    client = make_client(slow, fast)
+    client.pool.endpoints[0].latencies.extend([0.01] * MIN_SAMPLES)
+    client.pool.endpoints[1].latencies.extend([0.02] * MIN_SAMPLES)
+    slow.delay = 0.5
+
+    start = time.monotonic()
+    assert client.status()["node"] == "fast"
+    assert time.monotonic() - start < 0.3
+    assert client.pool.hedges == 1
+
+    # Writes are never duplicated
+    slow.delay = 0.05
+    client.algod_request("POST", "/transactions", data=b"blob")
+    assert fast.calls.count(("POST", "/transactions")) == 0
+
+
+def test_timed_out_write_is_not_replayed_on_another_endpoint():
+    writer, other = FakeNode("writer", timed_out=True), FakeNode("other")
+    client = make_client(writer, other)
+    for endpoint, latency in zip(client.pool.endpoints, (0.001, 0.002)):
+        endpoint.latencies.extend([latency] * MIN_SAMPLES)
+
+    # The writer may have accepted the group: replaying it would fail with "already in ledger"
+    with pytest.raises(TimeoutError):
+        client.algod_request("POST", "/transactions", data=b"blob")
+    assert writer.calls == [("POST", "/transactions")]
+    assert other.calls == []
+    assert client.pool.failovers == 0
+
+    # Reads still move on
+    assert client.status()["node"] == "other"
+
+
+def test_failover_and_lagging_endpoints():
+    down, behind, good = FakeNode("down", down=True), FakeNode("behind", 90), FakeNode("good", 100)
+    client = make_client(down, behind, good)
+    for endpoint, latency in zip(client.pool.endpoints, (0.001, 0.002, 0.003)):
+        endpoint.latencies.extend([latency] * MIN_SAMPLES)
+
+    # The fastest endpoint is down: the request moves on instead of failing
+    assert client.status()["node"] == "behind"
+    assert client.pool.failovers == 1
+
+    # Once another endpoint reports a later round, the lagging one is left out
+    client.pool.endpoints[2].record(0.003, {"last-round": 100})
+    assert "https://behind" not in [e.address for e in client.pool.ranked()]
+    assert client.status()["node"] == "good"
+
+
+def test_required_round_prefers_caught_up_endpoints():
+    fast, slow = FakeNode("fast", 100), FakeNode("slow", 101)
+    client = make_client(fast, slow)
+    for endpoint, latency in zip(client.pool.endpoints, (0.001, 0.002)):
+        endpoint.latencies.extend([latency] * MIN_SAMPLES)
+        endpoint.record(latency, {"last-round": endpoint.client.round})
+
+    assert client.status()["node"] == "fast"
+    # A write confirmed in round 101: the fast node has not seen it yet
+    client.require_round(101)
+    assert [e.address for e in client.pool.ranked()] == ["https://slow", "https://fast"]
+    assert client.status()["node"] == "slow"
@@ -0,0 +1,81 @@
+"""
+Tests for the local history log
+"""
+
+import base64
+
+from algoease.boxes import box_name
+from algoease.history import HistoryLog, parse_transaction
+
+APP_ID = 749707697
+
+
+def b64(value: bytes) -> str:
+    return base64.b64encode(value).decode()
+
+
+def app_call(round_number, args, boxes=(), inner=(), logs=(), txid=None):
+    return {
+        "id": txid or f"TX{round_number}", "tx-type": "appl", "sender": "CREATOR", "confirmed-round": round_number,
+        "round-time": 1_700_000_000 + round_number,
+        "application-transaction": {"application-id": APP_ID, "application-args": [b64(a) for a in args],
+                                    "box-references": [{"app": 0, "name": b64(box_name(i))} for i in boxes]},
+        "inner-txns": [{"tx-type": "pay", "payment-transaction": {"receiver": r, "amount": a}} for r, a in inner],
+        "logs": [b64(log) for log in logs],
+    }
+
+
+class FakeIndexer:
+    """Pages of two transactions, ascending by round"""
+
+    def __init__(self, transactions):
+        self.transactions = transactions
+        self.queries = []
+
+    def health(self):
+        return {"round": 100}
+
+    def search_transactions(self, application_id, min_round, max_round, limit, next_page=None):
+        self.queries.append((min_round, max_round, next_page))
+        matching = [t for t in self.transactions if min_round <= t["confirmed-round"] <= max_round]
+        start = int(next_page or 0)
+        page = matching[start:start + 2]
+        return {"transactions": page, "next-token": str(start + 2) if start + 2 < len(matching) else None}
+
+
+def test_parse_calls_payments_and_sweeps():
+    create = app_call(5, [b"create_bounty", (7_000).to_bytes(8, 'big'), (99).to_bytes(8, 'big'), b"task"], boxes=[3])
+    [event] = parse_transaction(create, APP_ID)
+    assert (event.method, event.bounties, event.amount, event.deadline) == ("create_bounty", [3], 7_000, 99)
+
+    sweep = app_call(6, [b"sweep_expired", b"".join(i.to_bytes(8, 'big') for i in (1, 2, 4))],
+                     inner=[("A", 10), ("B", 20)], logs=[(1).to_bytes(8, 'big') + (4).to_bytes(8, 'big')])
+    # Called from another app's inner transaction
+    outer = {"tx-type": "appl", "confirmed-round": 6, "round-time": 1, "id": "OUTER",
+             "application-transaction": {"application-id": 1}, "inner-txns": [sweep]}
+    [event] = parse_transaction(outer, APP_ID)
+    assert event.bounties == [1, 4]
+    assert event.payouts() == [(1, "A", 10), (4, "B", 20)]
+
+
+def test_sync_appends_only_new_rounds_and_recovers_from_a_torn_write(tmp_path):
+    transactions = [
+        app_call(10, [b"create_bounty", (1_000).to_bytes(8, 'big'), b"a"]),
+        app_call(10, [b"create_bounty", (2_000).to_bytes(8, 'big'), b"b"], txid="TX10b"),
+        app_call(11, [b"approve_bounty", (0).to_bytes(8, 'big')], inner=[("F", 1_000)]),
+        app_call(12, [b"reject_bounty", (1).to_bytes(8, 'big')], inner=[("CREATOR", 2_000)]),
+    ]
+    indexer = FakeIndexer(transactions[:3])
+    log = HistoryLog(APP_ID, str(tmp_path / "history.jsonl"))
+    assert log.sync(indexer, to_round=11) == 3
+    # No box references: create IDs follow the contract counter
+    assert [e.bounties for e in log.events()] == [[0], [1], [0]]
+
+    # A sync that died after writing past the cursor leaves a torn tail
+    with open(log.path, 'a') as f:
+        f.write('{"round": 12, "ti')
+    indexer.transactions = transactions
+    assert log.sync(indexer) == 1
+    assert indexer.queries[-1][0] == 12
+    assert [(e.round, e.method) for e in log.events(min_round=11)] == [(11, "approve_bounty"), (12, "reject_bounty")]
+    assert log.round == 100
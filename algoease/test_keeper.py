@@ -0,0 +1,167 @@
+"""
+Tests for the auto-refund keeper
+"""
+
+import base64
+import io
+
+import msgpack
+from algosdk import account, transaction
+
+from algoease.boxes import V5, Bounty, box_name, encode_bounty
+from algoease import keeper as keeper_module
+from algoease.keeper import SWEEP_BATCH, Keeper
+from algoease.operations import MAX_GROUP_SIZE
+from algoease.packer import OperationResult
+
+APP_ID = 749689686
+
+
+class FakeAlgod:
+    """V5 boxes on a chain whose block timestamps are 100 x round"""
+
+    def __init__(self, boxes, last_round=10):
+        self.boxes = boxes
+        self.last_round = last_round
+        self.touched = {}
+
+    def status(self):
+        return {"last-round": self.last_round}
+
+    def status_after_block(self, round_number):
+        self.last_round = max(self.last_round, round_number + 1)
+        return {"last-round": self.last_round}
+
+    def block_info(self, round_number, response_format="json"):
+        refs = [{"n": box_name(i)} for i in self.touched.get(round_number, [])]
+        return msgpack.packb({"block": {"rnd": round_number, "ts": 100 * round_number,
+                                        "txns": [{"txn": {"type": "appl", "apid": APP_ID, "apbx": refs}}]}})
+
+    def suggested_params(self):
+        return transaction.SuggestedParams(fee=0, first=1, last=1000, gh="SGO1GKSzyE7IEPItTxCByw9x8FmnrCDexi9/cOUJOiI=",
+                                           min_fee=1000)
+
+    def application_boxes(self, app_id):
+        return {"boxes": [{"name": base64.b64encode(box_name(i)).decode()} for i in self.boxes]}
+
+    def application_box_by_name(self, app_id, name):
+        bounty = self.boxes[int.from_bytes(name[-8:], 'big')]
+        return {"value": base64.b64encode(encode_bounty(bounty)).decode()}
+
+
+class FakePacker:
+    """Confirms every refund by marking the boxes REFUNDED"""
+
+    def __init__(self, client):
+        self.client = client
+        self.queue = []
+        self.groups = 0
+
+    def extend(self, ops):
+        self.queue.extend(ops)
+
+    def submit(self):
+        queued, self.queue = self.queue, []
+        self.groups += 1
+        for op in queued:
+            for bounty_id in op.ref:
+                self.client.boxes[bounty_id].status = V5.status_code("REFUNDED")
+        return [OperationResult(op, txid="TX", confirmed_round=self.client.last_round + 1) for op in queued]
+
+
+def make_keeper(client, tmp_path, sweep=False):
+    private_key, sender = account.generate_account()
+    return Keeper(client, APP_ID, sender, private_key, str(tmp_path / "keeper.json"), packer=FakePacker(client),
+                  sweep=sweep)
+
+
+def test_refunds_each_deadline_in_the_round_it_passes(tmp_path):
+    _, creator = account.generate_account()
+    boxes = {i: Bounty(i, creator, None, 1_000_000, 0, "task", V5, deadline=1000 + 100 * i) for i in range(4)}
+    boxes[3].status = V5.status_code("CLAIMED")
+    client = FakeAlgod(boxes)
+    keeper = make_keeper(client, tmp_path)
+    keeper.load()
+    assert keeper.due() == [0] and sorted(keeper.pending) == [0, 1, 2]
+    keeper.refund([0])
+
+    # A new bounty appears in round 11 with an early deadline
+    boxes[4] = Bounty(4, creator, None, 5, 0, "late", V5, deadline=1050)
+    client.touched[11] = [4]
+    refunded = [r.operation.bounty_id for r in keeper.step()]
+    assert refunded == [4, 1]
+    assert keeper.packer.groups == 2
+
+    # Restart from the checkpoint: bounty 2 (deadline 1200) is due at round 12
+    keeper = make_keeper(client, tmp_path)
+    keeper.load()
+    assert keeper.round == 11 and list(keeper.pending) == [2]
+    assert [r.operation.bounty_id for r in keeper.step()] == [2]
+    assert keeper.pending == {}
+
+
+def test_sweep_batches_by_creator(tmp_path):
+    creators = [account.generate_account()[1] for _ in range(5)]
+    boxes = {i: Bounty(i, creators[i % 5], None, 1_000, 0, "task", V5, deadline=500) for i in range(10)}
+    client = FakeAlgod(boxes)
+    keeper = make_keeper(client, tmp_path, sweep=True)
+    for bounty_id, bounty in boxes.items():
+        keeper.track(bounty_id, bounty)
+    keeper.timestamp = 1000
+
+    results = keeper.refund(keeper.due())
+    assert [r.operation.kind for r in results] == ["sweep_expired", "sweep_expired"]
+    assert sorted(i for r in results for i in r.operation.ref) == list(range(10))
+    assert keeper.pending == {}
+
+    sweep = results[0].operation
+    assert sweep.txns[0].accounts == creators[:4]
+    assert sweep.txns[0].app_args[1] == b"".join(i.to_bytes(8, 'big') for i in sweep.ref)
+    assert sweep.txns[0].fee == 1000 * (1 + len(sweep.ref))
+    assert {box.name for txn in sweep.txns for box in txn.boxes} == {box_name(i) for i in sweep.ref}
+    sweep.validate()
+
+
+def test_sweep_batches_fit_the_group_when_boxes_need_several_references(tmp_path):
+    _, creator = account.generate_account()
+    # 1887-byte descriptions make 2000-byte boxes: two box references per bounty
+    boxes = {i: Bounty(i, creator, None, 1_000, 0, "x" * (2000 - V5.task_desc_offset), V5, deadline=500)
+             for i in range(SWEEP_BATCH)}
+    client = FakeAlgod(boxes)
+    keeper = make_keeper(client, tmp_path, sweep=True)
+    for bounty_id, bounty in boxes.items():
+        keeper.track(bounty_id, bounty)
+    keeper.timestamp = 1000
+
+    results = keeper.refund(keeper.due())
+    assert len(results) == 2
+    assert sorted(i for r in results for i in r.operation.ref) == list(range(SWEEP_BATCH))
+    assert keeper.pending == {}
+    for result in results:
+        assert len(result.operation.txns) <= MAX_GROUP_SIZE
+        result.operation.validate()
+
+
+def test_run_retries_a_failed_first_refund(tmp_path, monkeypatch):
+    monkeypatch.setattr(keeper_module.time, "sleep", lambda seconds: None)
+    _, creator = account.generate_account()
+    client = FakeAlgod({0: Bounty(0, creator, None, 1_000, 0, "task", V5, deadline=500)})
+    keeper = make_keeper(client, tmp_path)
+    submit = keeper.packer.submit
+    attempts = []
+
+    def flaky_submit():
+        attempts.append(1)
+        if len(attempts) == 1:
+            keeper.packer.queue = []
+            raise ConnectionError("algod unreachable")
+        return submit()
+    keeper.packer.submit = flaky_submit
+
+    out = io.StringIO()
+    keeper.run(out, once=True)
+    assert "[WARN] algod unreachable; retrying" in out.getvalue()
+    assert 0 in keeper.pending
+
+    assert [r.operation.bounty_id for r in keeper.step()] == [0]
+    assert keeper.pending == {}
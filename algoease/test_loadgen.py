@@ -0,0 +1,99 @@
+"""
+Tests for the LocalNet load generator
+"""
+
+import pytest
+from algosdk import account, transaction
+
+from algoease.loadgen import LoadConfig, LoadGenerator, Sample, percentile
+
+APP_ID = 749707697
+
+
+class FakeAlgod:
+    """Confirms every transaction in the next round"""
+
+    algod_address = "http://localhost:4001"
+
+    def __init__(self):
+        self.sent = []
+
+    def suggested_params(self):
+        return transaction.SuggestedParams(fee=0, first=1, last=1000, gh="SGO1GKSzyE7IEPItTxCByw9x8FmnrCDexi9/cOUJOiI=",
+                                           min_fee=1000)
+
+    def send_transactions(self, signed):
+        self.sent.append([txn.transaction for txn in signed])
+        return signed[0].get_txid()
+
+    def status(self):
+        return {"last-round": 100}
+
+    def pending_transaction_info(self, txid):
+        return {"confirmed-round": 101, "pool-error": ""}
+
+
+def make_generator(client, accounts=3, **config):
+    generator = LoadGenerator(client, LoadConfig(accounts=accounts, app_id=APP_ID, seed=7, **config),
+                              account.generate_account()[::-1])
+    for _ in range(accounts):
+        key, address = account.generate_account()
+        generator.keys[address] = key
+    return generator
+
+
+def test_percentile_and_report():
+    assert percentile([], 50) is None
+    assert percentile([3.0, 1.0, 2.0, 4.0], 50) == 2.0
+    assert percentile([float(i) for i in range(1, 101)], 95) == 95.0
+    assert percentile([float(i) for i in range(1, 101)], 99) == 99.0
+
+    generator = make_generator(FakeAlgod())
+    generator.samples = [Sample("create", 2, 0.010, True, fee=2000), Sample("accept", 1, 0.020, True, fee=1000),
+                         Sample("approve", 1, 0.030, True, fee=2000), Sample("accept", 1, 0.5, False,
+                                                                             error="logic eval error")]
+    report = generator.report("2024-01-01T00:00:00+00:00", 2.0)
+    assert report["operations"] == {"attempted": 4, "confirmed": 3, "failed": 1}
+    assert report["confirmed_txns"] == 4 and report["tps"] == 2.0
+    assert report["lifecycles_per_s"] == 0.5
+    assert report["latency_ms"] == {"p50": 20.0, "p95": 30.0, "p99": 30.0, "max": 30.0}
+    assert report["failure_rate"] == 0.25
+    assert report["fees_microalgos"] == 5000
+    assert report["actions"]["accept"] == {"attempted": 2, "confirmed": 1, "failed": 1,
+                                           "latency_ms": {"p50": 20.0, "p95": 20.0, "p99": 20.0, "max": 20.0},
+                                           "fees_microalgos": 1000}
+    assert report["top_errors"] == [("logic eval error", 1)]
+
+
+def test_picks_only_feasible_actions_and_a_freelancer_other_than_the_creator():
+    client = FakeAlgod()
+    generator = make_generator(client, mix={"create": 0, "accept": 1, "approve": 1})
+    assert generator._pick_action() is None
+
+    creator = next(iter(generator.keys))
+    bounty = {"id": 0, "creator": creator, "size": 200}
+    generator._pools["OPEN"].append(bounty)
+    assert generator._pick_action() == ("accept", bounty)
+    assert generator._pick_action() is None
+
+    for _ in range(20):
+        generator._execute("accept", dict(bounty))
+    accepted = generator._pools["ACCEPTED"]
+    assert len(accepted) == 20 and all(s.ok for s in generator.samples)
+    assert all(b["freelancer"] != creator and b["freelancer"] in generator.keys for b in accepted)
+    assert {txns[0].sender for txns in client.sent} == {b["freelancer"] for b in accepted}
+
+    # A terminal status leaves the pools
+    generator._pools["SUBMITTED"].append(dict(accepted[0]))
+    generator._execute("approve", generator._pick_action()[1])
+    assert generator.samples[-1].action == "approve" and not generator._pools["APPROVED"]
+
+
+def test_needs_two_accounts():
+    with pytest.raises(ValueError, match="at least 2 accounts"):
+        LoadGenerator(FakeAlgod(), LoadConfig(accounts=1, app_id=APP_ID), account.generate_account()[::-1])
+
+    generator = LoadGenerator(FakeAlgod(), LoadConfig(accounts=2, app_id=APP_ID, duration=0),
+                              account.generate_account()[::-1])
+    with pytest.raises(ValueError, match="call setup"):
+        generator.run()
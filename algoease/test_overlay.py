@@ -0,0 +1,87 @@
+"""
+Tests for optimistic local state
+"""
+
+import pytest
+from algosdk import account
+
+from algoease import operations
+from algoease.boxes import V2, Bounty
+from algoease.overlay import CONFIRMED, PENDING, ROLLED_BACK, Overlay
+from algoease.packer import GroupLimits, GroupPacker
+from algoease.test_packer import APP_ID, FakeAlgod, suggested_params
+
+OPEN, ACCEPTED = V2.status_code("OPEN"), V2.status_code("ACCEPTED")
+
+
+class Source:
+    def __init__(self, bounties, round_number=100):
+        self.bounties = {b.bounty_id: b for b in bounties}
+        self.round = round_number
+
+
+class Accounts:
+    def __init__(self):
+        self.sp = suggested_params()
+        self.creator_key, self.creator = account.generate_account()
+        self.freelancer_key, self.freelancer = account.generate_account()
+
+    def open_bounty(self, bounty_id):
+        return Bounty(bounty_id, self.creator, None, 1_000_000, OPEN, "task", V2)
+
+    def accept(self, bounty_id):
+        return operations.accept_bounty(self.sp, APP_ID, self.freelancer, self.freelancer_key, bounty_id)
+
+    def submit(self, bounty_id):
+        return operations.submit_bounty(self.sp, APP_ID, self.freelancer, self.freelancer_key, bounty_id)
+
+
+def test_chained_operations_are_planned_before_confirmation():
+    a = Accounts()
+    overlay = Overlay(Source([a.open_bounty(1)]))
+    create = operations.create_bounty(a.sp, APP_ID, a.creator, a.creator_key, 2, 5_000, "new task")
+    writes = overlay.apply([create, a.accept(2), a.submit(2), a.accept(1)])
+
+    assert [w.state for w in writes] == [PENDING] * 4
+    assert overlay.bounty(2).status_name == "SUBMITTED" and overlay.bounty(2).freelancer == a.freelancer
+    assert overlay.bounty(2).amount == 5_000 and overlay.bounty(2).task_desc == "new task"
+    assert overlay.bounty(1).status_name == "ACCEPTED"
+    assert len(overlay.pending(2)) == 3
+
+    # The freelancer may not approve, and a rejected plan layers nothing
+    approve = operations.approve_bounty(a.sp, APP_ID, a.freelancer, a.freelancer_key, 2, a.freelancer)
+    with pytest.raises(ValueError, match="may not call it"):
+        overlay.apply([approve])
+    with pytest.raises(ValueError, match="does not exist"):
+        overlay.apply([a.accept(3)])
+    sweep = operations.sweep_expired(a.sp, APP_ID, a.creator, a.creator_key, [(1, a.creator, 200)])
+    with pytest.raises(ValueError, match="not a call of the v2 contract"):
+        overlay.apply([sweep])
+    assert len(overlay.pending()) == 4
+
+    # Rolling back the accept undoes the submit that was planned on top of it
+    overlay.rollback(writes[1], "logic eval error")
+    assert overlay.bounty(2).status_name == "OPEN"
+
+
+def test_results_confirm_or_roll_back():
+    a = Accounts()
+    source = Source([a.open_bounty(1), a.open_bounty(2)])
+    overlay = Overlay(source)
+    accept_1, accept_2 = a.accept(1), a.accept(2)
+    # Alone in a group, an operation's txid is known before it is sent
+    client = FakeAlgod(reject={accept_1.txns[0].get_txid()})
+    done = overlay.submit(GroupPacker(client, GroupLimits(max_txns=1)), [accept_1, accept_2])
+
+    results = done.result(timeout=5)
+    assert [r.ok for r in results] == [False, True]
+    first, second = overlay.writes
+    assert (first.state, second.state, second.confirmed_round) == (ROLLED_BACK, CONFIRMED, 101)
+    assert overlay.bounty(1).status_name == "OPEN"
+    assert overlay.bounty(2).status_name == "ACCEPTED"
+
+    # Once the source has synced the confirmed round, the overlay steps aside
+    source.bounties[2] = Bounty(2, a.creator, a.freelancer, 1_000_000, ACCEPTED, "task", V2)
+    source.round = 101
+    assert overlay.bounty(2).freelancer == a.freelancer
+    assert overlay.writes == []
@@ -0,0 +1,124 @@
+"""
+Tests for the atomic-group packer
+"""
+
+import base64
+
+import msgpack
+from algosdk import account, error, transaction
+
+from algoease import operations
+from algoease.packer import GroupLimits, GroupPacker
+
+APP_ID = 749707697
+
+
+class FakeAlgod:
+    """Accepts every group except those containing a txid in `reject`"""
+
+    def __init__(self, reject=(), message=None):
+        self.reject = set(reject)
+        self.message = message
+        self.groups = []
+
+    def send_raw_transaction(self, blob):
+        unpacker = msgpack.Unpacker(raw=False)
+        unpacker.feed(base64.b64decode(blob))
+        txids = [transaction.SignedTransaction.undictify(d).get_txid() for d in unpacker]
+        bad = self.reject.intersection(txids)
+        if bad:
+            txid = bad.pop()
+            raise error.AlgodHTTPError(
+                self.message or f"TransactionPool.Remember: transaction {txid}: logic eval error: assert failed pc=42"
+            )
+        self.groups.append(txids)
+        return txids[0]
+
+    def status(self):
+        return {"last-round": 100}
+
+    def pending_transaction_info(self, txid, response_format="json"):
+        return msgpack.packb({"confirmed-round": 101, "pool-error": ""})
+
+
+def suggested_params():
+    return transaction.SuggestedParams(fee=0, first=1, last=1000, gh="SGO1GKSzyE7IEPItTxCByw9x8FmnrCDexi9/cOUJOiI=", min_fee=1000)
+
+
+class TestGroupPacker:
+
+    def setup_method(self):
+        self.key, self.address = account.generate_account()
+        self.sp = suggested_params()
+
+    def accept(self, bounty_id, ref=None):
+        return operations.accept_bounty(self.sp, APP_ID, self.address, self.key, bounty_id, ref=ref)
+
+    def test_packs_up_to_sixteen_transactions(self):
+        packer = GroupPacker(FakeAlgod())
+        packer.extend(self.accept(i) for i in range(40))
+        groups = packer.pack()
+        assert [len(g) for g in groups] == [16, 16, 8]
+
+    def test_create_bounty_gets_its_own_group(self):
+        packer = GroupPacker(FakeAlgod())
+        packer.add(self.accept(1))
+        packer.add(operations.create_bounty(self.sp, APP_ID, self.address, self.key, 7, 1_000_000, "task"))
+        packer.add(self.accept(2))
+        groups = packer.pack()
+        assert [[op.kind for op in g] for g in groups] == [
+            ["accept_bounty", "accept_bounty"],
+            ["create_bounty"],
+        ]
+
+    def test_same_bounty_keeps_queue_order(self):
+        packer = GroupPacker(FakeAlgod(), GroupLimits(max_txns=2))
+        first = self.accept(1)
+        second = self.accept(2)
+        third = self.accept(3)
+        follow_up = operations.submit_bounty(self.sp, APP_ID, self.address, self.key, 3)
+        filler = self.accept(4)
+        packer.extend([first, second, third, follow_up, filler])
+        groups = packer.pack()
+        index = {id(op): i for i, g in enumerate(groups) for op in g}
+        assert index[id(follow_up)] >= index[id(third)]
+
+    def test_account_reference_limit(self):
+        packer = GroupPacker(FakeAlgod(), GroupLimits(max_account_refs=2))
+        for i in range(3):
+            _, freelancer = account.generate_account()
+            packer.add(operations.approve_bounty(self.sp, APP_ID, self.address, self.key, i, freelancer))
+        assert [len(g) for g in packer.pack()] == [2, 1]
+
+    def test_approve_fee_covers_inner_payment(self):
+        _, freelancer = account.generate_account()
+        op = operations.approve_bounty(self.sp, APP_ID, self.address, self.key, 1, freelancer)
+        assert op.fee == 2000
+
+    def test_failure_traced_to_operation(self):
+        ops = [self.accept(i, ref=i) for i in range(5)]
+        packer = GroupPacker(FakeAlgod())
+        packer.extend(ops)
+        # Reject the txid ops[2] will have once grouped with the others
+        packer.sign_groups(packer.pack())
+        algod = FakeAlgod(reject=[ops[2].txids[0]])
+        packer.client = algod
+
+        results = packer.submit()
+        assert [r.ok for r in results] == [True, True, False, True, True]
+        assert "assert failed" in results[2].error
+        assert len(algod.groups) == 1 and len(algod.groups[0]) == 4
+
+    def test_unattributed_failure_isolates_operations(self):
+        ops = [self.accept(i) for i in range(3)]
+        packer = GroupPacker(FakeAlgod())
+        packer.extend(ops)
+        packer.sign_groups(packer.pack())
+        grouped_txid = ops[1].txids[0]
+        algod = FakeAlgod(reject=[grouped_txid], message="group rejected")
+        packer.client = algod
+
+        results = packer.submit()
+        # Every op was retried alone and succeeded with its ungrouped txid
+        assert all(r.ok for r in results)
+        assert len(algod.groups) == 3
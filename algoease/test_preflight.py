@@ -0,0 +1,109 @@
+"""
+Tests for preflight simulation
+"""
+
+import base64
+import urllib.error
+
+import msgpack
+from algosdk import account, error, transaction
+
+from algoease import operations
+from algoease.boxes import V2, Bounty, box_name, encode_bounty
+from algoease.packer import GroupPacker
+from algoease.preflight import Preflight
+from algoease.ratelimit import CircuitOpenError
+
+APP_ID = 749707697
+
+
+def params():
+    return transaction.SuggestedParams(fee=0, first=1, last=1000, gh="SGO1GKSzyE7IEPItTxCByw9x8FmnrCDexi9/cOUJOiI=",
+                                       min_fee=1000)
+
+
+class FakeAlgod:
+    """Simulate fails any submit_bounty call; every accept reads one extra, unnamed box"""
+
+    def __init__(self, boxes):
+        self.boxes = boxes
+        self.simulations = []
+        self.sent = []
+
+    def simulate_transactions(self, request):
+        txns = [stxn.transaction for stxn in request.txn_groups[0].txns]
+        self.simulations.append(txns)
+        for index, txn in enumerate(txns):
+            if txn.app_args[0] == b"submit_bounty":
+                return {"txn-groups": [{"failure-message": "transaction ABC: logic eval error: assert failed pc=412",
+                                        "failed-at": [index], "txn-results": []}]}
+        extra = {"boxes": [{"app": APP_ID, "name": base64.b64encode(box_name(99)).decode()}]}
+        return {"txn-groups": [{"txn-results": [{"unnamed-resources-accessed": extra} for _ in txns]}]}
+
+    def application_box_by_name(self, app_id, name):
+        bounty = self.boxes[int.from_bytes(name[-8:], 'big')]
+        return {"value": base64.b64encode(encode_bounty(bounty)).decode()}
+
+    def send_raw_transaction(self, blob):
+        unpacker = msgpack.Unpacker(raw=False)
+        unpacker.feed(base64.b64decode(blob))
+        self.sent.append([transaction.SignedTransaction.undictify(d).transaction for d in unpacker])
+        return "TXID"
+
+    def status(self):
+        return {"last-round": 100}
+
+    def pending_transaction_info(self, txid, response_format="json"):
+        return msgpack.packb({"confirmed-round": 101, "pool-error": ""})
+
+
+def test_failing_operation_is_explained_and_never_sent():
+    creator_key, creator = account.generate_account()
+    freelancer_key, freelancer = account.generate_account()
+    boxes = {1: Bounty(1, creator, None, 1_000, V2.status_code("OPEN"), "a"),
+             2: Bounty(2, creator, None, 1_000, V2.status_code("OPEN"), "b")}
+    client = FakeAlgod(boxes)
+    packer = GroupPacker(client, preflight=Preflight(client))
+    packer.add(operations.accept_bounty(params(), APP_ID, freelancer, freelancer_key, 1))
+    packer.add(operations.submit_bounty(params(), APP_ID, freelancer, freelancer_key, 2))
+
+    accept, submit = packer.submit()
+    assert accept.ok
+    assert not submit.ok and submit.txid is None
+    assert "bounty 2 is OPEN, submit_bounty needs ACCEPTED" in submit.error
+    assert len(client.simulations) == 2 and len(client.sent) == 1
+    [[sent]] = client.sent
+    assert [box.name for box in sent.boxes] == [box_name(1), box_name(99)]
+
+
+def test_fee_top_up_and_offline_rules():
+    creator_key, creator = account.generate_account()
+    _, freelancer = account.generate_account()
+    approve = operations.approve_bounty(params(), APP_ID, creator, creator_key, 1, freelancer)
+    approve.txns[0].fee = 1000
+    reject = operations.reject_bounty(params(), APP_ID, creator, creator_key, 2)
+
+    class Offline:
+        def simulate_transactions(self, request):
+            raise urllib.error.URLError("connection refused")
+
+    preflight = Preflight(Offline(), bounties={
+        1: Bounty(1, creator, freelancer, 1_000, V2.status_code("SUBMITTED"), "a"),
+        2: Bounty(2, creator, freelancer, 1_000, V2.status_code("APPROVED"), "b"),
+    })
+    failures = preflight.check([approve, reject])
+    assert preflight.offline
+    assert approve.fee == 2000
+    assert failures == {id(reject): "reject_bounty: bounty 2 is APPROVED, reject_bounty needs SUBMITTED"}
+
+    # The rate-limited and failover clients raise their own errors; those fall back too
+    for failure in (CircuitOpenError("circuit open"), error.AlgodHTTPError("bad gateway", 502)):
+        class Failing:
+            def simulate_transactions(self, request):
+                raise failure
+
+        preflight = Preflight(Failing(), bounties={2: Bounty(2, creator, freelancer, 1_000,
+                                                             V2.status_code("APPROVED"), "b")})
+        assert preflight.check([reject]) == {id(reject): "reject_bounty: bounty 2 is APPROVED, "
+                                                         "reject_bounty needs SUBMITTED"}
+        assert preflight.offline
@@ -0,0 +1,127 @@
+"""
+Tests for the caching algod / indexer proxy
+"""
+
+import asyncio
+import json
+import threading
+import time
+
+from algoease.proxy import CachingProxy, Response
+
+TXID = "A" * 52
+
+
+class FakeUpstream:
+    """Answers after a short delay and counts every call"""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.round = 100
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def fetch(self, method, target, body=None, content_type=None):
+        with self.lock:
+            self.calls.append((method, target))
+        time.sleep(self.delay)
+        if target.startswith("/v2/status"):
+            return Response(200, "application/json", json.dumps({"last-round": self.round}).encode())
+        if target.startswith("/v2/transactions/pending/"):
+            return Response(200, "application/json", json.dumps({"confirmed-round": 0}).encode())
+        if target == "/v2/applications/7/box?name=b64:missing":
+            return Response(404, "application/json", b'{"message":"box not found"}')
+        if target == "/v2/teapot":
+            return Response(500, "application/json", b'{"message":"boom"}')
+        return Response(200, "application/json", json.dumps({"target": target, "round": self.round}).encode())
+
+
+def test_identical_requests_merge_and_cache_until_the_round_advances():
+    async def run():
+        upstream = FakeUpstream()
+        proxy = CachingProxy(upstream)
+        await proxy.get("/v2/status")
+        assert proxy.round == 100
+
+        results = await asyncio.gather(*[proxy.get("/v2/applications/7") for _ in range(50)])
+        assert [source for _, source in results].count("miss") == 1
+        assert [source for _, source in results].count("merged") == 49
+        assert (await proxy.get("/v2/applications/7"))[1] == "hit"
+        assert (await proxy.get("/v2/applications/7/box?name=b64:missing"))[0].status == 404
+        assert (await proxy.get("/v2/applications/7/box?name=b64:missing"))[1] == "hit"
+        await proxy.get("/v2/teapot")
+        assert (await proxy.get("/v2/teapot"))[1] == "miss"
+
+        # Blocks are final; current state is dropped when the next round arrives
+        await proxy.get("/v2/blocks/99?format=msgpack")
+        upstream.round = 101
+        response, source = await proxy.get("/v2/status/wait-for-block-after/100")
+        assert source == "miss" and proxy.round == 101
+        assert (await proxy.get("/v2/applications/7"))[1] == "miss"
+        assert (await proxy.get("/v2/blocks/99?format=msgpack"))[1] == "hit"
+        # A long-poll for a round already passed is answered from the cached status
+        assert (await proxy.get("/v2/status/wait-for-block-after/100"))[1] == "hit"
+        # Unconfirmed pending transactions are never cached
+        await proxy.get(f"/v2/transactions/pending/{TXID}")
+        assert (await proxy.get(f"/v2/transactions/pending/{TXID}"))[1] == "miss"
+
+        await proxy.forward("POST", "/v2/transactions", b"blob", "application/x-binary")
+        return upstream.calls, proxy.stats
+
+    calls, stats = asyncio.run(run())
+    assert calls.count(("GET", "/v2/applications/7")) == 2
+    assert calls.count(("GET", "/v2/blocks/99?format=msgpack")) == 1
+    assert calls[-1] == ("POST", "/v2/transactions")
+    assert stats["upstream"] == len(calls)
+
+
+def test_merged_callers_get_an_answer_when_the_fetch_fails():
+    async def run():
+        proxy = CachingProxy(FakeUpstream())
+
+        def broken_store(*args):
+            raise ValueError("bad response")
+        proxy._store = broken_store
+
+        first = asyncio.ensure_future(proxy.get("/v2/applications/7"))
+        await asyncio.sleep(0)
+        merged = await asyncio.wait_for(proxy.get("/v2/applications/7"), 1)
+        assert merged == (Response(502, "application/json", b'{"message":"upstream request failed"}'), "merged")
+        assert isinstance(first.exception(), ValueError)
+
+        # A cancelled fetch releases its merged callers too
+        proxy._store = lambda *args: None
+        first = asyncio.ensure_future(proxy.get("/v2/applications/8"))
+        await asyncio.sleep(0)
+        merged = asyncio.ensure_future(proxy.get("/v2/applications/8"))
+        await asyncio.sleep(0)
+        first.cancel()
+        assert (await asyncio.wait_for(merged, 1))[0].status == 502
+        assert not proxy._inflight
+
+    asyncio.run(run())
+
+
+def test_http_front_end():
+    async def run():
+        proxy = CachingProxy(FakeUpstream(delay=0))
+        server = await asyncio.start_server(proxy.handle, "127.0.0.1", 0)
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.sockets[0].getsockname()[1])
+        for _ in range(2):
+            writer.write(b"GET /v2/applications/7 HTTP/1.1\r\nHost: x\r\n\r\n")
+            await writer.drain()
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = int(head.split(b"Content-Length: ")[1].split(b"\r\n")[0])
+            body = await reader.readexactly(length)
+            last_head = head
+        writer.write(b"POST /v2/transactions HTTP/1.1\r\nContent-Length: 4\r\nConnection: close\r\n\r\nblob")
+        rest = await reader.read()
+        writer.close()
+        server.close()
+        await server.wait_closed()
+        return last_head, body, rest
+
+    head, body, rest = asyncio.run(run())
+    assert head.startswith(b"HTTP/1.1 200 OK") and b"X-Proxy-Cache: hit" in head
+    assert json.loads(body)["target"] == "/v2/applications/7"
+    assert b"X-Proxy-Cache: pass" in rest
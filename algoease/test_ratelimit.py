@@ -0,0 +1,95 @@
+"""
+Tests for the shared rate limiter
+"""
+
+import multiprocessing
+import time
+import urllib.error
+
+import pytest
+from algosdk import error
+from algosdk.v2client import algod
+
+from algoease import ratelimit
+from algoease.ratelimit import CircuitBreaker, CircuitOpenError, LimitedAlgodClient, TokenBucket, call_limited
+
+
+def _drain(state_dir, count):
+    bucket = TokenBucket("test", rate=50, burst=5, state_dir=state_dir)
+    for _ in range(count):
+        bucket.acquire()
+
+
+def test_processes_share_one_bucket(tmp_path):
+    start = time.monotonic()
+    workers = [multiprocessing.Process(target=_drain, args=(str(tmp_path), 20)) for _ in range(2)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    # 40 requests, 5 from the burst, the rest at 50/s across both processes
+    assert time.monotonic() - start >= (40 - 5) / 50 * 0.9
+
+
+def test_throttling_slows_everyone_and_recovers(tmp_path, monkeypatch):
+    monkeypatch.setattr(ratelimit, "backoff_delay", lambda attempt, *args: 0.01)
+    bucket = TokenBucket("test", rate=1000, burst=10, state_dir=str(tmp_path))
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) == 1:
+            raise error.AlgodHTTPError("Too Many Requests", 429)
+        return {"last-round": 1}
+
+    assert call_limited(bucket, CircuitBreaker(), flaky) == {"last-round": 1}
+    assert len(calls) == 2
+    other_process_view = TokenBucket("test", rate=1000, burst=10, state_dir=str(tmp_path))
+    assert other_process_view.scale == pytest.approx(0.5 + ratelimit.RECOVERY_STEP)
+
+    with pytest.raises(error.AlgodHTTPError):
+        call_limited(bucket, CircuitBreaker(), lambda: (_ for _ in ()).throw(error.AlgodHTTPError("no box", 404)))
+
+
+def test_breaker_opens_after_repeated_failures(tmp_path, monkeypatch):
+    monkeypatch.setattr(ratelimit, "backoff_delay", lambda attempt, *args: 0)
+    bucket = TokenBucket("test", rate=1000, burst=10, state_dir=str(tmp_path))
+    breaker = CircuitBreaker(threshold=3, cooldown=60)
+
+    def down():
+        raise urllib.error.URLError("connection refused")
+
+    with pytest.raises(urllib.error.URLError):
+        call_limited(bucket, breaker, down, retries=2)
+    with pytest.raises(CircuitOpenError):
+        call_limited(bucket, breaker, lambda: "never called")
+
+    breaker.opened_at -= 60
+    assert call_limited(bucket, breaker, lambda: "trial") == "trial"
+    assert breaker.failures == 0
+
+
+def test_only_reads_are_retried(tmp_path, monkeypatch):
+    monkeypatch.setattr(ratelimit, "backoff_delay", lambda attempt, *args: 0)
+    calls = []
+
+    def node(self, method, requrl, *args, **kwargs):
+        calls.append(method)
+        if len(calls) == 1:
+            raise TimeoutError("timed out")
+        if method == "POST":
+            raise error.AlgodHTTPError("transaction already in ledger", 400)
+        return {"last-round": 1}
+
+    monkeypatch.setattr(algod.AlgodClient, "algod_request", node)
+    client = LimitedAlgodClient("", "http://node.test")
+    client.bucket = TokenBucket("test", rate=1000, burst=10, state_dir=str(tmp_path))
+
+    # The send may have landed: the caller sees the timeout, not a resend's "already in ledger"
+    with pytest.raises(TimeoutError):
+        client.algod_request("POST", "/transactions", data=b"signed")
+    assert calls == ["POST"]
+
+    calls.clear()
+    assert client.algod_request("GET", "/status") == {"last-round": 1}
+    assert calls == ["GET", "GET"]
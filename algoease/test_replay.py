@@ -0,0 +1,58 @@
+"""
+Tests for time-travel replay
+"""
+
+import io
+
+import pytest
+
+from algoease.boxes import V2, V5
+from algoease.history import Event, HistoryLog
+from algoease.replay import Replay, main
+
+APP_ID = 749689686
+
+
+def event(round_number, method, bounty_ids, sender="CREATOR", amount=0):
+    return Event(round_number, 1_700_000_000 + round_number, f"TX{round_number}", method, sender,
+                 list(bounty_ids), amount, 2_000_000_000 if amount else 0, [], "task" if amount else "")
+
+
+def test_state_at_past_rounds_uses_snapshots(tmp_path):
+    events = [event(10 + i, "create_bounty", [i], amount=1_000 * (i + 1)) for i in range(6)]
+    events += [event(20, "accept_bounty", [0], sender="FREELANCER"), event(21, "submit_bounty", [0]),
+               event(22, "approve_bounty", [0]), event(23, "sweep_expired", [4, 5])]
+    log = HistoryLog(APP_ID, str(tmp_path / "history.jsonl"))
+    with open(log.path, 'wb') as f:
+        f.write(b"".join(e.to_json().encode() + b"\n" for e in events))
+        log._save_cursor(25, f.tell(), 6)
+
+    replay = Replay(log, V5, interval=3)
+    assert replay.build() == 3
+    assert replay.snapshots() == [12, 15, 22]
+    assert replay.build() == 0
+
+    accepted = replay.bounty_at(0, 20)
+    assert (accepted.status_name, accepted.freelancer, accepted.verifier) == ("ACCEPTED", "FREELANCER", "CREATOR")
+    assert replay.bounty_at(0, 22).status_name == "APPROVED"
+    assert replay.bounty_at(5, 14) is None
+    assert len(replay.state_at(14)) == 5
+    # On V5 an approved bounty stays escrowed until it is claimed
+    assert replay.locked_at(22) == 21_000
+    assert replay.locked_at(23) == 21_000 - 5_000 - 6_000
+
+
+def test_layout_mismatch_is_reported(tmp_path):
+    events = [event(10, "create_bounty", [0], amount=1_000), event(11, "sweep_expired", [0])]
+    log = HistoryLog(APP_ID, str(tmp_path / "history.jsonl"))
+    with open(log.path, 'wb') as f:
+        f.write(b"".join(e.to_json().encode() + b"\n" for e in events))
+        log._save_cursor(12, f.tell(), 1)
+
+    with pytest.raises(ValueError, match="v2 layout has no REFUNDED status"):
+        Replay(log, V2).state_at(11)
+
+    out = io.StringIO()
+    assert main(["--round", "11", "--app-id", str(APP_ID), "--history", log.path], out) == 2
+    assert out.getvalue().startswith("[ERROR] sweep_expired in round 11")
+    assert main(["--round", "11", "--app-id", str(APP_ID), "--history", log.path, "--layout", "v5"], out) == 0
@@ -0,0 +1,33 @@
+"""
+Tests for bulk transaction signing
+"""
+
+from algosdk import account, transaction
+
+from algoease.signing import BulkSigner, sign_one
+
+
+def make_payments(count):
+    key, address = account.generate_account()
+    sp = transaction.SuggestedParams(fee=1000, first=1, last=1000, flat_fee=True,
+                                     gh="SGO1GKSzyE7IEPItTxCByw9x8FmnrCDexi9/cOUJOiI=")
+    txns = [transaction.PaymentTxn(address, sp, address, i) for i in range(count)]
+    return key, address, txns
+
+
+def test_parallel_matches_serial():
+    key, address, txns = make_payments(40)
+    with BulkSigner([key], workers=2, chunk_size=8, min_parallel=0) as signer:
+        parallel = signer.sign_with_txids(txns)
+    serial = [sign_one(txn, {address: key}) for txn in txns]
+    assert parallel == serial
+
+
+def test_sign_groups_assigns_group_ids_first():
+    key, _, txns = make_payments(4)
+    groups = [txns[:3], txns[3:]]
+    with BulkSigner([key], workers=1) as signer:
+        blobs = signer.sign_groups(groups)
+    assert [len(g) for g in blobs] == [3, 1]
+    assert txns[0].group == txns[2].group is not None
+    assert txns[3].group is None
@@ -0,0 +1,66 @@
+"""
+Tests for binary bounty snapshots
+"""
+
+import pytest
+from algosdk import account
+
+from algoease.boxes import V2, V5, Bounty, encode_bounty
+from algoease.snapshot import SnapshotError, SnapshotReader, write_snapshot
+
+
+def bounties(layout, count):
+    addresses = [account.generate_account()[1] for _ in range(3)]
+    return [Bounty(bounty_id, addresses[bounty_id % 3], addresses[2] if bounty_id % 2 else None,
+                   1_000 * bounty_id, bounty_id % 4, f"task {bounty_id} " + "x" * (bounty_id % 50), layout,
+                   verifier=addresses[0] if layout is V5 else None,
+                   deadline=100 + bounty_id if layout is V5 else None)
+            for bounty_id in range(0, 2 * count, 2)]
+
+
+@pytest.mark.parametrize("layout,compress", [(V2, True), (V5, True), (V5, False)])
+def test_round_trip(tmp_path, layout, compress):
+    written = bounties(layout, 300)
+    path = str(tmp_path / "bounties.snap")
+    assert write_snapshot(path, reversed(written), 55, 7, layout, compress, block_records=64, heap_block=1000) == 300
+
+    with SnapshotReader(path) as reader:
+        assert (reader.app_id, reader.round, reader.layout, len(reader)) == (7, 55, layout, 300)
+        assert len(reader.record_index) == 5 and len(reader.heap_index) > 1
+        assert (reader.record_index["codec"] == 0).all() != compress
+        assert list(reader) == written
+        assert reader.bounty(598) == written[-1]
+        assert reader.bounty(130) == written[65]
+        assert reader.bounty(131) is None and reader.bounty(10_000) is None
+
+        store = reader.to_store()
+        assert store.round == 55 and len(store) == 300
+        assert store.group_sum("creator") == {
+            creator: sum(b.amount for b in written if b.creator == creator) for creator in {b.creator for b in written}}
+        assert store.group_count("freelancer")[None] == 300
+
+
+def test_records_are_box_prefixes(tmp_path):
+    written = bounties(V5, 3)
+    path = str(tmp_path / "bounties.snap")
+    write_snapshot(path, written, 1, 7, V5, compress=False)
+    with SnapshotReader(path) as reader:
+        records = reader.records()
+        assert records["amount"].tolist() == [0, 2_000, 4_000]
+        record = records[1].tobytes()
+        assert record[8:8 + V5.task_desc_offset] == encode_bounty(written[1])[:V5.task_desc_offset]
+        del records
+
+
+def test_empty_and_foreign_files(tmp_path):
+    path = str(tmp_path / "empty.snap")
+    write_snapshot(path, [], 9, 7)
+    with SnapshotReader(path) as reader:
+        assert len(reader) == 0 and list(reader) == [] and reader.bounty(0) is None
+        assert len(reader.to_store()) == 0
+
+    with pytest.raises(ValueError):
+        write_snapshot(path, bounties(V5, 1), 9, 7, V2)
+    (tmp_path / "other").write_bytes(b"not a snapshot" * 10)
+    with pytest.raises(SnapshotError):
+        SnapshotReader(str(tmp_path / "other"))
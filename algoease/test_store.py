@@ -0,0 +1,41 @@
+"""
+Tests for the columnar bounty store
+"""
+
+from algosdk import account
+
+from algoease.boxes import V5, Bounty
+from algoease.store import BountyStore
+
+
+def bounty(bounty_id, creator, amount, status, freelancer=None, deadline=0):
+    return Bounty(bounty_id, creator, freelancer, amount, V5.status_code(status), "", V5, deadline=deadline)
+
+
+def test_group_by_and_incremental_updates():
+    _, alice = account.generate_account()
+    _, bob = account.generate_account()
+    _, carol = account.generate_account()
+    store = BountyStore(V5, capacity=2)
+    store.extend([bounty(0, alice, 1_000, "SUBMITTED", carol, deadline=500),
+                  bounty(1, alice, 2_000, "SUBMITTED", carol),
+                  bounty(2, bob, 4_000, "SUBMITTED"),
+                  bounty(3, bob, 8_000, "OPEN", deadline=900)], round_number=10)
+
+    submitted = store.where(status="SUBMITTED")
+    assert store.group_sum("creator", mask=submitted) == {alice: 3_000, bob: 4_000}
+    assert store.group_count("freelancer") == {None: 2, carol: 2}
+    assert store.total(mask=store.where(creator=bob, min_amount=5_000)) == 8_000
+    assert store.ids(store.where(deadline_before=600)).tolist() == [0]
+    assert not store.where(creator="not seen").any()
+
+    # Chain changes: bounty 1 is approved, bounty 0's box is deleted, bounty 9 is created
+    assert store.upsert(bounty(1, alice, 2_000, "APPROVED", carol), round_number=11)
+    assert not store.upsert(bounty(1, alice, 2_000, "APPROVED", carol), round_number=12)
+    assert store.apply(0, None, 12)
+    store.upsert(bounty(9, carol, 16_000, "SUBMITTED"), round_number=12)
+
+    assert len(store) == 4 and 0 not in store and 9 in store
+    assert store.group_sum("creator", mask=store.where(status="SUBMITTED")) == {bob: 4_000, carol: 16_000}
+    assert store.group_count("status") == {"OPEN": 1, "APPROVED": 1, "SUBMITTED": 2}
+    assert store.group_sum("updated_round", value="amount") == {10: 12_000, 11: 2_000, 12: 16_000}
@@ -0,0 +1,83 @@
+"""
+Tests for the bounty push stream
+"""
+
+import asyncio
+import json
+
+from algosdk import account
+
+from algoease.boxes import V2, Bounty
+from algoease.stream import Broker, Change, Follower, StreamServer, Subscription
+from algoease.test_dashboard import APP_ID, FakeAlgod
+
+
+def change(round_number, bounty_id, creator="C", freelancer=None):
+    return Change(round_number, bounty_id, "OPEN", "ACCEPTED", creator, freelancer, 1_000)
+
+
+def test_follower_reports_changed_bounties_per_round():
+    _, creator = account.generate_account()
+    _, freelancer = account.generate_account()
+    boxes = {i: Bounty(i, creator, None, 1_000_000, 0, "task", V2) for i in range(2)}
+    follower = Follower(FakeAlgod(boxes), APP_ID)
+    follower.load()
+
+    boxes[1].freelancer, boxes[1].status = freelancer, V2.status_code("ACCEPTED")
+    assert follower.next_rounds() == [(11, [Change(11, 1, "OPEN", "ACCEPTED", creator, freelancer, 1_000_000)])]
+    # Round 12 touches bounty 1 again without changing it
+    assert follower.next_rounds() == [(12, [])]
+
+
+def test_broker_filters_and_resumes():
+    async def run():
+        broker = Broker(retain_rounds=5)
+        broker.start(100)
+        mine = Subscription(bounty_ids={1}, freelancers={"F"})
+        broker.subscribe(mine)
+        broker.publish(101, [change(101, 1), change(101, 2)])
+        broker.publish(102, [change(102, 3, freelancer="F")])
+        broker.publish(103, [change(103, 4)])
+        assert [mine.queue.get_nowait() for _ in range(mine.queue.qsize())] == [
+            (101, [change(101, 1)]), (102, [change(102, 3, freelancer="F")])]
+
+        resumed = Subscription()
+        assert broker.subscribe(resumed, since=101) == (101, True)
+        assert [resumed.queue.get_nowait()[0] for _ in range(resumed.queue.qsize())] == [102, 103]
+
+        for round_number in range(104, 108):
+            broker.publish(round_number, [])
+        assert broker.subscribe(Subscription(), since=101) == (107, False)
+        assert broker.subscribe(Subscription(), since=102) == (102, True)
+
+    asyncio.run(run())
+
+
+def test_events_endpoint_streams_rounds():
+    async def run():
+        broker = Broker()
+        broker.start(100)
+        broker.publish(101, [change(101, 1, creator="ME")])
+        server = await asyncio.start_server(StreamServer(broker).handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"GET /events?creator=ME HTTP/1.1\r\nLast-Event-ID: 100\r\n\r\n")
+        await writer.drain()
+
+        headers = await reader.readuntil(b"\r\n\r\n")
+        assert b"text/event-stream" in headers
+        assert await reader.readuntil(b"\n\n") == b"retry: 2000\n\n"
+        assert await reader.readuntil(b"\n\n") == b'id: 100\nevent: ready\ndata: {"round":100}\n\n'
+        message = (await reader.readuntil(b"\n\n")).decode().split("\n")
+        assert message[:2] == ["id: 101", "event: changes"]
+        assert [c["bounty_id"] for c in json.loads(message[2][len("data: "):])] == [1]
+
+        broker.publish(102, [change(102, 2, creator="OTHER"), change(102, 3, creator="ME")])
+        message = (await reader.readuntil(b"\n\n")).decode().split("\n")
+        assert message[0] == "id: 102" and '"bounty_id":3' in message[2]
+
+        writer.close()
+        server.close()
+        await server.wait_closed()
+
+    asyncio.run(run())
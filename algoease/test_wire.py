@@ -0,0 +1,54 @@
+"""
+Tests for msgpack reads from algod
+"""
+
+import msgpack
+import pytest
+from algosdk import error
+
+from algoease.wire import get_block, wait_for_confirmation
+
+
+class FakeAlgod:
+    """Transaction "OK" confirms at round 12; "BAD" is dropped from the pool"""
+
+    def __init__(self):
+        self.round = 10
+
+    def status(self):
+        return {"last-round": self.round}
+
+    def status_after_block(self, round_number):
+        self.round = round_number + 1
+        return {"last-round": self.round}
+
+    def pending_transaction_info(self, txid, response_format="json"):
+        assert response_format == "msgpack"
+        if txid == "BAD":
+            return msgpack.packb({"pool-error": "overspend", "txn": {"sig": b"\x00" * 64}})
+        if self.round < 12:
+            raise error.AlgodHTTPError("txn not found", 404)
+        return msgpack.packb({"confirmed-round": 12, "pool-error": "", "txn": {"sig": b"\x00" * 64}})
+
+    def block_info(self, round_number, response_format="json"):
+        # Local-state deltas are keyed by app index
+        delta = {"ld": {0: {"k": b"\xff\xfe"}}}
+        return msgpack.packb({"block": {"rnd": round_number, "txns": [{"txn": {"note": b"\x01"}, "dt": delta}]}})
+
+
+def test_bytes_and_integer_keys_survive_decoding():
+    block = get_block(FakeAlgod(), 5)
+    assert block["rnd"] == 5
+    assert block["txns"][0]["txn"]["note"] == b"\x01"
+    assert block["txns"][0]["dt"]["ld"][0]["k"] == b"\xff\xfe"
+
+
+def test_wait_for_confirmation():
+    client = FakeAlgod()
+    info = wait_for_confirmation(client, "OK", 5)
+    assert info["confirmed-round"] == 12 and info["txn"]["sig"] == b"\x00" * 64
+
+    with pytest.raises(error.TransactionRejectedError):
+        wait_for_confirmation(client, "BAD")
+    with pytest.raises(error.ConfirmationTimeoutError):
+        wait_for_confirmation(FakeAlgod(), "OK", 1)
@@ -0,0 +1,68 @@
+"""
+msgpack responses from algod.
+
+By default algod answers in JSON. JSON base64-encodes every bytes field
+(box refs in blocks, notes, logs, signatures) and leaves Python to parse
+a large text document, and blocks are the worst case for any follower.
+algod can also serve blocks, accounts and pending transactions as
+msgpack, using the same field names. These helpers request that format
+and decode it with msgpack's C extension, so bytes fields arrive as
+bytes and go to the box codec without a base64 round trip.
+
+Box values (/applications/{id}/box) are served only as JSON, so
+state.get_bounty still uses that endpoint.
+"""
+
+from typing import Any, Dict
+
+import msgpack
+from algosdk import error
+
+DEFAULT_WAIT_ROUNDS = 1000
+
+
+def unpack(data: bytes) -> Dict[str, Any]:
+    """Decode an algod msgpack response; bytes fields stay bytes"""
+    # Delta maps are keyed by app / asset index; some string fields may hold arbitrary bytes
+    return msgpack.unpackb(data, raw=False, strict_map_key=False, unicode_errors="surrogateescape")
+
+
+def get_block(client, round_number: int) -> Dict[str, Any]:
+    """The block (header and transactions) for a round"""
+    return unpack(client.block_info(round_number, response_format="msgpack"))["block"]
+
+
+def get_account(client, address: str, exclude: str = "all") -> Dict[str, Any]:
+    """account_info as msgpack; exclude="all" leaves out created apps, assets and local state"""
+    params = {"format": "msgpack"}
+    if exclude:
+        params["exclude"] = exclude
+    return unpack(client.algod_request("GET", f"/accounts/{address}", params, response_format="msgpack"))
+
+
+def get_pending_transaction(client, txid: str) -> Dict[str, Any]:
+    return unpack(client.pending_transaction_info(txid, response_format="msgpack"))
+
+
+def wait_for_confirmation(client, txid: str, wait_rounds: int = 0) -> Dict[str, Any]:
+    """transaction.wait_for_confirmation over msgpack pending-transaction reads"""
+    last_round = client.status()["last-round"]
+    wait_rounds = wait_rounds or DEFAULT_WAIT_ROUNDS
+    current_round = last_round + 1
+    while current_round <= last_round + wait_rounds:
+        try:
+            info = get_pending_transaction(client, txid)
+        except error.AlgodHTTPError:
+            # Behind a load balancer the node we ask may not have seen the transaction yet
+            info = {}
+        if info.get("pool-error"):
+            raise error.TransactionRejectedError(f"Transaction rejected: {info['pool-error']}")
+        if info.get("confirmed-round"):
+            # A failover client routes later reads to nodes that have this round (read-your-writes)
+            require_round = getattr(client, "require_round", None)
+            if require_round is not None:
+                require_round(info["confirmed-round"])
+            return info
+        client.status_after_block(current_round)
+        current_round += 1
+    raise error.ConfirmationTimeoutError(f"Wait for transaction id {txid} timed out")
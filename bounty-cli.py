@@ -3,6 +3,8 @@
 AlgoEase Bounty CLI - Test your smart contract from terminal!
 
 Features:
+- Batch mode: run operations from a JSONL file or stdin (see algoease/batch.py)
+- Live dashboard: --watch redraws status counts and transitions every round
 - Create bounty (your ALGO → escrow)
 - Accept bounty (freelancer commits)
 - Approve work (verifier approves)
@@ -13,11 +15,16 @@ Features:
 from algosdk import account, mnemonic, transaction
 from algosdk.v2client import algod
 from algosdk.transaction import wait_for_confirmation
+import argparse
 import base64
 import os
 import sys
 from datetime import datetime, timedelta
 
+from algoease.batch import DEFAULT_CHUNK_SIZE, BatchRunner
+from algoease.client import get_app_id
+from algoease.dashboard import Dashboard
+
 # Configuration
 ALGOD_ADDRESS = "https://testnet-api.algonode.cloud"
 ALGOD_TOKEN = ""
@@ -454,7 +461,41 @@ def main_menu():
     input("\nPress Enter to continue...")
     main_menu()
 
+def run_batch(args):
+    """Run JSONL operations non-interactively; results go out as JSONL"""
+    app_id = args.app_id or get_app_id()
+    runner = BatchRunner(algod_client, app_id, chunk_size=args.chunk_size, preflight=not args.no_preflight)
+    source = sys.stdin if args.batch == "-" else open(args.batch, 'r')
+    output = sys.stdout if args.output == "-" else open(args.output, 'w')
+    try:
+        counts = runner.run(source, output)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if output is not sys.stdout:
+            output.close()
+    print(f"Batch done on app {app_id}: {counts['ok']} ok, {counts['failed']} failed", file=sys.stderr)
+    return 0 if not counts['failed'] else 1
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="AlgoEase bounty CLI")
+    parser.add_argument("--batch", metavar="FILE", help="Run operations from a JSONL file ('-' for stdin)")
+    parser.add_argument("--output", default="-", help="Batch results JSONL file (default: stdout)")
+    parser.add_argument("--app-id", type=int, help="Batch / dashboard app (default: REACT_APP_CONTRACT_APP_ID)")
+    parser.add_argument("--watch", action="store_true", help="Live dashboard, updated every round")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Operations per submission pass")
+    parser.add_argument("--no-preflight", action="store_true", help="Send batch groups without simulating them first")
+    args = parser.parse_args()
+
+    if args.batch:
+        sys.exit(run_batch(args))
+    if args.watch:
+        try:
+            Dashboard(algod_client, args.app_id or get_app_id()).run()
+        except KeyboardInterrupt:
+            print("\n\n👋 Goodbye!")
+        sys.exit(0)
+
     if not CREATOR_MNEMONIC:
         print("❌ No mnemonic found in frontend/.env")
         print("Please make sure frontend/.env exists with REACT_APP_CREATOR_MNEMONIC")
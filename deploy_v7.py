@@ -0,0 +1,16 @@
+"""
+AlgoEase V7 contract deployment (V5 plus on-chain sweep of expired bounties)
+
+Thin wrapper around the shared deploy engine: an unchanged program reuses
+the app already recorded in contract-info*.json instead of creating a new one.
+
+Usage:
+    python deploy_v7.py [--network testnet --network localnet] [--force] [--dry-run]
+"""
+
+import sys
+
+from algoease.deploy import main
+
+if __name__ == "__main__":
+    sys.exit(main(["v7", *sys.argv[1:]]))
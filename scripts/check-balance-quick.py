@@ -1,22 +1,17 @@
-from algosdk.v2client import algod
+#!/usr/bin/env python3
+"""
+Quick balance check, warning when less than 0.2 ALGO is available
 
-client = algod.AlgodClient('', 'https://testnet-api.algonode.cloud')
-addr = '3AU6XYBNSEW7DRXJVNTGDAZLUYL54CTW3BUYKTBN6LX76KJ3EAVIQLPEBI'
-acc = client.account_info(addr)
+Thin wrapper around the bulk balance checker (algoease/balances.py); pass
+more addresses or app IDs to check them in the same table.
+"""
 
-balance = acc['amount'] / 1_000_000
-min_balance = acc['min-balance'] / 1_000_000
-available = balance - min_balance
-assets = len(acc.get('assets', []))
+import sys
+from pathlib import Path
 
-print(f"\n💰 Account Balance Information:")
-print(f"   Total Balance: {balance} ALGO")
-print(f"   Min Balance Required: {min_balance} ALGO")
-print(f"   Available to Spend: {available} ALGO")
-print(f"   Number of Assets: {assets}")
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-if available < 0.2:
-    print(f"\n⚠️  WARNING: Low available balance!")
-    print(f"   You need at least 0.2 ALGO available for transactions")
-    print(f"   Current available: {available} ALGO")
-    print(f"\n💡 Get testnet ALGO from: https://bank.testnet.algorand.network/")
+from algoease.balances import main
+
+if __name__ == "__main__":
+    sys.exit(main(["3AU6XYBNSEW7DRXJVNTGDAZLUYL54CTW3BUYKTBN6LX76KJ3EAVIQLPEBI", *sys.argv[1:], "--min-available", "0.2"]))
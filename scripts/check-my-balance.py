@@ -1,5 +1,17 @@
-from algosdk.v2client import algod
-client = algod.AlgodClient('', 'https://testnet-api.algonode.cloud')
-addr = '3AU6XYBNSEW7DRXJVNTGDAZLUYL54CTW3BUYKTBN6LX76KJ3EAVIQLPEBI'
-info = client.account_info(addr)
-print(f'Your balance: {info["amount"] / 1_000_000} ALGO')
+#!/usr/bin/env python3
+"""
+Print the balance of the main TestNet account
+
+Thin wrapper around the bulk balance checker (algoease/balances.py); pass
+more addresses or app IDs to check them in the same table.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from algoease.balances import main
+
+if __name__ == "__main__":
+    sys.exit(main(["3AU6XYBNSEW7DRXJVNTGDAZLUYL54CTW3BUYKTBN6LX76KJ3EAVIQLPEBI", *sys.argv[1:]]))
@@ -4,25 +4,27 @@ Deploy the fixed AlgoEase contract to TestNet
 """
 
 import json
-import base64
+import sys
+from pathlib import Path
 from algosdk import account, mnemonic
 from algosdk.v2client import algod
 from algosdk.transaction import ApplicationCreateTxn, wait_for_confirmation, StateSchema
 from algosdk import encoding
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from algoease import compile as teal_build
+
 # Configuration
 TESTNET_ALGOD = "https://testnet-api.algonode.cloud"
 CREATOR_MNEMONIC = "once few arena ice fashion birth behind famous drink report dune manual knee popular will multiply fun public kangaroo suspect nominee sail blame abstract place"
 
 def compile_teal(client, source_path):
-    """Compile TEAL source code"""
-    with open(source_path, 'r') as f:
-        teal_source = f.read()
-    
-    compile_response = client.compile(teal_source)
-    # Decode base64 to bytes
-    program_bytes = base64.b64decode(compile_response['result'])
-    return program_bytes, compile_response['hash']
+    """Compile TEAL source code (cached until the TEAL or algod version changes)"""
+    program_bytes = teal_build.compile_teal(client, source_path)
+    # Program hash, as reported by algod's compile endpoint
+    program_hash = encoding.encode_address(encoding.checksum(b"Program" + program_bytes))
+    return program_bytes, program_hash
 
 def deploy_contract():
     """Deploy the fixed contract"""
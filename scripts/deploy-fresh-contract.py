@@ -5,7 +5,12 @@ This will deploy a brand new contract with no history
 from algosdk import account, mnemonic, transaction
 from algosdk.v2client import algod
 from algosdk.logic import get_application_address
-import base64
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from algoease.compile import compile_teal
 
 # Configuration
 ALGOD_ADDRESS = "https://testnet-api.algonode.cloud"
@@ -15,11 +20,8 @@ ALGOD_TOKEN = ""
 CREATOR_MNEMONIC = "once few arena ice fashion birth behind famous drink report dune manual knee popular will multiply fun public kangaroo suspect nominee sail blame abstract place"
 
 def compile_program(client, source_file):
-    """Compile TEAL file to bytes"""
-    with open(source_file, "r") as f:
-        source_code = f.read()
-    compile_response = client.compile(source_code)
-    return base64.b64decode(compile_response["result"])
+    """Compile TEAL file to bytes (cached until the TEAL or algod version changes)"""
+    return compile_teal(client, source_file)
 
 def main():
     print("\n" + "="*70)
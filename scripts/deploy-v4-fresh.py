@@ -5,7 +5,12 @@ This will create a brand new contract with no corrupted state
 from algosdk import account, mnemonic, transaction
 from algosdk.v2client import algod
 from algosdk.logic import get_application_address
-import base64
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from algoease.compile import compile_teal
 
 # Configuration
 ALGOD_ADDRESS = "https://testnet-api.algonode.cloud"
@@ -15,9 +20,8 @@ ALGOD_TOKEN = ""
 CREATOR_MNEMONIC = "once few arena ice fashion birth behind famous drink report dune manual knee popular will multiply fun public kangaroo suspect nominee sail blame abstract place"
 
 def compile_program(client, source_code):
-    """Compile TEAL source code"""
-    compile_response = client.compile(source_code)
-    return base64.b64decode(compile_response['result'])
+    """Compile TEAL source code (cached until the TEAL or algod version changes)"""
+    return compile_teal(client, source=source_code)
 
 def deploy_contract():
     print("\n" + "="*70)
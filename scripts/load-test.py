@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+AlgoEase LocalNet Load Test
+
+Drives a mix of bounty lifecycle calls from many simulated accounts
+against a local algod and saves throughput, latency, failure-rate and
+fee numbers as JSON so runs can be compared over time.
+
+Usage:
+    algokit localnet start
+    python scripts/load-test.py --accounts 50 --duration 120 --concurrency 16
+    python scripts/load-test.py --mix create=1,accept=1,submit=1,approve=1 --baseline load-results/previous.json
+"""
+
+import argparse
+import json
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from algoease.client import LOCALNET_ALGOD_ADDRESS, LOCALNET_TOKEN, get_algod_client, get_localnet_dispenser
+from algoease.loadgen import ACTIONS, DEFAULT_MIX, LoadConfig, LoadGenerator
+
+RESULTS_DIR = "load-results"
+
+
+def parse_mix(value):
+    mix = {}
+    for part in value.split(','):
+        action, weight = part.split('=')
+        if action not in ACTIONS:
+            raise argparse.ArgumentTypeError(f"Unknown action '{action}', expected one of {', '.join(ACTIONS)}")
+        mix[action] = float(weight)
+    return mix
+
+
+def print_comparison(report, baseline_path):
+    with open(baseline_path, 'r') as f:
+        baseline = json.load(f)
+    print(f"\nCompared to {baseline_path} ({baseline.get('started_at')}):")
+    rows = [
+        ("tps", report["tps"], baseline.get("tps")),
+        ("lifecycles/s", report["lifecycles_per_s"], baseline.get("lifecycles_per_s")),
+        ("p50 ms", report["latency_ms"]["p50"], baseline.get("latency_ms", {}).get("p50")),
+        ("p95 ms", report["latency_ms"]["p95"], baseline.get("latency_ms", {}).get("p95")),
+        ("p99 ms", report["latency_ms"]["p99"], baseline.get("latency_ms", {}).get("p99")),
+        ("failure rate", report["failure_rate"], baseline.get("failure_rate")),
+    ]
+    for name, now, before in rows:
+        delta = "" if now is None or not before else f" ({(now - before) / before * 100:+.1f}%)"
+        print(f"   {name:<14} {before} -> {now}{delta}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AlgoEase LocalNet load test")
+    parser.add_argument("--algod-url", default=LOCALNET_ALGOD_ADDRESS)
+    parser.add_argument("--algod-token", default=LOCALNET_TOKEN)
+    parser.add_argument("--app-id", type=int, help="Existing V2 app (default: deploy a fresh one)")
+    parser.add_argument("--accounts", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=60.0, help="Seconds to generate load")
+    parser.add_argument("--concurrency", type=int, default=8, help="Operations in flight")
+    parser.add_argument("--mix", type=parse_mix, default=dict(DEFAULT_MIX),
+                        help="Action weights, e.g. create=3,accept=3,submit=3,approve=2,reject=1")
+    parser.add_argument("--amount", type=int, default=100_000, help="microAlgos per bounty")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--output", help=f"Results file (default: {RESULTS_DIR}/<timestamp>.json)")
+    parser.add_argument("--baseline", help="Earlier results file to compare against")
+    args = parser.parse_args()
+
+    client = get_algod_client(args.algod_url, args.algod_token)
+    config = LoadConfig(accounts=args.accounts, duration=args.duration, concurrency=args.concurrency,
+                        mix=args.mix, amount=args.amount, app_id=args.app_id, seed=args.seed)
+
+    print("\n" + "=" * 70)
+    print("ALGOEASE LOAD TEST")
+    print("=" * 70)
+    print(f"Algod:        {args.algod_url}")
+    print(f"Accounts:     {config.accounts}")
+    print(f"Concurrency:  {config.concurrency}")
+    print(f"Duration:     {config.duration}s")
+    print(f"Mix:          {config.mix}")
+
+    generator = LoadGenerator(client, config, get_localnet_dispenser(client))
+    print("\n[*] Deploying and funding accounts...")
+    generator.setup()
+    print(f"   [OK] App ID: {generator.app_id}")
+
+    print("[*] Generating load...")
+    report = generator.run()
+
+    print("\n" + "=" * 70)
+    print(f"Operations:   {report['operations']}")
+    print(f"TPS:          {report['tps']} txn/s ({report['lifecycles_per_s']} lifecycles/s)")
+    print(f"Latency:      p50 {report['latency_ms']['p50']} ms | p95 {report['latency_ms']['p95']} ms"
+          f" | p99 {report['latency_ms']['p99']} ms")
+    print(f"Failure rate: {report['failure_rate'] * 100:.2f}%")
+    print(f"Fees:         {report['fees_microalgos'] / 1_000_000} ALGO")
+    for action, stats in report["actions"].items():
+        print(f"   {action:<8} {stats['confirmed']}/{stats['attempted']} ok, p95 {stats['latency_ms']['p95']} ms")
+    print("=" * 70)
+
+    output = args.output or os.path.join(RESULTS_DIR, datetime.now().strftime("%Y%m%d-%H%M%S") + ".json")
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults saved to {output}")
+
+    if args.baseline:
+        print_comparison(report, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
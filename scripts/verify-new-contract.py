@@ -21,7 +21,7 @@ try:
     
     # Get contract balance
     try:
-        account_info = client.account_info(app_address)
+        account_info = client.account_info(app_address, exclude="all")
         balance = account_info['amount'] / 1_000_000
         min_balance = account_info.get('min-balance', 0) / 1_000_000
         print(f"💰 Contract Balance: {balance} ALGO")
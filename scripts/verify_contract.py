@@ -56,7 +56,7 @@ def verify_contract():
         
         # Check if contract address has balance
         try:
-            account_info = algod_client.account_info(app_address)
+            account_info = algod_client.account_info(app_address, exclude="all")
             balance = account_info.get('amount', 0) / 1000000
             min_balance = account_info.get('min-balance', 0) / 1000000
             print(f"\nContract Account:")